@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Dados do dashboard em arquivos JSON separados (modo --assets do gerador).
+
+No modo padrão o index.html leva tudo embutido: escala, ramais, mapeamento e
+profissionais — ~270 KB baixados de novo a cada atualização, mesmo quando só a
+escala mudou. No modo --assets a página vira uma casca que busca, em paralelo:
+
+- escala.json            a escala da janela (muda todo dia; nome fixo,
+                         revalidado a cada carga com cache: 'no-cache');
+- assets/<nome>.<hash>.json
+                         as tabelas que mudam pouco (ramais, mapeamento,
+                         profissionais), com o hash do conteúdo no nome — o
+                         arquivo de um nome nunca muda, então pode ficar em
+                         cache indefinidamente.
+
+Enquanto código e tabelas não mudam, o index.html sai idêntico e a atualização
+diária se resume ao escala.json.
+"""
+
+import hashlib
+import json
+import os
+import re
+from datetime import date, timedelta
+from pathlib import Path
+
+PASTA_ASSETS = 'assets'
+ARQUIVO_ESCALA = 'escala.json'
+# Assets que saíram do build continuam servidos por um tempo: uma casca antiga
+# ainda em cache pode pedi-los
+MANTER_ANTIGOS_DIAS = 7
+ARQUIVO_USADOS = 'usados.json'
+
+
+def serializar(dados):
+    return json.dumps(dados, ensure_ascii=False, separators=(',', ':'))
+
+
+def hash_conteudo(texto, tamanho=10):
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()[:tamanho]
+
+
+def preparar_assets(escala, tabelas):
+    """({caminho relativo: texto}, manifesto) dos arquivos a publicar.
+    `tabelas`: {nome: dados} das tabelas que mudam pouco. O manifesto
+    ({'escala': url, 'tabelas': [{'nome', 'url'}]}) vai embutido na página."""
+    arquivos = {ARQUIVO_ESCALA: serializar(escala)}
+    manifesto = {'escala': ARQUIVO_ESCALA, 'tabelas': []}
+    for nome, dados in tabelas.items():
+        texto = serializar(dados)
+        caminho = f"{PASTA_ASSETS}/{nome}.{hash_conteudo(texto)}.json"
+        arquivos[caminho] = texto
+        manifesto['tabelas'].append({'nome': nome, 'url': caminho})
+    return arquivos, manifesto
+
+
+def gravar_assets(arquivos, pasta_saida, manter_dias=MANTER_ANTIGOS_DIAS, hoje=None):
+    """Grava os arquivos em `pasta_saida` e apaga de assets/ os que saíram do
+    build há mais de `manter_dias`. O dia em que cada asset esteve num build
+    pela última vez fica em assets/usados.json (o mtime não serve: o checkout
+    do git renova todos). Devolve os nomes apagados."""
+    pasta_saida = Path(pasta_saida)
+    hoje = (hoje or date.today()).isoformat()
+    for relativo, texto in arquivos.items():
+        destino = pasta_saida / relativo
+        if destino.parent.name == PASTA_ASSETS and destino.exists():
+            continue  # nome com hash: mesmo nome, mesmo conteúdo
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        temporario = destino.with_name(f"{destino.name}.tmp")
+        temporario.write_text(texto, encoding='utf-8')
+        os.replace(temporario, destino)
+
+    pasta_assets = pasta_saida / PASTA_ASSETS
+    registro = pasta_assets / ARQUIVO_USADOS
+    try:
+        usados = json.loads(registro.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        usados = {}
+    em_uso = {Path(r).name for r in arquivos if Path(r).parent.name == PASTA_ASSETS}
+    limite = (date.fromisoformat(hoje) - timedelta(days=manter_dias)).isoformat()
+    apagados = []
+    for caminho in sorted(pasta_assets.glob('*.json')):
+        nome = caminho.name
+        if nome == ARQUIVO_USADOS:
+            continue
+        if nome in em_uso:
+            usados[nome] = hoje
+        elif usados.setdefault(nome, hoje) < limite:
+            caminho.unlink()
+            del usados[nome]
+            apagados.append(nome)
+    usados = {nome: quando for nome, quando in sorted(usados.items()) if (pasta_assets / nome).exists()}
+    if usados:
+        registro.write_text(json.dumps(usados, indent=2) + '\n', encoding='utf-8')
+    return apagados
+
+
+def _kb(texto_ou_bytes):
+    n = texto_ou_bytes if isinstance(texto_ou_bytes, int) else len(texto_ou_bytes.encode('utf-8'))
+    return f"{n / 1024:7.1f} KB"
+
+
+def relatorio_tamanhos(html, blocos, embutidos=True):
+    """Relatório impresso no build: peso do HTML e de cada bloco de dados.
+    `blocos`: {nome: texto serializado}; `embutidos` diz se estão dentro do
+    HTML (modo padrão) ou em arquivos à parte (--assets)."""
+    total = len(html.encode('utf-8'))
+    css = sum(len(t.encode('utf-8')) for t in re.findall(r'<style[^>]*>(.*?)</style>', html, re.S))
+    js = sum(len(t.encode('utf-8')) for t in re.findall(r'<script[^>]*>(.*?)</script>', html, re.S))
+    tamanhos = sorted(((len(t.encode('utf-8')), nome) for nome, t in blocos.items()), reverse=True)
+    dados = sum(n for n, _ in tamanhos) if embutidos else 0
+
+    linhas = [f"📦 Página: {_kb(total).strip()}"]
+    partes = [(n, f"dados: {nome}") for n, nome in tamanhos] if embutidos else []
+    partes += [(css, "CSS"), (js - dados, "JS (código)"), (total - css - js, "HTML (marcação)")]
+    for n, nome in partes:
+        linhas.append(f"   {nome:<28}{_kb(n)}  {n / total:4.0%}" if total else f"   {nome:<28}{_kb(n)}")
+    if not embutidos:
+        linhas.append(f"📦 Arquivos de dados: {_kb(sum(n for n, _ in tamanhos)).strip()}")
+        linhas.extend(f"   {nome:<44}{_kb(n)}" for n, nome in tamanhos)
+    return "\n".join(linhas)
+
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Assinatura (hash) do conteúdo que o dashboard mostra.
+
+Quatro disparos por dia regeneravam e commitavam o index.html mesmo quando a
+escala não tinha mudado — só o VERSAO_GERACAO e a hora da atualização eram
+diferentes. A assinatura cobre só o que muda o que o usuário vê:
+
+- os registros de atual/anterior/seguinte (sem pos_x, que é coordenada de
+  layout do site), em ordem canônica, com a data de cada bloco;
+- a data (não a hora) e o status da atualização, que alimentam o selo de frescor;
+- ramais e mapeamento de setores embutidos no JSON;
+- os bytes de profissionais_autenticacao.json (telefones dos cards), que o
+  gerador lê do disco e não vêm no JSON da extração;
+- as opções de build (--assets, --producao), que mudam a forma da página;
+- o código do gerador (gerar_dashboard_executivo.py, os módulos que ele usa
+  para montar a página e os modelos de templates/), para que uma mudança de
+  layout sempre regenere.
+
+A última assinatura gerada fica em data/ultima_geracao.json.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+ARQUIVO_ASSINATURA = BASE_DIR / 'data' / 'ultima_geracao.json'
+FONTES_GERADOR = ('gerar_dashboard_executivo.py', 'dashboard_logic.py', 'modelos.py',
+                  'assets_estaticos.py', 'service_worker.py', 'minificacao.py',
+                  'pre_renderizacao.py')
+PASTA_MODELOS = 'templates'
+DADOS_GERADOR = ('profissionais_autenticacao.json',)
+OPCOES_BUILD = ('--assets', '--producao')
+
+CAMPOS_IGNORADOS = ('pos_x',)
+
+
+def _bloco_canonico(bloco):
+    if not bloco:
+        return None
+    registros = [
+        {k: v for k, v in r.items() if k not in CAMPOS_IGNORADOS}
+        for r in bloco.get('registros', [])
+    ]
+    registros.sort(key=lambda r: json.dumps(r, sort_keys=True, ensure_ascii=False))
+    return {'data': bloco.get('data'), 'registros': registros}
+
+
+def _hash_fontes(base_dir=BASE_DIR):
+    h = hashlib.sha256()
+    modelos = sorted((Path(base_dir) / PASTA_MODELOS).glob('*'))
+    for caminho in [Path(base_dir) / nome for nome in FONTES_GERADOR] + modelos:
+        if caminho.is_file():
+            h.update(caminho.relative_to(base_dir).as_posix().encode())
+            h.update(caminho.read_bytes())
+    return h.hexdigest()
+
+
+def _hash_dados(base_dir=BASE_DIR):
+    h = hashlib.sha256()
+    for nome in DADOS_GERADOR:
+        caminho = Path(base_dir) / nome
+        h.update(nome.encode())
+        h.update(caminho.read_bytes() if caminho.is_file() else b'\0')
+    return h.hexdigest()
+
+
+def assinatura(escala, base_dir=BASE_DIR, opcoes=()):
+    """sha256 hex do conteúdo visível de um JSON de extração. `opcoes`: a
+    linha de comando repassada ao gerador (só OPCOES_BUILD contam)."""
+    canonico = {
+        'dias': {chave: _bloco_canonico(escala.get(chave)) for chave in ('anterior', 'atual', 'seguinte')},
+        'data_atualizacao': escala.get('data_atualizacao'),
+        'status_atualizacao': escala.get('status_atualizacao'),
+        'ramais_hro': escala.get('ramais_hro'),
+        'setor_ramais_mapping': escala.get('setor_ramais_mapping'),
+        'gerador': _hash_fontes(base_dir),
+        'dados': _hash_dados(base_dir),
+        'opcoes': sorted(set(opcoes) & set(OPCOES_BUILD)),
+    }
+    texto = json.dumps(canonico, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+def ler_assinatura_salva(caminho=ARQUIVO_ASSINATURA):
+    try:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            return json.load(f).get('assinatura')
+    except (OSError, ValueError):
+        return None
+
+
+def salvar_assinatura(valor, caminho=ARQUIVO_ASSINATURA):
+    caminho = Path(caminho)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump({
+            'assinatura': valor,
+            'gerado_em': datetime.now(timezone(timedelta(hours=-3))).strftime('%d/%m/%Y %H:%M'),
+        }, f, ensure_ascii=False, indent=2)
+        f.write('\n')
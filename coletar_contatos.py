@@ -3,8 +3,8 @@
 PENTE-FINO de contatos — varre vários dias da escala (com o filtro de contato
 ligado) acumulando contatos únicos e faz merge em profissionais_autenticacao.json.
 
-- Reaproveita ExtractorInteligente (login, iframe, filtro de contato, extrair_dia).
-- Navega para o próximo dia clicando na seta ">" do cabeçalho de data.
+- Reaproveita ExtractorInteligente.extrair_intervalo (login, iframe, filtro de
+  contato e navegação dia a dia numa única sessão).
 - Merge: preenche telefone/email de quem falta e cadastra profissionais novos.
   NUNCA sobrescreve um telefone já existente na base.
 
@@ -15,13 +15,10 @@ Uso:
 import os
 import sys
 import json
-import time
 import unicodedata
-from datetime import datetime
 
 os.environ.setdefault('ESCALA_BROWSER', 'safari')
 
-from selenium.webdriver.common.by import By
 from extracao_inteligente import ExtractorInteligente, corrigir_portugues
 
 BASE = os.path.dirname(os.path.abspath(__file__))
@@ -38,36 +35,6 @@ def last4(phone):
     return digs[-4:] if len(digs) >= 4 else ''
 
 
-def navegar_proximo_dia(driver):
-    """Clica na seta '>' do cabeçalho de data. Retorna a data textual após clicar."""
-    antes = driver.execute_script(r"""
-      for(var e of document.querySelectorAll('*')){
-        if(e.childElementCount===0){var t=(e.textContent||'').trim();
-          if(/^\d{1,2}\s+[A-Za-zçÇ]+\s+\d{4}$/.test(t)) return t;}
-      }
-      return null;
-    """)
-    # clica no elemento '>' mais próximo do texto da data
-    driver.execute_script(r"""
-      var cands=[];
-      for(var e of document.querySelectorAll('button,span,div,i,svg,a')){
-        var t=(e.textContent||'').trim();
-        var aria=(e.getAttribute('aria-label')||'');
-        if(t==='>'||/next|forward|chevron.?right|arrow.?right|proxim/i.test(aria)){ cands.push(e); }
-      }
-      if(cands.length){ cands[cands.length-1].click(); }
-    """)
-    time.sleep(4)
-    depois = driver.execute_script(r"""
-      for(var e of document.querySelectorAll('*')){
-        if(e.childElementCount===0){var t=(e.textContent||'').trim();
-          if(/^\d{1,2}\s+[A-Za-zçÇ]+\s+\d{4}$/.test(t)) return t;}
-      }
-      return null;
-    """)
-    return antes, depois
-
-
 def main():
     num_dias = 14
     dry_run = '--dry-run' in sys.argv
@@ -82,46 +49,33 @@ def main():
     extractor = ExtractorInteligente(headless=False)
     contatos = {}  # norm -> {name, phone, email, setor}
     try:
-        extractor.login()
-        extractor.driver.get("https://escala.med.br/painel/#!/day_grid")
-        time.sleep(5)
-        frames = extractor.driver.find_elements(By.TAG_NAME, "iframe")
-        if frames:
-            extractor.driver.switch_to.frame(frames[0])
-
-        extractor.ativar_filtro_contato()
-
-        for dia in range(num_dias):
-            res = extractor.extrair_dia()
-            regs = res.get('registros', [])
-            novos_no_dia = 0
-            for r in regs:
-                k = norm(r.get('profissional'))
-                if not k:
-                    continue
-                if k not in contatos:
-                    contatos[k] = {
-                        'name': (r.get('profissional') or '').strip(),
-                        'phone': r.get('phone', ''),
-                        'email': r.get('email', ''),
-                        'setor': corrigir_portugues(r.get('setor', '')),
-                    }
-                    novos_no_dia += 1
-                else:
-                    if not contatos[k]['phone'] and r.get('phone'):
-                        contatos[k]['phone'] = r['phone']
-                    if not contatos[k]['email'] and r.get('email'):
-                        contatos[k]['email'] = r['email']
-            print(f"  📅 {res.get('data','?'):<22} | {len(regs):3d} reg | +{novos_no_dia} pessoas novas (total únicos: {len(contatos)})")
-
-            if dia < num_dias - 1:
-                antes, depois = navegar_proximo_dia(extractor.driver)
-                if antes == depois:
-                    print(f"  ⚠️  Navegação não avançou ({depois}); encerrando varredura.")
-                    break
+        extractor.entrar()
+        dias = extractor.extrair_intervalo(num_dias)
     finally:
         extractor.close()
 
+    for res in dias:
+        regs = res.get('registros', [])
+        novos_no_dia = 0
+        for r in regs:
+            k = norm(r.get('profissional'))
+            if not k:
+                continue
+            if k not in contatos:
+                contatos[k] = {
+                    'name': (r.get('profissional') or '').strip(),
+                    'phone': r.get('phone', ''),
+                    'email': r.get('email', ''),
+                    'setor': corrigir_portugues(r.get('setor', '')),
+                }
+                novos_no_dia += 1
+            else:
+                if not contatos[k]['phone'] and r.get('phone'):
+                    contatos[k]['phone'] = r['phone']
+                if not contatos[k]['email'] and r.get('email'):
+                    contatos[k]['email'] = r['email']
+        print(f"  📅 {res.get('data','?'):<22} | {len(regs):3d} reg | +{novos_no_dia} pessoas novas (total únicos: {len(contatos)})")
+
     # ===== VALIDAÇÃO DE CONFIANÇA =====
     # O site às vezes faz um card herdar o contato de um vizinho na mesma coluna
     # (mesmo telefone/email aparece em 2 pessoas diferentes). Esses são ambíguos:
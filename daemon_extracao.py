@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Extrator RESIDENTE para o runner próprio.
+
+Cada disparo do workflow subia Python + Chrome + chromedriver do zero e fazia
+login antes de extrair. Em modo daemon o navegador fica aberto e logado, e a
+extração vira uma requisição HTTP local:
+
+    GET /snapshot   extrai atual + seguinte agora e devolve o mesmo
+                    {'atual', 'seguinte', 'anterior'} de extrair_inteligente()
+    GET /saude      estado do daemon (sem tocar no navegador)
+
+A grade do dia (iframe + filtro de contato) é aberta uma vez; os pedidos
+seguintes só a trazem de volta a hoje e releem (extrair_inteligente com
+abrir=False), sem recarregar a página nem refazer o filtro.
+
+Só escuta em loopback (127.0.0.x ou localhost): criar_servidor() recusa
+outro host em ESCALA_DAEMON_URL. As requisições são atendidas uma por vez (há um único
+navegador). Se a sessão cair no meio do caminho, o daemon entra de novo e
+repete a extração uma vez; se o próprio navegador morrer, ele é recriado.
+
+Uso (no VPS, como serviço — ver docs/RUNNER_BRASILEIRO.md):
+    python3 extracao_inteligente.py --daemon
+
+O cliente é extrair_resultados(): com ESCALA_DAEMON_URL definido ele pede o
+snapshot ao daemon e só sobe um navegador próprio se o daemon não responder.
+"""
+
+import ipaddress
+import json
+import os
+import signal
+import threading
+import time
+import urllib.request
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlsplit
+
+URL_PADRAO = 'http://127.0.0.1:8765'
+
+
+class DaemonExtracao:
+    def __init__(self, fabrica):
+        """`fabrica()` devolve um extrator novo, ainda sem login."""
+        self.fabrica = fabrica
+        self.extractor = None
+        self.grade_aberta = False  # grade já aberta e filtrada no extractor
+        self.trava = threading.Lock()
+        self.iniciado_em = time.time()
+        self.extracoes = 0
+        self.falhas = 0
+        self.ultima = None  # (quando, segundos, total de registros do dia atual)
+
+    def _aquecer(self):
+        if self.extractor is None:
+            print(f"[{datetime.now()}] 🔥 Subindo navegador residente...")
+            self.extractor = self.fabrica()
+            self.extractor.entrar()
+
+    def _descartar(self):
+        if self.extractor is not None:
+            try:
+                self.extractor.close()
+            except Exception:
+                pass
+            self.extractor = None
+            self.grade_aberta = False
+
+    def snapshot(self):
+        """Extração fresca: relê a grade aberta (a troca de dia refaz a busca
+        do SPA), então reflete o site agora."""
+        with self.trava:
+            inicio = time.monotonic()
+            for tentativa in (1, 2):
+                try:
+                    self._aquecer()
+                    resultados = self.extractor.extrair_inteligente(abrir=not self.grade_aberta)
+                    self.grade_aberta = True
+                    if resultados['atual']['total'] > 0 or tentativa == 2:
+                        break
+                    print("⚠️  Grade vazia; a sessão pode ter caído. Entrando de novo...")
+                    self.grade_aberta = False  # entrar() sai da grade
+                    self.extractor.entrar()
+                except Exception as e:
+                    print(f"⚠️  Extração falhou ({type(e).__name__}: {e}); recriando o navegador...")
+                    self._descartar()
+                    if tentativa == 2:
+                        self.falhas += 1
+                        raise
+            segundos = time.monotonic() - inicio
+            self.extracoes += 1
+            self.ultima = (datetime.now().isoformat(timespec='seconds'), round(segundos, 1),
+                           resultados['atual']['total'])
+            print(f"[{datetime.now()}] ✅ Snapshot servido em {segundos:.1f}s")
+            return resultados
+
+    def saude(self):
+        return {
+            'ok': True,
+            'navegador_aberto': self.extractor is not None,
+            'no_ar_ha_s': round(time.time() - self.iniciado_em),
+            'extracoes': self.extracoes,
+            'falhas': self.falhas,
+            'ultima': self.ultima,
+        }
+
+    def close(self):
+        with self.trava:
+            self._descartar()
+
+
+def _handler(daemon):
+    class Handler(BaseHTTPRequestHandler):
+        def _responder(self, status, corpo):
+            dados = json.dumps(corpo, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(dados)))
+            self.end_headers()
+            self.wfile.write(dados)
+
+        def do_GET(self):
+            caminho = urlsplit(self.path).path
+            if caminho == '/saude':
+                self._responder(200, daemon.saude())
+            elif caminho == '/snapshot':
+                try:
+                    self._responder(200, daemon.snapshot())
+                except Exception as e:
+                    self._responder(503, {'erro': f"{type(e).__name__}: {e}"})
+            else:
+                self._responder(404, {'erro': 'rota desconhecida'})
+
+        def log_message(self, formato, *args):
+            print(f"[{datetime.now()}] 🌐 {self.address_string()} {formato % args}")
+
+    return Handler
+
+
+def _loopback(host):
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.IPv4Address(host).is_loopback  # HTTPServer é só IPv4
+    except ValueError:
+        return False
+
+
+def criar_servidor(daemon, url=None):
+    """Servidor HTTP do daemon no host/porta da URL. Levanta ValueError se o
+    host não for loopback: o daemon não tem autenticação."""
+    partes = urlsplit(url or os.getenv('ESCALA_DAEMON_URL') or URL_PADRAO)
+    host = partes.hostname or '127.0.0.1'
+    if not _loopback(host):
+        raise ValueError(f"Daemon só escuta em loopback, não em {host!r} (ESCALA_DAEMON_URL)")
+    return HTTPServer((host, partes.port or 8765), _handler(daemon))
+
+
+def _sigterm(signum, frame):
+    raise KeyboardInterrupt
+
+
+def servir(url=None, fabrica=None):
+    """Sobe o daemon (com o extrator de verdade, se `fabrica` não vier) e
+    atende até Ctrl+C/SIGTERM. O SIGTERM do `systemctl stop` vira
+    KeyboardInterrupt, para que o navegador seja fechado no finally — sem isso
+    Chrome e chromedriver ficavam órfãos a cada parada."""
+    if fabrica is None:
+        from extracao_inteligente import ExtractorInteligente
+        fabrica = lambda: ExtractorInteligente(headless=True)
+
+    daemon = DaemonExtracao(fabrica)
+    servidor = criar_servidor(daemon, url)
+    host, porta = servidor.server_address[:2]
+    signal.signal(signal.SIGTERM, _sigterm)
+    try:
+        try:
+            daemon._aquecer()  # já deixa logado antes do primeiro pedido
+        except Exception as e:
+            print(f"⚠️  Aquecimento falhou ({type(e).__name__}: {e}); tenta de novo no primeiro pedido")
+            daemon._descartar()
+        print(f"🟢 Daemon de extração ouvindo em http://{host}:{porta} (/snapshot, /saude)", flush=True)
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        daemon.close()
+        print("🔴 Daemon encerrado")
+
+
+def pedir_snapshot(url=None, timeout=300):
+    """Pede um snapshot ao daemon. Levanta exceção se ele não responder."""
+    url = (url or os.getenv('ESCALA_DAEMON_URL') or URL_PADRAO).rstrip('/')
+    with urllib.request.urlopen(f"{url}/snapshot", timeout=timeout) as resposta:
+        return json.loads(resposta.read().decode('utf-8'))
+
+
+if __name__ == '__main__':
+    servir()
@@ -7,11 +7,82 @@ sem gerar HTML. Nenhuma função aqui tem efeito colateral além de prints.
 """
 
 import json
+import re
+import unicodedata
+from functools import lru_cache
 from pathlib import Path
 
 BASE_DIR = Path(__file__).parent
 
 
+# ---- Classificação de turnos ----
+#
+# As regras abaixo são as mesmas da versão em cadeia de ifs (congelada em
+# tests/classificador_legado.py e conferida registro a registro contra todo o
+# data/historico/ no teste de equivalência), só que:
+# - o horário é analisado UMA vez (o legado repetia split("/") até 5 vezes);
+# - cada lista de palavras-chave virou uma regex compilada;
+# - o resultado é memorizado por (turno, horário) — a escala inteira tem só
+#   algumas dezenas de combinações distintas.
+
+
+def _regex_palavras(*palavras):
+    """Equivale a any(p in texto for p in palavras), numa única busca."""
+    return re.compile('|'.join(re.escape(p) for p in palavras)).search
+
+
+# Listas "estritas" (sobreaviso / final de semana) e "amplas" (regra geral):
+# a ampla de matutino inclui 'matutina' e 'madrugada', a estrita não.
+_MATUTINO_ESTRITO = _regex_palavras('matutino', 'manhã', '07:00', '08:00', '06:00')
+_MATUTINO = _regex_palavras('matutino', 'matutina', 'manhã', 'madrugada', '07:00', '08:00', '06:00')
+_VESPERTINO = _regex_palavras('vespertino', 'vespertina', 'tarde', '13:00', '14:00')
+_NOTURNO = _regex_palavras('noturno', 'noturna', 'noite', '19:00')
+_SOBREAVISO = _regex_palavras('sobreaviso', 'sobre aviso')
+_FINAL_DE_SEMANA = _regex_palavras('final', 'finais', 'fim de semana', 'fds')
+_PLANTAO = _regex_palavras('plantão', 'plantao')
+_ABREVIACOES = frozenset(('p1', 'p2', 'p3', 'p4', 'dia', 'noite'))
+
+
+def _hora(parte):
+    """Hora de "HH:MM" com a mesma semântica do int() do legado (aceita
+    espaços, sinal etc.); None se não for número."""
+    try:
+        return int(parte.split(":")[0])
+    except ValueError:
+        return None
+
+
+def _analisar_horario(horario):
+    """(entrada == saída?, hora de entrada, hora de saída) de "HH:MM/HH:MM",
+    ou None se não houver exatamente uma barra."""
+    if not horario or "/" not in horario:
+        return None
+    partes = horario.split("/")
+    if len(partes) != 2:
+        return None
+    entrada, saida = partes
+    return entrada.strip() == saida.strip(), _hora(entrada), _hora(saida)
+
+
+def _periodo_por_hora(hora):
+    if 6 <= hora < 12:
+        return "matutino"
+    if 12 <= hora < 18:
+        return "vespertino"
+    return "noturno"
+
+
+def _periodo_por_palavra(turno, matutino=_MATUTINO_ESTRITO):
+    if matutino(turno):
+        return "matutino"
+    if _VESPERTINO(turno):
+        return "vespertino"
+    if _NOTURNO(turno):
+        return "noturno"
+    return None
+
+
+@lru_cache(maxsize=4096)
 def obter_tipo_turno(turno_text, horario_text=""):
     """Identifica o tipo de turno para aplicar cor correta com detecção hierárquica
 
@@ -28,199 +99,89 @@ def obter_tipo_turno(turno_text, horario_text=""):
         return "outro"
 
     turno = turno_text.lower()
-    horario = horario_text.lower() if horario_text else ""
-
-    # PRIORIDADE 1: Detecta NOTURNO por horário ANTES de 24H
-    # Importante porque 19:00/00:00 é noturno, não 24h
-    if horario and "/" in horario:
-        try:
-            entrada, saida = horario.split("/")
-            entrada_h = int(entrada.split(":")[0])
-            saida_h = int(saida.split(":")[0])
-
-            # Noturno: entrada >= 19 (19:00 até 06:00 ou 00:00)
-            # Exemplos: 19:00/00:00, 19:00/07:00, 20:00/06:00, 18:30/07:30
-            if entrada_h >= 18:
-                return "noturno"
-        except:
-            pass
-
-    # PRIORIDADE 2: Detecta 24H (entrada = saída ou diferença grande)
-    # Exemplos: "24:00/08:00", "07:00/07:00", "13:00/13:00" (on-call que dura o dia inteiro)
-    if horario and "/" in horario:
-        try:
-            entrada, saida = horario.split("/")
-            entrada = entrada.strip()
-            saida = saida.strip()
-
-            # Se entrada == saída, é plantão de 24h
-            if entrada == saida:
-                return "badge-24h"
-
-            # Se está explícito como sobreaviso, marca como 24h
-            if 'sobreaviso' in turno or '24h' in turno:
-                return "badge-24h"
-
-            # Detecta Diurno (07:00-19:00) - típico de residência
-            try:
-                entrada_h = int(entrada.split(":")[0])
-                saida_h = int(saida.split(":")[0])
-                # Se é 07:00/19:00, é diurno
-                if entrada_h == 7 and saida_h == 19:
-                    return "diurno"
-            except:
-                pass
-        except:
-            pass
-
-    # PRIORIDADE 3: Detecta SOBREAVISO + FIM DE SEMANA (se entrada != saída, é só sobreaviso, não 24h)
-    # Exemplos: "Ultrassonografia - Sobreaviso Final de Semana" com horário real
-    if 'sobreaviso' in turno or 'sobre aviso' in turno:
-        # Se tem horário e entrada == saída, já foi detectado como 24h acima
-        # Se não, é sobreaviso normal com fim de semana como contexto
-        # Mas detectar o período se disponível
-        if any(x in turno for x in ['matutino', 'manhã', '07:00', '08:00', '06:00']):
-            return "matutino"
-        elif any(x in turno for x in ['vespertino', 'vespertina', 'tarde', '13:00', '14:00']):
-            return "vespertino"
-        elif any(x in turno for x in ['noturno', 'noturna', 'noite', '19:00']):
-            return "noturno"
-        # Sobreaviso sem período específico
-        if horario and "/" in horario:
-            try:
-                entrada, saida = horario.split("/")
-                entrada_h = int(entrada.split(":")[0])
-                if entrada_h >= 6 and entrada_h < 12:
-                    return "matutino"
-                elif entrada_h >= 12 and entrada_h < 18:
-                    return "vespertino"
-                elif entrada_h >= 18 or entrada_h < 6:
-                    return "noturno"
-            except:
-                pass
-        return "sobreaviso"
-
-    # PRIORIDADE 4: Detecta FINAL DE SEMANA (sem sobreaviso)
-    # "Rotina Vespertino - Final de Semana" → vespertino (não cria badge própria)
-    if 'final' in turno or 'finais' in turno or 'fim de semana' in turno or 'fds' in turno:
-        # Se for final de semana, retorna o período específico
-        if any(x in turno for x in ['matutino', 'manhã', '07:00', '08:00', '06:00']):
-            return "matutino"
-        elif any(x in turno for x in ['vespertino', 'vespertina', 'tarde', '13:00', '14:00']):
-            return "vespertino"
-        elif any(x in turno for x in ['noturno', 'noturna', 'noite', '19:00']):
-            return "noturno"
-
-        # Se não tem período explícito, detecta pelo horário
-        if horario and "/" in horario:
-            try:
-                entrada, saida = horario.split("/")
-                entrada_h = int(entrada.split(":")[0])
-                # Matutino (6:00-13:00)
-                if entrada_h >= 6 and entrada_h < 12:
-                    return "matutino"
-                # Vespertino (13:00-19:00)
-                elif entrada_h >= 12 and entrada_h < 18:
-                    return "vespertino"
-                # Noturno (19:00-06:00)
-                elif entrada_h >= 18 or entrada_h < 6:
-                    return "noturno"
-            except:
-                pass
-
-        # Se é rotina sem período específico
-        if 'rotina' in turno:
-            return "rotina"
-        # Fallback
-        return "outro"
-
-    # PRIORIDADE 5: Detecta turnos específicos por horário/nome
-    # Detecta por abreviações (P1, P2, P3, P4, DIA, NOITE) + horário
-    if turno in ['p1', 'p2', 'p3', 'p4', 'dia', 'noite'] or (len(turno) <= 3 and turno.isalnum()):
-        # P1, P2, P3 geralmente são matutino/vespertino, P4 é noturno
-        if horario and "/" in horario:
-            try:
-                entrada, saida = horario.split("/")
-                entrada_h = int(entrada.split(":")[0])
-                saida_h = int(saida.split(":")[0])
-
-                # Matutino (6:00-13:00)
-                if entrada_h >= 6 and entrada_h < 12:
-                    return "matutino"
-                # Vespertino (13:00-19:00)
-                elif entrada_h >= 12 and entrada_h < 18:
-                    return "vespertino"
-                # Noturno (19:00-06:00)
-                elif entrada_h >= 18 or entrada_h < 6:
-                    return "noturno"
-            except:
-                pass
-
-    # Matutino (Verde)
-    if any(x in turno for x in ['matutino', 'matutina', 'manhã', 'madrugada', '07:00', '08:00', '06:00']):
-        return "matutino"
-
-    # Vespertino (Laranja)
-    if any(x in turno for x in ['vespertino', 'vespertina', 'tarde', '13:00', '14:00']):
-        return "vespertino"
+    horario = _analisar_horario(horario_text.lower() if horario_text else "")
+    iguais, entrada_h, saida_h = horario or (False, None, None)
+    # A maioria das regras do legado só valia quando as DUAS horas eram números
+    horas_ok = entrada_h is not None and saida_h is not None
 
-    # Noturno (Azul Escuro)
-    if any(x in turno for x in ['noturno', 'noturna', 'noite', '19:00']):
+    # PRIORIDADE 1: NOTURNO por horário antes de 24H (19:00/00:00 é noturno)
+    if horas_ok and entrada_h >= 18:
         return "noturno"
 
-    # Plantão (Coral)
-    if 'plantão' in turno or 'plantao' in turno:
-        if 'noturno' in turno or 'noite' in turno or '19:00' in turno:
-            return "noturno"
-        elif 'vespertino' in turno or 'tarde' in turno or '13:00' in turno:
-            return "vespertino"
-        elif 'matutino' in turno or 'manhã' in turno or '07:00' in turno:
-            return "matutino"
+    # PRIORIDADE 2: 24H (entrada = saída, ou sobreaviso/24h explícito) e DIURNO 07/19
+    if horario:
+        if iguais or 'sobreaviso' in turno or '24h' in turno:
+            return "badge-24h"
+        if horas_ok and entrada_h == 7 and saida_h == 19:
+            return "diurno"
+
+    # PRIORIDADE 3: SOBREAVISO (período pelo nome, senão pela hora de entrada)
+    if _SOBREAVISO(turno):
+        periodo = _periodo_por_palavra(turno)
+        if periodo:
+            return periodo
+        if entrada_h is not None:
+            return _periodo_por_hora(entrada_h)
+        return "sobreaviso"
+
+    # PRIORIDADE 4: FINAL DE SEMANA (sem sobreaviso)
+    if _FINAL_DE_SEMANA(turno):
+        periodo = _periodo_por_palavra(turno)
+        if periodo:
+            return periodo
+        if entrada_h is not None:
+            return _periodo_por_hora(entrada_h)
+        return "rotina" if 'rotina' in turno else "outro"
+
+    # PRIORIDADE 5: abreviações (P1..P4, DIA, NOITE, siglas curtas) + horário
+    if (turno in _ABREVIACOES or (len(turno) <= 3 and turno.isalnum())) and horas_ok:
+        return _periodo_por_hora(entrada_h)
+
+    periodo = _periodo_por_palavra(turno, _MATUTINO)
+    if periodo:
+        return periodo
+
+    # Plantão sem período no nome (o período já teria casado acima)
+    if _PLANTAO(turno):
         return "plantao"
 
-    # PRIORIDADE 6: Detecta ROTINA com horário específico
+    # PRIORIDADE 6: ROTINA com horário específico
     if 'rotina' in turno:
-        if horario and "/" in horario:
-            try:
-                entrada, saida = horario.split("/")
-                entrada_h = int(entrada.split(":")[0])
-                saida_h = int(saida.split(":")[0])
-
-                # Matutino (6:00-13:00)
-                if entrada_h >= 6 and entrada_h < 12:
-                    return "matutino"
-                # Vespertino (13:00-19:00)
-                elif entrada_h >= 12 and entrada_h < 18:
-                    return "vespertino"
-                # Noturno (19:00-06:00)
-                elif entrada_h >= 18 or entrada_h < 6:
-                    return "noturno"
-            except:
-                pass
-        return "rotina"
-
-    # FALLBACK: Detecta por horário como último recurso antes de retornar "outro"
-    # Importante para turnos que não têm palavras-chave específicas (ex: Ambulatório, etc)
-    if horario and "/" in horario:
-        try:
-            entrada, saida = horario.split("/")
-            entrada_h = int(entrada.split(":")[0])
-            saida_h = int(saida.split(":")[0])
-
-            # Matutino (6:00-13:00)
-            if entrada_h >= 6 and entrada_h < 12:
-                return "matutino"
-            # Vespertino (13:00-19:00)
-            elif entrada_h >= 12 and entrada_h < 18:
-                return "vespertino"
-            # Noturno (19:00-06:00)
-            elif entrada_h >= 18 or entrada_h < 6:
-                return "noturno"
-        except:
-            pass
+        return _periodo_por_hora(entrada_h) if horas_ok else "rotina"
+
+    # FALLBACK: horário como último recurso (ex: Ambulatório)
+    if horas_ok:
+        return _periodo_por_hora(entrada_h)
 
     return "outro"
 
+
+_ROTINA = _regex_palavras('rotina', 'regular', 'alojamento')
+
+# Sobreaviso por especialidade: a ordem importa ("neurologia" contém "urologia")
+_SOBREAVISO_ESPECIALIDADES = (
+    ('neurocirurgia', "Sobreaviso Neurocirurgia"),
+    ('neurologia', "Sobreaviso Neurologia"),
+    ('cardiologia', "Sobreaviso Cardiologia"),
+    ('oftalmologia', "Sobreaviso Oftalmologia"),
+    ('urologia', "Sobreaviso Urologia"),
+    ('oncologia', "Sobreaviso Oncologia"),
+    ('endoscopia', "Sobreaviso Endoscopia"),
+    ('pediátrica', "Sobreaviso Cirurgia Pediátrica"),
+    ('pediatrica', "Sobreaviso Cirurgia Pediátrica"),
+    ('vascular', "Sobreaviso Cirurgia Vascular"),
+)
+
+
+def _variante_plantao(turno, base):
+    if 'p1' in turno:
+        return f"{base} - P1"
+    if 'p2' in turno:
+        return f"{base} - P2"
+    return base
+
+
+@lru_cache(maxsize=4096)
 def normalizar_turno(turno_text):
     """Normaliza nomes de turnos para ordem cronológica padrão"""
     if not turno_text:
@@ -232,64 +193,47 @@ def normalizar_turno(turno_text):
     # HOSPITALISTA - COMANEJO vs URGÊNCIA (especial)
     if 'hospitalista' in turno:
         if 'comanejo' in turno:
-            if 'matutino' in turno or '07:00' in turno:
-                return (1, "Comanejo Matutino")
-            elif 'vespertino' in turno or 'tarde' in turno or '13:00' in turno:
-                return (2, "Comanejo Vespertino")
-            elif 'noturno' in turno or '19:00' in turno:
-                return (3, "Comanejo Noturno")
+            prefixo = "Comanejo"
         elif 'urgência' in turno or 'urgencia' in turno:
+            prefixo = "Urgência"
+        else:
+            prefixo = None
+        if prefixo:
             if 'matutino' in turno or '07:00' in turno:
-                return (1, "Urgência Matutino")
+                return (1, f"{prefixo} Matutino")
             elif 'vespertino' in turno or 'tarde' in turno or '13:00' in turno:
-                return (2, "Urgência Vespertino")
+                return (2, f"{prefixo} Vespertino")
             elif 'noturno' in turno or '19:00' in turno:
-                return (3, "Urgência Noturno")
+                return (3, f"{prefixo} Noturno")
 
     # MATUTINO (Ordem 1)
-    if any(x in turno for x in ['matutino', 'matutina', 'manhã', 'madrugada', '07:00', '08:00', '06:00']):
+    if _MATUTINO(turno):
         if 'final' in turno:
             return (1, "Manhã - Final de Semana")
-        if 'p1' in turno:
-            return (1, "Plantão Matutino - P1")
-        elif 'p2' in turno:
-            return (1, "Plantão Matutino - P2")
-        return (1, "Plantão Matutino")
+        return (1, _variante_plantao(turno, "Plantão Matutino"))
 
     # VESPERTINO (Ordem 2)
-    if any(x in turno for x in ['vespertino', 'vespertina', 'tarde', '13:00', '14:00']):
+    if _VESPERTINO(turno):
         if 'final' in turno:
             return (2, "Tarde - Final de Semana")
-        if 'p1' in turno:
-            return (2, "Plantão Vespertino - P1")
-        elif 'p2' in turno:
-            return (2, "Plantão Vespertino - P2")
-        return (2, "Plantão Vespertino")
+        return (2, _variante_plantao(turno, "Plantão Vespertino"))
 
     # NOTURNO (Ordem 3)
-    if any(x in turno for x in ['noturno', 'noturna', 'noite', '19:00']):
-        if 'p1' in turno:
-            return (3, "Plantão Noturno - P1")
-        elif 'p2' in turno:
-            return (3, "Plantão Noturno - P2")
-        return (3, "Plantão Noturno")
-
-    # DIURNO (07:00-19:00) - Residência
-    if turno == 'diurno':
-        return (1, "Plantão Diurno")
+    if _NOTURNO(turno):
+        return (3, _variante_plantao(turno, "Plantão Noturno"))
 
-    # DIA / NOITE (Residência - legacy)
-    if turno == 'dia':
+    # DIURNO / DIA / NOITE (Residência)
+    if turno in ('diurno', 'dia'):
         return (1, "Plantão Diurno")
     elif turno == 'noite':
         return (3, "Período Noturno")
 
     # P1, P2, P3, P4 (Plantões standalone)
-    if turno in ['p1', 'p2', 'p3', 'p4']:
+    if turno in ('p1', 'p2', 'p3', 'p4'):
         return (2, f"Plantão {turno.upper()}")
 
     # ROTINA (Ordem 4)
-    if any(x in turno for x in ['rotina', 'regular', 'alojamento']):
+    if _ROTINA(turno):
         if 'matutino' in turno:
             return (1, "Rotina Matutino")
         elif 'vespertino' in turno or 'tarde' in turno:
@@ -302,27 +246,10 @@ def normalizar_turno(turno_text):
 
     # SOBREAVISO (Ordem 5)
     if 'sobreaviso' in turno:
-        # Check more specific terms FIRST to avoid substring matching issues
-        # e.g., "neurologia" contains "ologia" which could match "urologia" check
-        if 'neurocirurgia' in turno:
-            return (5, "Sobreaviso Neurocirurgia")
-        elif 'neurologia' in turno:
-            return (5, "Sobreaviso Neurologia")
-        elif 'cardiologia' in turno:
-            return (5, "Sobreaviso Cardiologia")
-        elif 'oftalmologia' in turno:
-            return (5, "Sobreaviso Oftalmologia")
-        elif 'urologia' in turno:
-            return (5, "Sobreaviso Urologia")
-        elif 'oncologia' in turno:
-            return (5, "Sobreaviso Oncologia")
-        elif 'endoscopia' in turno:
-            return (5, "Sobreaviso Endoscopia")
-        elif 'pediátrica' in turno or 'pediatrica' in turno:
-            return (5, "Sobreaviso Cirurgia Pediátrica")
-        elif 'vascular' in turno:
-            return (5, "Sobreaviso Cirurgia Vascular")
-        elif 'cirurgia' in turno:
+        for especialidade, nome in _SOBREAVISO_ESPECIALIDADES:
+            if especialidade in turno:
+                return (5, nome)
+        if 'cirurgia' in turno:
             if 'equipe 1' in turno or ' 1' in turno:
                 return (5, "Sobreaviso Cirurgia - Equipe 1")
             elif 'equipe 2' in turno or ' 2' in turno:
@@ -337,6 +264,100 @@ def normalizar_turno(turno_text):
     # Manter o original para casos não identificados
     return (99, turno_original)
 
+
+def classificar_registros(escalas):
+    """Anota cada registro de anterior/atual/seguinte com a classificação
+    calculada aqui — tipo_badge (obter_tipo_turno), turno_ordem e turno_nome
+    (normalizar_turno) — para o JS do dashboard só ler os campos, sem uma
+    segunda cópia das regras. Altera `escalas` no lugar e devolve o número de
+    registros anotados."""
+    total = 0
+    for dia in ('anterior', 'atual', 'seguinte'):
+        bloco = escalas.get(dia)
+        if not isinstance(bloco, dict):
+            continue
+        for registro in bloco.get('registros') or []:
+            tipo_turno = registro.get('tipo_turno') or ''
+            registro['tipo_badge'] = obter_tipo_turno(tipo_turno, registro.get('horario') or '')
+            registro['turno_ordem'], registro['turno_nome'] = normalizar_turno(tipo_turno)
+            total += 1
+    return total
+
+# ---- Plantão agora ----
+#
+# O estado de cada registro ao longo do dia (fora, em serviço, encerrado) só
+# muda na entrada e na saída. Em vez de o JS reler o data-hora de todos os
+# cards a cada minuto, o gerador monta a agenda do dia: quem está em serviço
+# às 00:00 e os eventos (minuto, novo estado, ids) em ordem. O navegador
+# repassa os eventos até o minuto atual, toca só os cards que mudaram e dorme
+# até o próximo evento.
+
+FORA, EM_SERVICO, ENCERRADO = 0, 1, 2
+MINUTOS_DIA = 24 * 60
+_INTEIRO_JS = re.compile(r'\s*([+-]?[0-9]+)')
+
+
+def _minutos(hhmm):
+    """Minutos de "HH:MM" como o parseInt() do JS (aceita lixo depois dos
+    dígitos); None se a hora ou os minutos não forem número."""
+    partes = hhmm.strip().split(':')
+    h = _INTEIRO_JS.match(partes[0])
+    m = _INTEIRO_JS.match(partes[1] if len(partes) > 1 and partes[1] else '0')
+    if not h or not m:
+        return None
+    return int(h.group(1)) * 60 + int(m.group(1))
+
+
+def intervalo_plantao(horario):
+    """(entrada, saída) em minutos de "HH:MM/HH:MM" (partes além da segunda
+    são ignoradas), ou None."""
+    if not horario or '/' not in horario:
+        return None
+    entrada, saida = horario.split('/')[:2]
+    entrada, saida = _minutos(entrada), _minutos(saida)
+    if entrada is None or saida is None:
+        return None
+    return entrada, saida
+
+
+def estado_no_minuto(intervalo, minuto):
+    """FORA, EM_SERVICO ou ENCERRADO no `minuto` do dia (0–1439)."""
+    if intervalo is None:
+        return FORA
+    entrada, saida = intervalo
+    if entrada == saida:  # plantão de 24h
+        return EM_SERVICO
+    if saida < entrada:  # vira a madrugada (ex: 19:00/07:00)
+        return EM_SERVICO if minuto >= entrada or minuto < saida else FORA
+    if minuto < entrada:
+        return FORA
+    return EM_SERVICO if minuto < saida else ENCERRADO
+
+
+def agenda_plantoes(registros):
+    """{'inicio': ids em serviço às 00:00, 'eventos': [[minuto, estado, ids],
+    ...]} em ordem de minuto — id é a posição do registro em `registros`.
+    Os estados só mudam na entrada ou na saída, então basta conferir esses
+    dois minutos de cada registro."""
+    inicio = []
+    eventos = {}
+    for id_, registro in enumerate(registros):
+        intervalo = intervalo_plantao(registro.get('horario') or '')
+        if intervalo is None:
+            continue
+        if estado_no_minuto(intervalo, 0) == EM_SERVICO:
+            inicio.append(id_)
+        for minuto in sorted(set(intervalo)):
+            if 0 < minuto < MINUTOS_DIA:
+                estado = estado_no_minuto(intervalo, minuto)
+                if estado != estado_no_minuto(intervalo, minuto - 1):
+                    eventos.setdefault((minuto, estado), []).append(id_)
+    return {
+        'inicio': inicio,
+        'eventos': [[minuto, estado, ids] for (minuto, estado), ids in sorted(eventos.items())],
+    }
+
+
 def carregar_ramais_data(escala_data=None):
     """Carrega dados de ramais e mapeamento de setores
 
@@ -405,24 +426,118 @@ def carregar_ramais_data(escala_data=None):
 
     return ramais_data, mapping_data
 
-def obter_ramais_setor(setor_nome, ramais_data, mapping_data):
-    """Obtém os ramais de um setor baseado no mapeamento"""
+# ---- Casamento de nomes de setor com o mapeamento de ramais ----
+#
+# O mapeamento guarda o nome "limpo" do setor, e a escala às vezes traz outra
+# grafia (caixa, acento, sufixo " - ESCALA MÉDICA", palavras em outra ordem).
+# Ordem de tentativa: nome exato → chave normalizada → trigramas (aproximado).
+
+_SUFIXO_ESCALA_MEDICA = re.compile(r'\s*[-–]\s*escala\s+medica\s*$')
+# Numerais distinguem setores quase iguais (UTI Adulto I/II/III/IV): no casamento
+# aproximado eles precisam ser os mesmos dos dois lados
+_NUMERAL = re.compile(r'^(?:[ivx]+|\d+)$')
+LIMIAR_SIMILARIDADE = 0.6
+
+
+def chave_setor(nome):
+    """Chave de comparação: sem acento, minúsculas, sem o sufixo
+    " - Escala Médica", palavras em ordem alfabética."""
+    texto = unicodedata.normalize('NFKD', nome or '')
+    texto = ''.join(c for c in texto if not unicodedata.combining(c)).casefold()
+    texto = _SUFIXO_ESCALA_MEDICA.sub('', texto)
+    return ' '.join(sorted(re.findall(r'[a-z0-9]+', texto)))
+
+
+def _trigramas(chave):
+    texto = f"  {chave} "
+    return frozenset(texto[i:i + 3] for i in range(len(texto) - 2))
+
+
+def _numerais(chave):
+    return {p for p in chave.split() if _NUMERAL.match(p)}
+
+
+class IndiceSetores:
+    """Resolve um nome de setor da escala para o dashboard_sector do
+    mapeamento. As resoluções ficam memorizadas (cada setor distinto é
+    comparado uma vez por geração)."""
+
+    def __init__(self, mapping_data, limiar=LIMIAR_SIMILARIDADE):
+        self.limiar = limiar
+        self.exatos = set()
+        self.por_chave = {}
+        for mapping in (mapping_data or {}).get('sector_mappings', []):
+            setor = mapping['dashboard_sector']
+            self.exatos.add(setor)
+            self.por_chave.setdefault(chave_setor(setor), setor)
+        self.trigramas = {chave: _trigramas(chave) for chave in self.por_chave}
+        self._resolvidos = {}
+
+    def resolver(self, setor):
+        """(dashboard_sector, critério) — critério 'exato', 'normalizado' ou
+        'aproximado' — ou (None, None) se nada casar."""
+        if setor not in self._resolvidos:
+            self._resolvidos[setor] = self._resolver(setor)
+        return self._resolvidos[setor]
+
+    def _resolver(self, setor):
+        if setor in self.exatos:
+            return setor, 'exato'
+        chave = chave_setor(setor)
+        if chave in self.por_chave:
+            return self.por_chave[chave], 'normalizado'
+
+        tri, numerais = _trigramas(chave), _numerais(chave)
+        melhor, melhor_nota = None, 0.0
+        for candidata, tri_candidata in self.trigramas.items():
+            nota = len(tri & tri_candidata) / len(tri | tri_candidata)
+            if nota > melhor_nota and _numerais(candidata) == numerais:
+                melhor, melhor_nota = candidata, nota
+        if melhor is not None and melhor_nota >= self.limiar:
+            return self.por_chave[melhor], 'aproximado'
+        return None, None
+
+
+def indexar_ramais(ramais_data, mapping_data, apelidos=None):
+    """Índice {setor do dashboard: [ramais sem repetição]}, montado uma vez por
+    geração. Substitui a busca linear no mapeamento e, para cada departamento
+    mapeado, outra busca linear nos ~150 departamentos. Se um setor aparecer
+    duas vezes no mapeamento, vale o primeiro (como na busca antiga).
+    `apelidos` ({nome na escala: dashboard_sector}, de IndiceSetores) acrescenta
+    as grafias da escala que não são idênticas às do mapeamento."""
     if not ramais_data or not mapping_data:
-        return []
+        return {}
+
+    ramais_por_depto = {}
+    for dept in ramais_data.get('departments', []):
+        ramais_por_depto.setdefault(dept['name'], []).extend(dept['extensions'])
 
-    # Procurar o setor no mapeamento
+    indice = {}
     for mapping in mapping_data.get('sector_mappings', []):
-        if mapping['dashboard_sector'] == setor_nome:
-            # Encontrou o mapeamento, buscar os ramais
-            extensions = []
-            for dept_name in mapping['ramais_departments']:
-                # Procurar o departamento nos ramais
-                for dept in ramais_data.get('departments', []):
-                    if dept['name'] == dept_name:
-                        extensions.extend(dept['extensions'])
-            return extensions
-
-    return []
+        setor = mapping['dashboard_sector']
+        if setor in indice:
+            continue
+        extensions = []
+        for dept_name in mapping['ramais_departments']:
+            for ext in ramais_por_depto.get(dept_name, ()):
+                if ext not in extensions:
+                    extensions.append(ext)
+        indice[setor] = extensions
+
+    for setor, alvo in (apelidos or {}).items():
+        if setor not in indice and alvo in indice:
+            indice[setor] = indice[alvo]
+    return indice
+
+
+def obter_ramais_setor(setor_nome, ramais_data, mapping_data, indice=None):
+    """Obtém os ramais de um setor baseado no mapeamento.
+    Com `indice` (de indexar_ramais) a consulta é direta; sem ele, o nome é
+    resolvido também por chave normalizada/aproximada (IndiceSetores)."""
+    if indice is None:
+        alvo, _ = IndiceSetores(mapping_data).resolver(setor_nome)
+        indice = indexar_ramais(ramais_data, mapping_data, {setor_nome: alvo} if alvo else None)
+    return list(indice.get(setor_nome, []))
 
 def formatar_ramais_display(extensions):
     """Formata ramais para exibição no cabeçalho do setor"""
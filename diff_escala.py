@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Diferença registro a registro entre duas extrações da escala.
+
+Cada registro é identificado por (profissional, setor, tipo_turno, horario);
+e-mail, telefone e pos_x não contam. As duas listas viram multiconjuntos
+(Counter) dessas chaves, então o custo é linear e registros repetidos — o mesmo
+profissional duas vezes no mesmo turno — são contados direito.
+
+Uma TROCA é um registro que saiu e outro que entrou no mesmo posto (mesmo
+setor, turno e horário), só mudando o profissional. O que sobra vira
+adição/remoção.
+
+Os snapshots antigos de data/historico/ podem ser de antes de uma correção de
+texto (normalizacao.py) ter entrado na extração; o bloco antigo passa por
+normalizar_registro() antes de comparar, para que uma correção não apareça como
+troca de todos os registros do setor.
+
+Uso:
+    python3 diff_escala.py data/historico/2026-08-21.json /tmp/extracao_inteligente.json
+    python3 diff_escala.py A.json B.json --dia seguinte
+"""
+
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from historico_compacto import ler_snapshot
+from normalizacao import normalizar_registro
+
+BASE_DIR = Path(__file__).parent
+HISTORICO = BASE_DIR / 'data' / 'historico'
+
+CAMPOS_CHAVE = ('profissional', 'setor', 'tipo_turno', 'horario')
+DIAS = ('anterior', 'atual', 'seguinte')
+
+
+def chave_registro(registro):
+    return tuple((registro.get(c) or '').strip() for c in CAMPOS_CHAVE)
+
+
+def _como_dict(chave):
+    return dict(zip(CAMPOS_CHAVE, chave))
+
+
+def diff_registros(antes, depois):
+    """{'adicionados', 'removidos', 'trocas'} entre duas listas de registros.
+    Trocas: {'setor', 'tipo_turno', 'horario', 'saiu', 'entrou'}."""
+    contagem_antes = Counter(chave_registro(r) for r in antes)
+    contagem_depois = Counter(chave_registro(r) for r in depois)
+    removidos = list((contagem_antes - contagem_depois).elements())
+    adicionados = list((contagem_depois - contagem_antes).elements())
+
+    # Pareia saídas e entradas do mesmo posto como trocas
+    entradas_por_posto = defaultdict(list)
+    for chave in adicionados:
+        entradas_por_posto[chave[1:]].append(chave)
+
+    trocas = []
+    sobra_removidos = []
+    for chave in removidos:
+        entradas = entradas_por_posto.get(chave[1:])
+        if entradas:
+            entrou = entradas.pop()
+            setor, tipo_turno, horario = chave[1:]
+            trocas.append({'setor': setor, 'tipo_turno': tipo_turno, 'horario': horario,
+                           'saiu': chave[0], 'entrou': entrou[0]})
+        else:
+            sobra_removidos.append(chave)
+    sobra_adicionados = [c for entradas in entradas_por_posto.values() for c in entradas]
+
+    return {
+        'adicionados': sorted((_como_dict(c) for c in sobra_adicionados), key=lambda r: (r['setor'], r['profissional'])),
+        'removidos': sorted((_como_dict(c) for c in sobra_removidos), key=lambda r: (r['setor'], r['profissional'])),
+        'trocas': sorted(trocas, key=lambda t: (t['setor'], t['tipo_turno'], t['saiu'])),
+    }
+
+
+def total_mudancas(diff):
+    return len(diff['adicionados']) + len(diff['removidos']) + len(diff['trocas'])
+
+
+def taxa_rotatividade(diff, total_antes):
+    """Fração dos registros de antes que não sobreviveram (removidos + trocados)."""
+    if not total_antes:
+        return 0.0
+    return (len(diff['removidos']) + len(diff['trocas'])) / total_antes
+
+
+def bloco_por_data(escala, data_simples):
+    """O bloco (anterior/atual/seguinte) de `escala` com essa data, ou None.
+    Os registros saem normalizados (cópias; `escala` não muda)."""
+    for dia in DIAS:
+        bloco = (escala or {}).get(dia) or {}
+        if bloco.get('data_simples') == data_simples and bloco.get('registros'):
+            return dict(bloco, registros=[normalizar_registro(dict(r)) for r in bloco['registros']])
+    return None
+
+
+def snapshot_anterior(data_simples, pasta=HISTORICO, ignorar=None):
+    """(caminho, bloco) do snapshot mais recente de data/historico/ que tenha
+    o dia `data_simples`, ou (None, None)."""
+    pasta = Path(pasta)
+    if not pasta.is_dir():
+        return None, None
+    for caminho in sorted(pasta.glob('*.json'), reverse=True):
+        if ignorar and caminho.resolve() == Path(ignorar).resolve():
+            continue
+        try:
+            bloco = bloco_por_data(ler_snapshot(caminho), data_simples)
+        except (OSError, ValueError, KeyError):
+            continue
+        if bloco:
+            return caminho, bloco
+    return None, None
+
+
+def diff_escalas(antiga, nova, dia='atual'):
+    """Diff do bloco `dia` de `nova` contra o bloco da MESMA DATA em `antiga`
+    (que pode estar em outra posição da janela). None se a data não existir
+    nas duas."""
+    bloco_novo = (nova or {}).get(dia) or {}
+    bloco_antigo = bloco_por_data(antiga, bloco_novo.get('data_simples'))
+    if not bloco_novo.get('registros') or bloco_antigo is None:
+        return None
+    return diff_registros(bloco_antigo['registros'], bloco_novo['registros'])
+
+
+def formatar_diff(diff):
+    linhas = []
+    for t in diff['trocas']:
+        linhas.append(f"   🔁 {t['setor']} · {t['tipo_turno']} ({t['horario']}): {t['saiu']} → {t['entrou']}")
+    for r in diff['adicionados']:
+        linhas.append(f"   ➕ {r['profissional']} — {r['setor']} · {r['tipo_turno']} ({r['horario']})")
+    for r in diff['removidos']:
+        linhas.append(f"   ➖ {r['profissional']} — {r['setor']} · {r['tipo_turno']} ({r['horario']})")
+    return "\n".join(linhas)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Diferença entre duas extrações da escala")
+    parser.add_argument('antiga')
+    parser.add_argument('nova')
+    parser.add_argument('--dia', choices=DIAS, default='atual',
+                        help="bloco da extração nova a comparar (padrão: atual)")
+    args = parser.parse_args()
+
+    antiga = ler_snapshot(args.antiga)
+    nova = ler_snapshot(args.nova)
+
+    data = ((nova.get(args.dia) or {}).get('data_simples')) or '?'
+    diff = diff_escalas(antiga, nova, args.dia)
+    if diff is None:
+        print(f"⚠️  {data} não aparece nas duas extrações; nada a comparar")
+        return 1
+    print(f"📋 {data}: {len(diff['trocas'])} troca(s), {len(diff['adicionados'])} adição(ões), "
+          f"{len(diff['removidos'])} remoção(ões)")
+    if total_mudancas(diff):
+        print(formatar_diff(diff))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
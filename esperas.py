@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Esperas orientadas a evento para o extrator Selenium.
+
+Substitui os time.sleep fixos por condições verificadas em polling curto, cada
+uma com timeout próprio: a etapa termina assim que a página está pronta, e não
+depois de um tempo chutado. Cada espera fica registrada (etapa, duração, se a
+condição foi atendida) para o relatório de tempos do fim da extração; o
+relatório zera o registro, para que um extrator de vida longa (o daemon) não
+acumule o histórico de semanas.
+
+Não importa Selenium: só usa driver.execute_script, então dá para testar com
+um driver falso.
+"""
+
+import time
+
+# Instala (uma vez por documento) um MutationObserver que anota o instante da
+# última mutação do DOM, e devolve há quantos ms o DOM não muda.
+_JS_MS_SEM_MUTACAO = """
+if (!window.__esperaMutacao) {
+    window.__esperaMutacao = {t: performance.now()};
+    new MutationObserver(function() { window.__esperaMutacao.t = performance.now(); })
+        .observe(document.documentElement,
+                 {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return performance.now() - window.__esperaMutacao.t;
+"""
+
+# Quantos recursos a página já carregou e há quantos ms terminou o último.
+_JS_ESTADO_REDE = """
+var rs = performance.getEntriesByType('resource');
+var ultimo = 0;
+for (var i = 0; i < rs.length; i++) { if (rs[i].responseEnd > ultimo) ultimo = rs[i].responseEnd; }
+return [rs.length, performance.now() - ultimo];
+"""
+
+
+class Esperas:
+    def __init__(self, driver, intervalo=0.1):
+        self.driver = driver
+        self.intervalo = intervalo
+        self.tempos = []  # (etapa, segundos, condição atendida?)
+
+    def ate(self, etapa, predicado, timeout=10):
+        """Espera `predicado()` ficar verdadeiro (exceções contam como falso).
+        Devolve True se atendeu, False se estourou o timeout."""
+        inicio = time.monotonic()
+        limite = inicio + timeout
+        ok = False
+        while True:
+            try:
+                if predicado():
+                    ok = True
+                    break
+            except Exception:
+                pass
+            if time.monotonic() >= limite:
+                break
+            time.sleep(self.intervalo)
+        self.tempos.append((etapa, time.monotonic() - inicio, ok))
+        return ok
+
+    def dom_estavel(self, etapa, quieto=0.5, timeout=10):
+        """DOM sem mutações há pelo menos `quieto` segundos."""
+        return self.ate(
+            etapa,
+            lambda: self.driver.execute_script(_JS_MS_SEM_MUTACAO) >= quieto * 1000,
+            timeout,
+        )
+
+    def rede_ociosa(self, etapa, quieto=0.5, timeout=15):
+        """Nenhum recurso novo e nenhum terminando há pelo menos `quieto`
+        segundos (performance.getEntriesByType('resource'))."""
+        anterior = {'n': None}
+
+        def ociosa():
+            n, ms_desde_ultimo = self.driver.execute_script(_JS_ESTADO_REDE)
+            estavel = n == anterior['n']
+            anterior['n'] = n
+            return estavel and ms_desde_ultimo >= quieto * 1000
+
+        return self.ate(etapa, ociosa, timeout)
+
+    def pagina_pronta(self, etapa, quieto=0.5, timeout=20):
+        """Rede ociosa e DOM estável, dividindo o mesmo orçamento de tempo."""
+        inicio = time.monotonic()
+        rede_ok = self.rede_ociosa(f"{etapa} (rede)", quieto, timeout)
+        restante = max(timeout - (time.monotonic() - inicio), quieto)
+        return self.dom_estavel(f"{etapa} (DOM)", quieto, restante) and rede_ok
+
+    def total(self):
+        return sum(segundos for _, segundos, _ in self.tempos)
+
+    def relatorio(self, zerar=True):
+        """Tabela de tempos por etapa desde o último relatório, para o log do
+        workflow. Com zerar=True (padrão) as etapas relatadas são esquecidas."""
+        linhas = [f"⏱️  TEMPOS DE ESPERA ({len(self.tempos)} etapas, {self.total():.1f}s no total)"]
+        for etapa, segundos, ok in self.tempos:
+            marca = '✅' if ok else '⏰ timeout'
+            linhas.append(f"   {segundos:6.2f}s  {etapa:<45} {marca}")
+        if zerar:
+            self.tempos.clear()
+        return "\n".join(linhas)
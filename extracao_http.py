@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Extração DIRETA por HTTP, sem navegador.
+
+O SPA do escala.med.br monta a grade do dia a partir de chamadas XHR a uma API
+JSON. Este backend faz o mesmo que o SPA: um login com `requests` (a sessão
+guarda o cookie/token que o SPA receberia) e uma chamada por dia à API da
+grade. Entrega exatamente a mesma estrutura de ExtractorInteligente
+({'atual', 'seguinte', 'anterior'}), então o resto do pipeline não muda.
+
+Os endpoints vêm do ambiente, porque dependem da versão do SPA em produção:
+
+    ESCALA_API_BASE   raiz da API               (padrão: https://escala.med.br)
+    ESCALA_API_LOGIN  caminho do POST de login  (ex: /api/auth/login)
+    ESCALA_API_DIA    caminho da grade do dia, com {data} em AAAA-MM-DD
+                      (ex: /api/day_grid?date={data})
+
+Para descobrir os caminhos, rode a extração pelo navegador com
+ESCALA_LISTAR_XHR=1: ela lista as chamadas XHR que o SPA fez.
+
+Sem ESCALA_API_DIA configurado o backend não é usado (ver
+extracao_inteligente.extrair_resultados).
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import requests
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ESCALA_USERNAME = os.getenv('ESCALA_USERNAME')
+ESCALA_PASSWORD = os.getenv('ESCALA_PASSWORD')
+
+MESES = ('janeiro', 'fevereiro', 'março', 'abril', 'maio', 'junho', 'julho',
+         'agosto', 'setembro', 'outubro', 'novembro', 'dezembro')
+
+# Nomes de campo aceitos na resposta da API, em ordem de preferência. A API não
+# é documentada; se ela renomear um campo, basta acrescentá-lo aqui.
+CAMPOS_API = {
+    'profissional': ('profissional', 'plantonista', 'medico', 'nome_profissional', 'nome', 'name'),
+    'setor': ('setor', 'escala', 'nome_escala', 'local', 'sector'),
+    'tipo_turno': ('tipo_turno', 'turno', 'nome_turno', 'periodo', 'shift'),
+    'horario': ('horario', 'horario_formatado'),
+    'inicio': ('inicio', 'hora_inicio', 'entrada', 'start', 'start_time'),
+    'fim': ('fim', 'hora_fim', 'saida', 'end', 'end_time'),
+    'email': ('email', 'e_mail'),
+    'phone': ('phone', 'telefone', 'celular', 'fone'),
+}
+
+# Chaves sob as quais a lista de plantões pode vir embrulhada
+CHAVES_LISTA = ('registros', 'plantoes', 'escalas', 'items', 'data', 'results')
+
+CHAVES_TOKEN = ('token', 'access_token', 'id_token', 'jwt')
+
+_BRT = timezone(timedelta(hours=-3))
+
+
+def api_configurada():
+    """True se o ambiente tem o endpoint da grade do dia configurado."""
+    return bool(os.getenv('ESCALA_API_DIA'))
+
+
+def data_por_extenso(dia):
+    """date(2026, 8, 1) -> '01 agosto 2026' (mesmo texto do cabeçalho do SPA)."""
+    return f"{dia.day:02d} {MESES[dia.month - 1]} {dia.year}"
+
+
+def _campo(item, nome):
+    """Primeiro valor não vazio entre os nomes aceitos para `nome`.
+    Objetos aninhados (ex: {'setor': {'nome': ...}}) viram o seu nome."""
+    for chave in CAMPOS_API[nome]:
+        valor = item.get(chave)
+        if isinstance(valor, dict):
+            valor = valor.get('nome') or valor.get('name') or ''
+        if valor not in (None, ''):
+            return str(valor).strip()
+    return ''
+
+
+def _hora(valor):
+    """'2026-08-22T19:00:00-03:00' ou '19:00:00' -> '19:00'."""
+    if not valor:
+        return ''
+    texto = valor.split('T')[-1]
+    return texto[:5]
+
+
+def registros_da_api(payload, data_texto):
+    """Converte a resposta JSON da grade do dia nos registros que extrair_dia()
+    produz pelo DOM. Itens sem profissional ou sem turno são descartados, como
+    no extrator visual."""
+    itens = payload
+    if isinstance(payload, dict):
+        for chave in CHAVES_LISTA:
+            if isinstance(payload.get(chave), list):
+                itens = payload[chave]
+                break
+        else:
+            itens = []
+
+    registros = []
+    for item in itens or []:
+        if not isinstance(item, dict):
+            continue
+        prof = _campo(item, 'profissional')
+        turno = _campo(item, 'tipo_turno')
+        if len(prof) < 3 or len(turno) < 2:
+            continue
+        horario = _campo(item, 'horario')
+        if not horario:
+            inicio, fim = _hora(_campo(item, 'inicio')), _hora(_campo(item, 'fim'))
+            horario = f"{inicio}/{fim}" if inicio and fim else ''
+        registros.append({
+            'profissional': prof,
+            'setor': _campo(item, 'setor') or 'Plantão',
+            'tipo_turno': turno,
+            'horario': horario,
+            'email': _campo(item, 'email'),
+            'phone': _campo(item, 'phone'),
+            'data': data_texto,
+            'pos_x': 0,  # sem layout visual; mantido para o formato ser o mesmo
+        })
+    return registros
+
+
+class ExtractorHTTP:
+    """Mesma interface de ExtractorInteligente (login, extrair_dia,
+    extrair_inteligente, close), falando direto com a API do SPA."""
+
+    def __init__(self, timeout=30):
+        self.base = os.getenv('ESCALA_API_BASE', 'https://escala.med.br').rstrip('/')
+        self.caminho_login = os.getenv('ESCALA_API_LOGIN', '')
+        self.caminho_dia = os.getenv('ESCALA_API_DIA', '')
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Accept': 'application/json, text/plain, */*',
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+        })
+
+    def login(self):
+        """Autentica uma vez; cookies ficam na sessão e, se a API devolver um
+        token, ele passa a ir no cabeçalho Authorization."""
+        if not self.caminho_login:
+            raise RuntimeError("ESCALA_API_LOGIN não configurado")
+        print(f"[{datetime.now()}] 🔐 Login HTTP em {self.base}{self.caminho_login}...")
+        resp = self.session.post(
+            f"{self.base}{self.caminho_login}",
+            json={'username': ESCALA_USERNAME, 'email': ESCALA_USERNAME, 'password': ESCALA_PASSWORD},
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+        try:
+            corpo = resp.json()
+        except ValueError:
+            corpo = {}
+        if isinstance(corpo, dict):
+            for chave in CHAVES_TOKEN:
+                if corpo.get(chave):
+                    self.session.headers['Authorization'] = f"Bearer {corpo[chave]}"
+                    break
+        print(f"[{datetime.now()}] ✅ Login HTTP realizado")
+
+    def extrair_dia(self, dia=None):
+        """Extrai um dia (padrão: hoje em BRT) no mesmo formato de
+        ExtractorInteligente.extrair_dia()."""
+        if not self.caminho_dia:
+            raise RuntimeError("ESCALA_API_DIA não configurado")
+        dia = dia or datetime.now(_BRT).date()
+        url = f"{self.base}{self.caminho_dia.format(data=dia.isoformat())}"
+        resp = self.session.get(url, timeout=self.timeout)
+        resp.raise_for_status()
+
+        data_texto = data_por_extenso(dia)
+        registros = registros_da_api(resp.json(), data_texto)
+        setores = {r['setor'] for r in registros}
+        return {
+            'total': len(registros),
+            'data': data_texto,
+            'setores_encontrados': len(setores),
+            'registros': registros,
+            'headers_encontrados': len(setores),
+            'debug': {'backend': 'http', 'url': url},
+        }
+
+    def extrair_inteligente(self):
+        """Dia ATUAL e dia SEGUINTE; o ANTERIOR continua vindo do rolling window."""
+        hoje = datetime.now(_BRT).date()
+        print(f"[{datetime.now()}] 📅 Extraindo dia ATUAL via HTTP...")
+        resultado_atual = self.extrair_dia(hoje)
+        print(f"[{datetime.now()}] ✅ Dia atual extraído: {resultado_atual['total']} registros")
+
+        resultado_seguinte = None
+        try:
+            resultado_seguinte = self.extrair_dia(hoje + timedelta(days=1))
+            print(f"[{datetime.now()}] ✅ Dia seguinte extraído ({resultado_seguinte['data']}): "
+                  f"{resultado_seguinte['total']} registros")
+        except Exception as e:
+            print(f"[{datetime.now()}] ⚠️  Erro ao extrair dia seguinte via HTTP: {e}")
+
+        return {
+            'atual': resultado_atual,
+            'seguinte': resultado_seguinte,
+            'anterior': None  # Será preenchido pela lógica de rolling window
+        }
+
+    def close(self):
+        self.session.close()
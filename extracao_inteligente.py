@@ -2,14 +2,20 @@
 """
 Extração INTELIGENTE baseada em POSIÇÃO VISUAL das colunas (coordenada X)
 Com suporte a Rolling Window para Dia Anterior
+
+Uso:
+    python3 extracao_inteligente.py                       # atual + seguinte (workflow diário)
+    python3 extracao_inteligente.py --dias 7              # 7 dias à frente numa sessão
+    python3 extracao_inteligente.py --dias 5 --direcao tras --salvar-historico
+                                                          # preenche buracos em data/historico/
+    python3 extracao_inteligente.py --daemon              # extrator residente (runner próprio)
 """
 
 import os
-import re
 import json
 import time
 import shutil
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 from dotenv import load_dotenv
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -19,11 +25,49 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 
+from esperas import Esperas
+from historico_compacto import salvar_snapshot
+from normalizacao import corrigir_portugues, normalizar_registro
+from sessao_persistente import retomar_ou_entrar
+
 load_dotenv()
 
 ESCALA_USERNAME = os.getenv('ESCALA_USERNAME')
 ESCALA_PASSWORD = os.getenv('ESCALA_PASSWORD')
 
+# Texto da data no cabeçalho da grade ("22 agosto 2026")
+_JS_DATA_CABECALHO = r"""
+  for(var e of document.querySelectorAll('*')){
+    if(e.childElementCount===0){var t=(e.textContent||'').trim();
+      if(/^\d{1,2}\s+[A-Za-zçÇ]+\s+\d{4}$/.test(t)) return t;}
+  }
+  return null;
+"""
+
+# Checkbox "Mostrar informações de contato do plantonista" (por texto da linha;
+# fallback: 2º checkbox). Com marcar=true clica se ainda não estiver marcado.
+_JS_CHECKBOX_CONTATO = r"""
+  var marcar = arguments[0];
+  function rowText(c){
+    var n=c;
+    for(var i=0;i<6;i++){ if(!n) break;
+      var t=(n.textContent||'').trim();
+      if(t.length>3) return t.slice(0,70);
+      n=n.parentElement;
+    }
+    return '';
+  }
+  var cbs=Array.from(document.querySelectorAll("input[type='checkbox']"));
+  var alvo=null, rotulo=null;
+  for (var c of cbs){
+    if(rowText(c).toLowerCase().includes('contato')){ alvo=c; rotulo=rowText(c); break; }
+  }
+  if(!alvo && cbs.length>1){ alvo=cbs[1]; rotulo='idx1'; }
+  if(!alvo) return null;
+  if(marcar && !alvo.checked) alvo.click();
+  return {rotulo: rotulo, marcado: alvo.checked};
+"""
+
 def carregar_ramais_data():
     """Carrega dados de ramais e mapeamento de setores para persistência"""
     ramais_data = None
@@ -68,7 +112,8 @@ class ExtractorInteligente:
     def __init__(self, headless=True):
         # Backend de browser: 'chrome' (padrão, usado no GitHub Actions) ou 'safari'
         # (para rodar localmente em Macs sem Chrome). Toda a extração usa JS via
-        # execute_script, então o motor é indiferente para os dados.
+        # execute_script, então o motor é indiferente para os dados. 'auto' e
+        # 'http' caem aqui como Chrome (ver extrair_resultados).
         browser = os.getenv('ESCALA_BROWSER', 'chrome').lower()
         if browser == 'safari':
             print("🧭 Usando Safari (safaridriver) como backend...")
@@ -79,6 +124,7 @@ class ExtractorInteligente:
                 try:
                     self.driver = webdriver.Safari()
                     self.driver.set_window_size(1600, 1000)
+                    self.esperas = Esperas(self.driver)
                     return
                 except Exception as e:
                     ultima_excecao = e
@@ -153,6 +199,8 @@ class ExtractorInteligente:
             print("⚠️  Usando ChromeDriver padrão do sistema...")
             self.driver = webdriver.Chrome(options=chrome_options)
 
+        self.esperas = Esperas(self.driver)
+
     def salvar_diagnostico(self, prefixo):
         """Salva screenshot + HTML da página atual em /tmp para diagnóstico no CI."""
         try:
@@ -222,10 +270,14 @@ class ExtractorInteligente:
 
                 username.clear()
                 username.send_keys(ESCALA_USERNAME)
-                time.sleep(1)
                 password.clear()
                 password.send_keys(ESCALA_PASSWORD)
-                time.sleep(1)
+                # O AngularJS só habilita o "Entrar" depois do digest dos campos
+                self.esperas.ate(
+                    "login: campos preenchidos",
+                    lambda: username.get_attribute('value') and password.get_attribute('value'),
+                    timeout=5,
+                )
 
                 self.driver.execute_script(
                     "var buttons = document.querySelectorAll('button'); "
@@ -247,6 +299,24 @@ class ExtractorInteligente:
 
         raise RuntimeError(f"Login falhou após {tentativas} tentativas: {ultimo_erro}")
 
+    def sessao_valida(self, timeout=15):
+        """Sonda barata: abre a grade e vê para onde o SPA manda. Sessão
+        vencida cai em #!/login; sessão válida mostra o iframe da grade."""
+        self.driver.get("https://escala.med.br/painel/#!/day_grid")
+        self.esperas.ate(
+            "sessão: sonda da rota",
+            lambda: "#!/login" in self.driver.current_url
+            or self.driver.find_elements(By.TAG_NAME, "iframe"),
+            timeout=timeout,
+        )
+        return "#!/login" not in self.driver.current_url and bool(
+            self.driver.find_elements(By.TAG_NAME, "iframe"))
+
+    def entrar(self):
+        """Reaproveita a sessão salva da execução anterior (sessao_persistente)
+        e só faz o login completo se ela não existir ou tiver vencido."""
+        retomar_ou_entrar(self.driver, self.sessao_valida, self.login)
+
     def extrair_dia(self):
         """Extrai dados de um único dia (atual ou anterior) usando JavaScript"""
         # JavaScript que calcula setores por POSIÇÃO X
@@ -458,31 +528,22 @@ class ExtractorInteligente:
               }
               return false;
             """)
-            time.sleep(2)
+            self.esperas.ate(
+                "filtro: painel aberto",
+                lambda: self.driver.execute_script(_JS_CHECKBOX_CONTATO, False) is not None,
+                timeout=10,
+            )
 
             # Marca o checkbox de contato (por texto; fallback: 2º checkbox)
-            marcado = self.driver.execute_script(r"""
-              function rowText(c){
-                var n=c;
-                for(var i=0;i<6;i++){ if(!n) break;
-                  var t=(n.textContent||'').trim();
-                  if(t.length>3) return t.slice(0,70);
-                  n=n.parentElement;
-                }
-                return '';
-              }
-              var cbs=Array.from(document.querySelectorAll("input[type='checkbox']"));
-              for (var c of cbs){
-                if(rowText(c).toLowerCase().includes('contato')){
-                  if(!c.checked) c.click();
-                  return rowText(c);
-                }
-              }
-              if(cbs.length>1){ if(!cbs[1].checked) cbs[1].click(); return 'idx1'; }
-              return null;
-            """)
-            time.sleep(3)
-            print(f"[{datetime.now()}] 📞 Filtro de contato ativado: {marcado}")
+            estado = self.driver.execute_script(_JS_CHECKBOX_CONTATO, True)
+            self.esperas.ate(
+                "filtro: checkbox de contato marcado",
+                lambda: (self.driver.execute_script(_JS_CHECKBOX_CONTATO, False) or {}).get('marcado'),
+                timeout=10,
+            )
+            # Marcar o filtro faz a grade re-renderizar com telefone/email
+            self.esperas.dom_estavel("filtro: grade re-renderizada", timeout=10)
+            print(f"[{datetime.now()}] 📞 Filtro de contato ativado: {(estado or {}).get('rotulo')}")
 
             # Fecha o painel de Filtros para não cobrir a grade (clica de novo)
             self.driver.execute_script(r"""
@@ -490,52 +551,112 @@ class ExtractorInteligente:
                 if((e.textContent||'').trim()==='Filtros'){ e.click(); return; }
               }
             """)
-            time.sleep(2)
+            self.esperas.dom_estavel("filtro: painel fechado", timeout=5)
         except Exception as e:
             print(f"[{datetime.now()}] ⚠️  Não foi possível ativar filtro de contato: {e}")
 
-    def navegar_proximo_dia(self):
-        """Clica na seta '>' do cabeçalho de data para avançar 1 dia.
-        Retorna (data_antes, data_depois); se forem iguais, a navegação falhou."""
-        antes = self.driver.execute_script(r"""
-          for(var e of document.querySelectorAll('*')){
-            if(e.childElementCount===0){var t=(e.textContent||'').trim();
-              if(/^\d{1,2}\s+[A-Za-zçÇ]+\s+\d{4}$/.test(t)) return t;}
-          }
-          return null;
-        """)
+    def ler_data_cabecalho(self):
+        """Data textual mostrada no cabeçalho da grade, ou None."""
+        return self.driver.execute_script(_JS_DATA_CABECALHO)
+
+    def navegar_dia(self, direcao='frente'):
+        """Clica na seta '>' (direcao='frente') ou '<' (direcao='tras') do
+        cabeçalho de data. Retorna (data_antes, data_depois); se forem iguais,
+        a navegação falhou."""
+        antes = self.ler_data_cabecalho()
         self.driver.execute_script(r"""
+          var frente = arguments[0];
+          var seta = frente ? '>' : '<';
+          var aria_re = frente ? /next|forward|chevron.?right|arrow.?right|proxim/i
+                               : /prev|back|chevron.?left|arrow.?left|anterior/i;
           var cands=[];
           for(var e of document.querySelectorAll('button,span,div,i,svg,a')){
             var t=(e.textContent||'').trim();
             var aria=(e.getAttribute('aria-label')||'');
-            if(t==='>'||/next|forward|chevron.?right|arrow.?right|proxim/i.test(aria)){ cands.push(e); }
+            if(t===seta||aria_re.test(aria)){ cands.push(e); }
           }
           if(cands.length){ cands[cands.length-1].click(); }
-        """)
-        time.sleep(4)
-        depois = self.driver.execute_script(r"""
-          for(var e of document.querySelectorAll('*')){
-            if(e.childElementCount===0){var t=(e.textContent||'').trim();
-              if(/^\d{1,2}\s+[A-Za-zçÇ]+\s+\d{4}$/.test(t)) return t;}
-          }
-          return null;
-        """)
+        """, direcao == 'frente')
+        mudou = self.esperas.ate(
+            "navegação: data do cabeçalho mudou",
+            lambda: self.ler_data_cabecalho() not in (None, antes),
+            timeout=10,
+        )
+        if mudou:
+            # A data troca antes de a grade do novo dia terminar de chegar
+            self.esperas.pagina_pronta("navegação: grade do novo dia", timeout=15)
+        depois = self.ler_data_cabecalho()
         return antes, depois
 
-    def extrair_inteligente(self):
-        """Extrai dados do dia ATUAL e do dia SEGUINTE (via navegação).
-        O dia ANTERIOR é preenchido pela lógica de rolling window (cache)."""
-        print(f"[{datetime.now()}] 📊 Extraindo com análise de POSIÇÃO VISUAL (X coordinate)...")
+    def navegar_proximo_dia(self):
+        """Avança 1 dia. Retorna (data_antes, data_depois)."""
+        return self.navegar_dia('frente')
+
+    def ir_para_data(self, alvo):
+        """Leva a grade até a data `alvo` (date), seta a seta a partir do dia
+        aberto. O SPA não aceita data na URL do day_grid, então este é o
+        caminho; com as esperas por evento cada passo custa ~1s.
+        Devolve True se chegou."""
+        atual = data_do_texto(self.ler_data_cabecalho() or '')
+        if atual is None:
+            print(f"[{datetime.now()}] ⚠️  Data do cabeçalho ilegível; não dá para ir até {alvo}")
+            return False
+        passos = (alvo - atual).days
+        direcao = 'frente' if passos > 0 else 'tras'
+        for _ in range(abs(passos)):
+            antes, depois = self.navegar_dia(direcao)
+            if not antes or not depois or antes == depois:
+                print(f"[{datetime.now()}] ⚠️  Navegação travou em {antes!r} a caminho de {alvo}")
+                return False
+        return data_do_texto(self.ler_data_cabecalho() or '') == alvo
+
+    def reler_grade(self):
+        """Traz a grade JÁ ABERTA (iframe e filtro de contato como estão) de
+        volta a hoje sem recarregar a página. É a troca de dia que faz o SPA
+        buscar a grade de novo, então se ela já estiver em hoje sai e volta.
+        Devolve False se não der (o chamador reabre com abrir_grade())."""
+        hoje = datetime.now(timezone(timedelta(hours=-3))).date()
+        try:
+            aberto = data_do_texto(self.ler_data_cabecalho() or '')
+            if aberto is None:
+                return False
+            if aberto == hoje:
+                antes, depois = self.navegar_dia('frente')
+                if not antes or not depois or antes == depois:
+                    return False
+            return self.ir_para_data(hoje)
+        except Exception as e:
+            print(f"[{datetime.now()}] ⚠️  Não foi possível reler a grade aberta: {e}")
+            return False
 
+    def listar_endpoints_xhr(self):
+        """Imprime as chamadas XHR/fetch que o SPA fez até agora. É daqui que
+        saem os caminhos de ESCALA_API_LOGIN/ESCALA_API_DIA do backend HTTP
+        (extracao_http.py)."""
+        try:
+            chamadas = self.driver.execute_script(
+                "return performance.getEntriesByType('resource')"
+                ".filter(function(r){return r.initiatorType==='xmlhttprequest'||r.initiatorType==='fetch';})"
+                ".map(function(r){return r.name;});"
+            )
+            print(f"[{datetime.now()}] 🛰️  Chamadas XHR do SPA ({len(chamadas)}):")
+            for url in chamadas:
+                print(f"     - {url}")
+        except Exception as e:
+            print(f"[{datetime.now()}] ⚠️  Não foi possível listar XHR: {e}")
+
+    def abrir_grade(self):
+        """Abre a grade do dia (hoje), entra no iframe e liga o filtro de
+        contato. Pré-requisito de extrair_dia()."""
         self.driver.get("https://escala.med.br/painel/#!/day_grid")
-        time.sleep(5)
+        self.esperas.pagina_pronta("day_grid carregado", timeout=20)
 
         # Switch iframe
         try:
             iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
             if iframes:
                 self.driver.switch_to.frame(iframes[0])
+                self.esperas.pagina_pronta("iframe da grade carregado", timeout=15)
         except:
             pass
 
@@ -543,6 +664,48 @@ class ExtractorInteligente:
         # Sem este filtro o site não renderiza telefone/email nos cards.
         self.ativar_filtro_contato()
 
+        if os.getenv('ESCALA_LISTAR_XHR'):
+            self.listar_endpoints_xhr()
+
+    def extrair_intervalo(self, n_dias, direcao='frente', abrir=True):
+        """Extrai `n_dias` dias consecutivos numa única sessão, a partir do dia
+        aberto na grade (hoje, se abrir=True), andando para 'frente' ou para
+        'tras'. Devolve uma lista com o resultado de extrair_dia() de cada dia,
+        na ordem visitada. Para antes do fim se a navegação travar."""
+        if direcao not in ('frente', 'tras'):
+            raise ValueError(f"direcao deve ser 'frente' ou 'tras', não {direcao!r}")
+        if abrir:
+            self.abrir_grade()
+
+        dias = []
+        for i in range(n_dias):
+            resultado = self.extrair_dia()
+            dias.append(resultado)
+            print(f"[{datetime.now()}] 📅 {resultado['data']:<22} | {resultado['total']:3d} registros "
+                  f"({i + 1}/{n_dias})")
+            if i == n_dias - 1:
+                break
+            antes, depois = self.navegar_dia(direcao)
+            if not antes or not depois or antes == depois:
+                print(f"[{datetime.now()}] ⚠️  Navegação travou em {antes!r}; "
+                      f"encerrando com {len(dias)} dia(s).")
+                break
+
+        print(self.esperas.relatorio())
+        return dias
+
+    def extrair_inteligente(self, abrir=True):
+        """Extrai dados do dia ATUAL e do dia SEGUINTE (via navegação).
+        O dia ANTERIOR é preenchido pela lógica de rolling window (cache).
+        abrir=False reaproveita a grade já aberta por uma extração anterior
+        (reler_grade), como faz o daemon; se ela não responder, reabre."""
+        print(f"[{datetime.now()}] 📊 Extraindo com análise de POSIÇÃO VISUAL (X coordinate)...")
+        if not abrir and not self.reler_grade():
+            print(f"[{datetime.now()}] ⚠️  Grade aberta não respondeu; reabrindo...")
+            abrir = True
+        if abrir:
+            self.abrir_grade()
+
         # ===== EXTRAÇÃO DO DIA ATUAL =====
         print(f"[{datetime.now()}] 📅 Extraindo dados do dia ATUAL...")
         resultado_atual = self.extrair_dia()
@@ -561,6 +724,8 @@ class ExtractorInteligente:
         except Exception as e:
             print(f"[{datetime.now()}] ⚠️  Erro ao extrair dia seguinte: {e}")
 
+        print(self.esperas.relatorio())
+
         return {
             'atual': resultado_atual,
             'seguinte': resultado_seguinte,
@@ -571,69 +736,94 @@ class ExtractorInteligente:
         self.driver.quit()
 
 
-def corrigir_portugues(texto):
-    """Corrige erros comuns de ortografia em textos extraídos do website"""
-    if not texto:
-        return texto
-
-    # Mapa de correções (errado → correto)
-    correcoes = {
-        'Residencia': 'Residência',
-        'Clinica': 'Clínica',
-        'Clinica Médica': 'Clínica Médica',
-        'Obstetrícia': 'Obstetrícia',  # Já está certo, mas por segurança
-        # A UTI Adulto IV foi cadastrada na origem com "intensiva" minúsculo.
-        # Sem isto ela ordena depois de todas as outras UTIs (o sort compara
-        # código de caractere: 'I' < 'i') e aparece longe das irmãs.
-        'Terapia intensiva': 'Terapia Intensiva',
+MESES_PT = {
+    'janeiro': 1, 'fevereiro': 2, 'março': 3, 'abril': 4,
+    'maio': 5, 'junho': 6, 'julho': 7, 'agosto': 8,
+    'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12
+}
+
+
+def data_do_texto(data_texto):
+    """'03 novembro 2025' -> date(2025, 11, 3); None se não reconhecer."""
+    try:
+        partes = data_texto.split()
+        return date(int(partes[2]), MESES_PT[partes[1].lower()], int(partes[0]))
+    except Exception:
+        return None
+
+
+def extrair_data_simples(data_texto):
+    """'03 novembro 2025' -> '03/11/2025' ('00/00/0000' se não reconhecer)."""
+    dia = data_do_texto(data_texto)
+    return dia.strftime('%d/%m/%Y') if dia else "00/00/0000"
+
+
+def montar_bloco(resultado):
+    """Resultado bruto de extrair_dia() -> bloco de um dia no JSON de saída
+    ({'data', 'data_simples', 'registros', 'total'}), com registros normalizados."""
+    for reg in resultado['registros']:
+        normalizar_registro(reg)
+    return {
+        'data': resultado['data'],
+        'data_simples': extrair_data_simples(resultado['data']),
+        'registros': resultado['registros'],
+        'total': len(resultado['registros'])
     }
 
-    resultado = texto
-    for errado, correto in correcoes.items():
-        resultado = resultado.replace(errado, correto)
 
-    return resultado
+def extrair_resultados(headless=True):
+    """Escolhe o backend de extração pelo ESCALA_BROWSER e devolve o
+    {'atual', 'seguinte', 'anterior'} bruto.
+
+    - 'http': só a API (extracao_http.py); falha se ela falhar.
+    - 'auto' (padrão): API se ESCALA_API_DIA estiver configurado, senão — ou se
+      a API falhar/vier vazia — o navegador (Chrome).
+    - 'chrome' / 'safari': só o navegador, como antes.
+
+    Antes de subir um navegador próprio, se ESCALA_DAEMON_URL estiver definido,
+    pede o snapshot ao extrator residente (daemon_extracao.py).
+    """
+    backend = os.getenv('ESCALA_BROWSER', 'auto').lower()
 
+    if backend == 'http' or backend == 'auto':
+        from extracao_http import ExtractorHTTP, api_configurada
 
-# A origem começou a anexar " - ESCALA MÉDICA" (e variações de caixa) ao nome de
-# alguns setores. O sufixo não diz nada ao leitor e quebrava o casamento com as
-# tabelas de ramais e de impressão, que guardam o nome limpo.
-_SUFIXO_ESCALA_MEDICA = re.compile(r'\s*[-–]\s*escala\s+m[eé]dica\s*$', re.IGNORECASE)
+        if backend == 'http' or api_configurada():
+            extractor = ExtractorHTTP()
+            try:
+                extractor.login()
+                resultados = extractor.extrair_inteligente()
+                if resultados['atual']['total'] > 0 or backend == 'http':
+                    return resultados
+                print("⚠️  Backend HTTP não trouxe registros; usando o navegador...")
+            except Exception as e:
+                if backend == 'http':
+                    raise
+                print(f"⚠️  Backend HTTP falhou ({type(e).__name__}: {e}); usando o navegador...")
+            finally:
+                extractor.close()
 
+    if os.getenv('ESCALA_DAEMON_URL') and backend != 'safari':
+        from daemon_extracao import pedir_snapshot
 
-def normalizar_setor(texto):
-    """Nome de setor pronto para exibir: ortografia corrigida e sem o sufixo
-    administrativo que o escala.med.br anexa."""
-    if not texto:
-        return texto
-    return _SUFIXO_ESCALA_MEDICA.sub('', corrigir_portugues(texto)).strip()
+        try:
+            resultados = pedir_snapshot()
+            print(f"♨️  Snapshot recebido do daemon ({resultados['atual']['total']} registros)")
+            return resultados
+        except Exception as e:
+            print(f"⚠️  Daemon indisponível ({type(e).__name__}: {e}); subindo navegador próprio...")
 
-def main():
-    extractor = None
+    extractor = ExtractorInteligente(headless=headless)
     try:
-        extractor = ExtractorInteligente(headless=True)
-        extractor.login()
-        resultados = extractor.extrair_inteligente()
+        extractor.entrar()
+        return extractor.extrair_inteligente()
+    finally:
+        extractor.close()
 
-        # Extrai data simples (DD/MM/YYYY) a partir da data em português
-        def extrair_data_simples(data_texto):
-            try:
-                # Tenta converter "03 novembro 2025" para "03/11/2025"
-                partes = data_texto.split()
-                if len(partes) >= 3:
-                    dia = partes[0].zfill(2)
-                    ano = partes[2]
-
-                    meses = {
-                        'janeiro': '01', 'fevereiro': '02', 'março': '03', 'abril': '04',
-                        'maio': '05', 'junho': '06', 'julho': '07', 'agosto': '08',
-                        'setembro': '09', 'outubro': '10', 'novembro': '11', 'dezembro': '12'
-                    }
-                    mes = meses.get(partes[1].lower(), '01')
-                    return f"{dia}/{mes}/{ano}"
-            except:
-                pass
-            return "00/00/0000"
+
+def main():
+    try:
+        resultados = extrair_resultados(headless=True)
 
         # ===== PROCESSA RESULTADO ATUAL =====
         resultado_atual = resultados['atual']
@@ -644,7 +834,7 @@ def main():
 
         # Corrige erros de português nos registros atuais
         for reg in registros_atual:
-            reg['setor'] = normalizar_setor(reg['setor'])
+            normalizar_registro(reg)
 
         # Debug info do JavaScript (atual)
         debug_info_atual = resultado_atual.get('debug', {})
@@ -851,7 +1041,7 @@ def main():
             # na leitura evita que o dashboard mostre o mesmo setor com dois nomes
             # ao navegar entre os dias.
             for reg in resultado_anterior_salvo.get('registros', []):
-                reg['setor'] = normalizar_setor(reg['setor'])
+                normalizar_registro(reg)
             output['anterior'] = resultado_anterior_salvo
         else:
             # Primeira execução ou arquivo perdido
@@ -865,14 +1055,7 @@ def main():
         # Adiciona dados do dia seguinte (extraído ao vivo navegando +1 dia)
         resultado_seguinte = resultados.get('seguinte')
         if resultado_seguinte and resultado_seguinte.get('registros'):
-            for reg in resultado_seguinte['registros']:
-                reg['setor'] = normalizar_setor(reg['setor'])
-            output['seguinte'] = {
-                'data': resultado_seguinte['data'],
-                'data_simples': extrair_data_simples(resultado_seguinte['data']),
-                'registros': resultado_seguinte['registros'],
-                'total': len(resultado_seguinte['registros'])
-            }
+            output['seguinte'] = montar_bloco(resultado_seguinte)
         else:
             output['seguinte'] = {
                 'data': 'N/A',
@@ -956,10 +1139,86 @@ def main():
         print(f"❌ ERRO: {e}")
         import traceback
         traceback.print_exc()
+
+
+BLOCO_VAZIO = {'data': 'N/A', 'data_simples': '00/00/0000', 'registros': [], 'total': 0}
+
+
+def salvar_historico_intervalo(blocos, pasta='data/historico'):
+    """Grava um snapshot por dia em data/historico/AAAA-MM-DD.json, no mesmo
+    formato (compacto) do snapshot diário, SEM sobrescrever dias que já existem.
+    Os vizinhos do próprio intervalo viram 'anterior'/'seguinte'.
+    Devolve a lista de arquivos gravados."""
+    ramais_data, mapping_data = carregar_ramais_data()
+    agora = datetime.now(timezone(timedelta(hours=-3)))
+    por_data = {data_do_texto(b['data']): b for b in blocos if data_do_texto(b['data'])}
+
+    os.makedirs(pasta, exist_ok=True)
+    gravados = []
+    for dia, bloco in sorted(por_data.items()):
+        destino = os.path.join(pasta, f"{dia.isoformat()}.json")
+        if os.path.exists(destino):
+            print(f"   ⏭️  {destino} já existe; mantido")
+            continue
+        snapshot = {
+            'atual': bloco,
+            'data_atualizacao': agora.strftime('%d/%m/%Y'),
+            'hora_atualizacao': agora.strftime('%H:%M'),
+            'status_atualizacao': 'sucesso',
+            'anterior': por_data.get(dia - timedelta(days=1), BLOCO_VAZIO),
+            'seguinte': por_data.get(dia + timedelta(days=1), BLOCO_VAZIO),
+        }
+        if ramais_data:
+            snapshot['ramais_hro'] = ramais_data
+        if mapping_data:
+            snapshot['setor_ramais_mapping'] = mapping_data
+        salvar_snapshot(snapshot, destino)
+        gravados.append(destino)
+        print(f"   ✅ Snapshot salvo: {destino}")
+    return gravados
+
+
+def main_intervalo(n_dias, direcao='frente', salvar_historico=False,
+                   saida='/tmp/extracao_intervalo.json'):
+    """Modo lote: N dias numa única sessão logada, um bloco por dia."""
+    extractor = ExtractorInteligente(headless=True)
+    try:
+        extractor.entrar()
+        blocos = [montar_bloco(r) for r in extractor.extrair_intervalo(n_dias, direcao)]
     finally:
-        if extractor:
-            extractor.close()
+        extractor.close()
+
+    with open(saida, 'w') as f:
+        json.dump({
+            'direcao': direcao,
+            'gerado_em': datetime.now(timezone(timedelta(hours=-3))).strftime('%d/%m/%Y %H:%M'),
+            'dias': blocos,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ {len(blocos)} dia(s) salvos em: {saida}")
+
+    if salvar_historico:
+        print("📁 Preenchendo data/historico/...")
+        salvar_historico_intervalo(blocos)
+    return 0 if blocos else 1
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Extração da escala do HRO")
+    parser.add_argument('--dias', type=int, default=0,
+                        help="modo lote: extrai N dias numa única sessão (sem rolling window)")
+    parser.add_argument('--direcao', choices=('frente', 'tras'), default='frente',
+                        help="sentido da navegação no modo lote (padrão: frente)")
+    parser.add_argument('--salvar-historico', action='store_true',
+                        help="no modo lote, grava em data/historico/ os dias que faltam")
+    parser.add_argument('--daemon', action='store_true',
+                        help="modo residente: navegador logado servindo snapshots (daemon_extracao.py)")
+    args = parser.parse_args()
+
+    if args.daemon:
+        from daemon_extracao import servir
+        raise SystemExit(servir())
+    if args.dias > 0:
+        raise SystemExit(main_intervalo(args.dias, args.direcao, args.salvar_historico))
     main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Extração de um intervalo de datas (backfill de data/historico/), em paralelo
+quando dá.
+
+Só o backend HTTP (extracao_http.py, com ESCALA_API_DIA configurado) é de fato
+paralelo: a API recebe a data, então cada dia é um GET independente. Um único
+login; o intervalo é dividido em K fatias contíguas e cada uma vai para uma
+thread, todas na mesma sessão.
+
+Pelo navegador NÃO há ganho em paralelizar: o SPA não aceita data na URL e a
+grade abre sempre em hoje, andando um dia por clique. Cada um de K navegadores
+teria de andar de hoje até a sua fatia — o da fatia mais distante anda tanto
+quanto uma varredura sequencial —, com K logins simultâneos na mesma conta e no
+mesmo arquivo de sessão (sessao_persistente.py). Então o navegador faz UMA
+varredura: vai até a ponta do intervalo mais perto de hoje e extrai dali em
+direção à outra (percorrer_fatia); --workers é ignorado, com aviso.
+
+Os dias são mesclados em ordem de data, sem depender de qual thread terminou
+primeiro. Uma fatia que falha é relatada com o erro (e os dias dela como
+faltantes), sem derrubar as outras.
+
+Uso:
+    python3 extracao_paralela.py 2026-07-01 2026-07-30 --workers 3
+    python3 extracao_paralela.py 2026-08-16 2026-08-17 --salvar-historico
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+
+SAIDA = '/tmp/extracao_intervalo.json'
+FUSO = timezone(timedelta(hours=-3))
+
+
+def dividir_intervalo(inicio, fim, k):
+    """Fatias contíguas [(primeiro_dia, n_dias), ...] cobrindo inicio..fim
+    (inclusive), com tamanhos que diferem no máximo em 1 dia. Nunca devolve
+    mais fatias que dias."""
+    total = (fim - inicio).days + 1
+    if total <= 0:
+        return []
+    k = max(1, min(k, total))
+    base, sobra = divmod(total, k)
+    fatias = []
+    dia = inicio
+    for i in range(k):
+        n = base + (1 if i < sobra else 0)
+        fatias.append((dia, n))
+        dia += timedelta(days=n)
+    return fatias
+
+
+def plano_da_fatia(fatia, hoje):
+    """(dia_de_partida, direcao) da fatia (primeiro_dia, n_dias) para uma
+    grade aberta em `hoje`: parte da ponta mais perto de hoje e anda para a
+    outra. Em empate (ou com hoje no meio) vale a primeira ponta, para frente."""
+    primeiro, n_dias = fatia
+    ultimo = primeiro + timedelta(days=n_dias - 1)
+    if abs((ultimo - hoje).days) < abs((primeiro - hoje).days):
+        return ultimo, 'tras'
+    return primeiro, 'frente'
+
+
+def percorrer_fatia(extractor, fatia, hoje):
+    """Extrai a fatia com um extractor já com a grade aberta em `hoje`,
+    segundo plano_da_fatia(). Devolve os resultados de extrair_dia() (na ordem
+    visitada) ou None se não chegou ao dia de partida."""
+    partida, direcao = plano_da_fatia(fatia, hoje)
+    if not extractor.ir_para_data(partida):
+        return None
+    return extractor.extrair_intervalo(fatia[1], direcao, abrir=False)
+
+
+def _chave_data(bloco):
+    try:
+        return datetime.strptime(bloco.get('data_simples', ''), '%d/%m/%Y').date()
+    except ValueError:
+        return None
+
+
+def mesclar(resultados_por_fatia):
+    """Junta os blocos de todas as fatias em ordem de data. Se duas fatias
+    trouxerem o mesmo dia, fica o da fatia que começa antes. Blocos sem data
+    reconhecível são descartados."""
+    por_data = {}
+    for blocos in resultados_por_fatia:
+        for bloco in blocos:
+            dia = _chave_data(bloco)
+            if dia is not None and dia not in por_data:
+                por_data[dia] = bloco
+    return [por_data[d] for d in sorted(por_data)]
+
+
+def extrair_fatia_http(extractor, fatia):
+    """Resultados de extrair_dia() de cada dia da fatia, pedidos direto pela
+    data (sem navegação)."""
+    primeiro, n_dias = fatia
+    return [extractor.extrair_dia(primeiro + timedelta(days=i)) for i in range(n_dias)]
+
+
+def extrair_fatias_http(extractor, fatias):
+    """Fatias em threads, com um extractor HTTP já logado. Devolve
+    (resultados_por_fatia, falhas): resultados na ordem das fatias ([] para
+    as que falharam) e falhas = [(fatia, mensagem), ...]."""
+    with ThreadPoolExecutor(max_workers=max(1, len(fatias))) as pool:
+        futuros = [pool.submit(extrair_fatia_http, extractor, fatia) for fatia in fatias]
+    resultados, falhas = [], []
+    for fatia, futuro in zip(fatias, futuros):
+        try:
+            resultados.append(futuro.result())
+        except Exception as e:
+            resultados.append([])
+            falhas.append((fatia, f"{type(e).__name__}: {e}"))
+    return resultados, falhas
+
+
+def _extrair_http(inicio, fim, workers):
+    from extracao_http import ExtractorHTTP
+    from extracao_inteligente import montar_bloco
+
+    fatias = dividir_intervalo(inicio, fim, workers)
+    print(f"🧵 {len(fatias)} thread(s) HTTP para {(fim - inicio).days + 1} dia(s):")
+    for primeiro, n in fatias:
+        print(f"   - {primeiro} … {primeiro + timedelta(days=n - 1)} ({n}d)")
+    extractor = ExtractorHTTP()
+    try:
+        extractor.login()
+        resultados, falhas = extrair_fatias_http(extractor, fatias)
+    finally:
+        extractor.close()
+    return mesclar([[montar_bloco(r) for r in fatia] for fatia in resultados]), falhas
+
+
+def _extrair_navegador(inicio, fim):
+    """Uma varredura só, num navegador. Levanta exceção se não chegar ao dia
+    de partida ou se a extração falhar."""
+    from extracao_inteligente import ExtractorInteligente, data_do_texto, montar_bloco
+
+    fatia = (inicio, (fim - inicio).days + 1)
+    extractor = ExtractorInteligente(headless=True)
+    try:
+        extractor.entrar()
+        extractor.abrir_grade()
+        hoje = data_do_texto(extractor.ler_data_cabecalho() or '') or datetime.now(FUSO).date()
+        partida, direcao = plano_da_fatia(fatia, hoje)
+        print(f"🧭 Navegador: {abs((partida - hoje).days)} passo(s) até {partida}, "
+              f"depois {fatia[1]} dia(s) para {direcao}")
+        resultados = percorrer_fatia(extractor, fatia, hoje)
+        if resultados is None:
+            raise RuntimeError(f"navegação não chegou a {partida}")
+        return mesclar([[montar_bloco(r) for r in resultados]])
+    finally:
+        extractor.close()
+
+
+def extrair_em_paralelo(inicio, fim, workers=3, http=None):
+    """(blocos, falhas) do intervalo inicio..fim. http=None: usa o backend
+    HTTP se a API estiver configurada. Sem ele, uma varredura só pelo
+    navegador (ver o topo do módulo)."""
+    if http is None:
+        from extracao_http import api_configurada
+        http = api_configurada()
+    if http:
+        return _extrair_http(inicio, fim, workers)
+    if workers > 1:
+        print(f"⚠️  Sem ESCALA_API_DIA não há paralelismo: o navegador anda um dia por vez a partir "
+              f"de hoje; --workers {workers} ignorado, uma varredura só")
+    try:
+        return _extrair_navegador(inicio, fim), []
+    except Exception as e:
+        return [], [((inicio, (fim - inicio).days + 1), f"{type(e).__name__}: {e}")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extração de um intervalo de datas (paralela via HTTP)")
+    parser.add_argument('inicio', type=date.fromisoformat, help="primeiro dia (AAAA-MM-DD)")
+    parser.add_argument('fim', type=date.fromisoformat, help="último dia (AAAA-MM-DD), inclusive")
+    parser.add_argument('--workers', type=int, default=3,
+                        help="threads do backend HTTP (padrão: 3); o navegador faz uma varredura só")
+    parser.add_argument('--salvar-historico', action='store_true',
+                        help="grava em data/historico/ os dias que faltam")
+    args = parser.parse_args()
+
+    if args.fim < args.inicio:
+        parser.error("fim antes do início")
+
+    from extracao_http import api_configurada
+    http = api_configurada()
+    blocos, falhas = extrair_em_paralelo(args.inicio, args.fim, args.workers, http=http)
+    for (primeiro, n), erro in falhas:
+        print(f"❌ {primeiro} … {primeiro + timedelta(days=n - 1)} ({n}d) falhou: {erro}")
+
+    esperados = {args.inicio + timedelta(days=i) for i in range((args.fim - args.inicio).days + 1)}
+    faltando = sorted(esperados - {_chave_data(b) for b in blocos})
+
+    with open(SAIDA, 'w') as f:
+        json.dump({
+            'intervalo': [args.inicio.isoformat(), args.fim.isoformat()],
+            'backend': 'http' if http else 'navegador',
+            'gerado_em': datetime.now(FUSO).strftime('%d/%m/%Y %H:%M'),
+            'dias': blocos,
+            'falhas': [{'inicio': p.isoformat(), 'dias': n, 'erro': erro} for (p, n), erro in falhas],
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ {len(blocos)} dia(s) salvos em: {SAIDA}")
+    if faltando:
+        print(f"⚠️  {len(faltando)} dia(s) sem dados: {', '.join(d.isoformat() for d in faltando)}")
+
+    if args.salvar_historico and blocos:
+        from extracao_inteligente import salvar_historico_intervalo
+        print("📁 Preenchendo data/historico/...")
+        salvar_historico_intervalo(blocos)
+
+    return 0 if not faltando and not falhas else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
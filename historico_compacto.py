@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Formato COMPACTO dos snapshots de data/historico/.
+
+O snapshot diário era uma cópia do /tmp/extracao_inteligente.json: ~124 KB
+indentados, com as tabelas de ramais e de mapeamento de setores inteiras em
+todo arquivo e cada registro repetindo as mesmas strings. No formato compacto:
+
+- todas as strings dos registros dos três dias vão para UMA tabela
+  ('strings') e os registros viram linhas de índices ('colunas' + 'linhas');
+- ramais_hro e setor_ramais_mapping são gravados uma única vez em
+  data/historico/ref/<hash>.json e o snapshot guarda só {'$ref': <hash>};
+- JSON sem indentação.
+
+O nome do arquivo não muda (AAAA-MM-DD.json) e ler_snapshot() devolve sempre o
+formato antigo, seja qual for o do arquivo — os snapshots existentes não
+precisam ser convertidos.
+
+Uso:
+    python3 historico_compacto.py salvar /tmp/extracao_inteligente.json data/historico/2026-08-23.json
+    python3 historico_compacto.py ler data/historico/2026-08-23.json
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+FORMATO = 'historico-compacto/1'
+DIAS = ('anterior', 'atual', 'seguinte')
+TABELAS_REF = ('ramais_hro', 'setor_ramais_mapping')
+PASTA_REF = 'ref'
+
+
+def _json_canonico(obj):
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+
+
+def _gravar_ref(tabela, pasta_ref):
+    """Grava a tabela em ref/<hash>.json (se ainda não existir) e devolve o hash."""
+    texto = _json_canonico(tabela)
+    chave = hashlib.sha256(texto.encode('utf-8')).hexdigest()[:16]
+    destino = Path(pasta_ref) / f"{chave}.json"
+    if not destino.exists():
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        destino.write_text(texto, encoding='utf-8')
+    return chave
+
+
+def _ler_ref(chave, pasta_ref):
+    with open(Path(pasta_ref) / f"{chave}.json", 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _compactar_bloco(bloco, strings, indice):
+    def idx(texto):
+        if texto not in indice:
+            indice[texto] = len(strings)
+            strings.append(texto)
+        return indice[texto]
+
+    registros = bloco.get('registros') or []
+    colunas = []
+    for r in registros:
+        for k in r:
+            if k not in colunas:
+                colunas.append(k)
+    # Coluna de strings vira índice na tabela; o resto (pos_x) vai cru
+    texto = [all(isinstance(r.get(c), str) for r in registros if c in r) for c in colunas]
+    linhas = [
+        [(idx(r[c]) if t else r[c]) if c in r else None for c, t in zip(colunas, texto)]
+        for r in registros
+    ]
+    compacto = {k: v for k, v in bloco.items() if k != 'registros'}
+    compacto['colunas'] = colunas
+    compacto['colunas_texto'] = [c for c, t in zip(colunas, texto) if t]
+    compacto['linhas'] = linhas
+    return compacto
+
+
+def _expandir_bloco(compacto, strings):
+    colunas = compacto['colunas']
+    texto = set(compacto['colunas_texto'])
+    bloco = {k: v for k, v in compacto.items() if k not in ('colunas', 'colunas_texto', 'linhas')}
+    bloco['registros'] = [
+        {c: (strings[v] if c in texto else v) for c, v in zip(colunas, linha) if v is not None}
+        for linha in compacto['linhas']
+    ]
+    return bloco
+
+
+def compactar(escala, pasta_ref):
+    """Snapshot no formato compacto (grava as tabelas de referência em pasta_ref)."""
+    strings, indice = [], {}
+    compacto = {'formato': FORMATO}
+    for chave, valor in escala.items():
+        if chave in DIAS and isinstance(valor, dict):
+            compacto[chave] = _compactar_bloco(valor, strings, indice)
+        elif chave in TABELAS_REF and valor:
+            compacto[chave] = {'$ref': _gravar_ref(valor, pasta_ref)}
+        else:
+            compacto[chave] = valor
+    compacto['strings'] = strings
+    return compacto
+
+
+def expandir(compacto, pasta_ref):
+    """Reconstrói o snapshot no formato original."""
+    if compacto.get('formato') != FORMATO:
+        return compacto
+    strings = compacto['strings']
+    escala = {}
+    for chave, valor in compacto.items():
+        if chave in ('formato', 'strings'):
+            continue
+        if chave in DIAS and isinstance(valor, dict):
+            escala[chave] = _expandir_bloco(valor, strings)
+        elif chave in TABELAS_REF and isinstance(valor, dict) and '$ref' in valor:
+            escala[chave] = _ler_ref(valor['$ref'], pasta_ref)
+        else:
+            escala[chave] = valor
+    return escala
+
+
+def ler_snapshot(caminho):
+    """Snapshot de data/historico/ no formato original, qualquer que seja o do arquivo."""
+    caminho = Path(caminho)
+    with open(caminho, 'r', encoding='utf-8') as f:
+        dados = json.load(f)
+    return expandir(dados, caminho.parent / PASTA_REF)
+
+
+def salvar_snapshot(escala, caminho):
+    """Grava `escala` em `caminho` no formato compacto. Se a ida e volta não
+    reproduzir o original (registro com valor nulo, por exemplo), grava no
+    formato antigo — nunca perde dado. Devolve o tamanho gravado em bytes."""
+    caminho = Path(caminho)
+    pasta_ref = caminho.parent / PASTA_REF
+    compacto = compactar(escala, pasta_ref)
+    if expandir(compacto, pasta_ref) == escala:
+        texto = json.dumps(compacto, ensure_ascii=False, separators=(',', ':'))
+    else:
+        print(f"⚠️  {caminho.name}: ida e volta do formato compacto divergiu; gravando formato completo")
+        texto = json.dumps(escala, ensure_ascii=False, indent=2)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    temporario = caminho.with_name(f"{caminho.name}.tmp")
+    temporario.write_text(texto + '\n', encoding='utf-8')
+    os.replace(temporario, caminho)
+    return len((texto + '\n').encode('utf-8'))
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == 'salvar':
+        with open(sys.argv[2], 'r', encoding='utf-8') as f:
+            escala = json.load(f)
+        tamanho = salvar_snapshot(escala, sys.argv[3])
+        original = os.path.getsize(sys.argv[2])
+        print(f"✅ Snapshot compacto salvo: {sys.argv[3]} ({tamanho / 1024:.1f} KB; "
+              f"original {original / 1024:.1f} KB)")
+        return 0
+    if len(sys.argv) == 3 and sys.argv[1] == 'ler':
+        print(json.dumps(ler_snapshot(sys.argv[2]), ensure_ascii=False, indent=2))
+        return 0
+    print(__doc__)
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Consultas sobre o histórico publicado (data/historico/).
+
+Monta, a partir dos snapshots diários, uma tabela de plantões — um por
+profissional/setor/turno/dia — com índices por profissional, setor, tipo de
+turno (o mesmo do dashboard: matutino, vespertino, noturno, 24h...) e data.
+
+Qual versão de cada dia vale: a do próprio dia (o 'atual' do snapshot
+AAAA-MM-DD.json). Se o snapshot do dia não existir, o mais recente que trouxer
+aquela data como 'anterior'/'seguinte'.
+
+O índice fica em cache em data/.cache/historico_indice.json (fora do git).
+O cache guarda os plantões extraídos de cada snapshot junto com o mtime e o
+tamanho do arquivo; numa consulta, só os snapshots novos ou alterados desde o
+último uso são relidos. O setor e o turno passam por normalizar_registro
+(normalizacao.py), como no diff, e o tipo de cada plantão vem das regras de
+dashboard_logic.py; o cache também é chaveado pelo hash do código desses dois
+módulos: mudou a regra, tudo é relido.
+
+Uso:
+    python3 historico_consulta.py turnos --profissional "Ana Catarina" --mes 2026-07
+    python3 historico_consulta.py turnos --setor "UTI Adulto II" --tipo noturno --de 2026-08-01 --ate 2026-08-31
+    python3 historico_consulta.py cobertura --setor "UTI Adulto II" --tipo noturno --mes 2026-08
+"""
+
+import argparse
+import bisect
+import calendar
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from datetime import date, datetime
+from pathlib import Path
+
+import dashboard_logic
+import normalizacao
+from dashboard_logic import obter_tipo_turno
+from historico_compacto import ler_snapshot
+from normalizacao import normalizar_registro
+
+BASE_DIR = Path(__file__).parent
+HISTORICO = BASE_DIR / 'data' / 'historico'
+CACHE = BASE_DIR / 'data' / '.cache' / 'historico_indice.json'
+VERSAO_CACHE = 1
+# Regras que dão o setor, o turno e o 'tipo' guardados no cache
+CLASSIFICADOR = hashlib.sha256(b''.join(
+    Path(m.__file__).read_bytes() for m in (dashboard_logic, normalizacao))).hexdigest()
+
+# Posições da janela lidas de cada snapshot
+POSICOES = ('atual', 'anterior', 'seguinte')
+APELIDOS_TIPO = {'24h': 'badge-24h'}
+CAMPOS = ('data', 'profissional', 'setor', 'tipo_turno', 'horario', 'tipo')
+
+
+def normalizar(texto):
+    """Minúsculas, sem acento e sem espaços repetidos (para busca)."""
+    texto = unicodedata.normalize('NFKD', texto or '')
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return ' '.join(texto.lower().split())
+
+
+def _palavras(texto):
+    return re.findall(r'[a-z0-9]+', normalizar(texto))
+
+
+def casa(termo, texto):
+    """Toda palavra do termo aparece no texto — igual, ou como começo de
+    palavra se tiver 3+ letras. "uti adulto ii" casa com "Unidade de Terapia
+    Intensiva (UTI) Adulto II" mas não com "... Adulto III"."""
+    palavras = _palavras(texto)
+    for p in _palavras(termo):
+        if not any(w == p or (len(p) >= 3 and w.startswith(p)) for w in palavras):
+            return False
+    return True
+
+
+def _data_iso(data_simples):
+    try:
+        return datetime.strptime(data_simples or '', '%d/%m/%Y').date().isoformat()
+    except ValueError:
+        return None
+
+
+def _plantoes_do_snapshot(caminho):
+    """{posição: (data_iso, [linhas])} de um snapshot. Linha = tupla CAMPOS.
+    Snapshots antigos trazem o setor e o turno como a origem escrevia na época;
+    eles são normalizados (em cópias) para que um setor não se divida em dois."""
+    escala = ler_snapshot(caminho)
+    blocos = {}
+    for posicao in POSICOES:
+        bloco = escala.get(posicao) or {}
+        data = _data_iso(bloco.get('data_simples'))
+        if not data or not bloco.get('registros'):
+            continue
+        registros = [normalizar_registro(dict(r, setor=r.get('setor', ''))) for r in bloco['registros']]
+        blocos[posicao] = (data, [
+            [data, r.get('profissional', ''), r.get('setor', ''), r.get('tipo_turno', ''),
+             r.get('horario', ''), obter_tipo_turno(r.get('tipo_turno', ''), r.get('horario', ''))]
+            for r in registros
+        ])
+    return blocos
+
+
+class HistoricoConsulta:
+    def __init__(self, pasta=HISTORICO, cache=CACHE):
+        self.pasta = Path(pasta)
+        self.cache = Path(cache) if cache else None
+        self.relidos = 0
+        self._carregar()
+        self._indexar()
+
+    # ---- cache por arquivo ----
+
+    def _ler_cache(self):
+        if not self.cache or not self.cache.exists():
+            return {}
+        try:
+            with open(self.cache, 'r', encoding='utf-8') as f:
+                dados = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if (dados.get('versao') != VERSAO_CACHE or dados.get('classificador') != CLASSIFICADOR
+                or dados.get('pasta') != str(self.pasta.resolve())):
+            return {}
+        return dados.get('arquivos', {})
+
+    def _carregar(self):
+        anteriores = self._ler_cache()
+        self.arquivos = {}
+        for caminho in sorted(self.pasta.glob('*.json')):
+            st = caminho.stat()
+            assinatura = [st.st_mtime_ns, st.st_size]
+            em_cache = anteriores.get(caminho.name)
+            if em_cache and em_cache['assinatura'] == assinatura:
+                self.arquivos[caminho.name] = em_cache
+                continue
+            try:
+                blocos = _plantoes_do_snapshot(caminho)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"⚠️  {caminho.name} ilegível ({type(e).__name__}); ignorado", file=sys.stderr)
+                blocos = {}
+            self.arquivos[caminho.name] = {'assinatura': assinatura, 'blocos': blocos}
+            self.relidos += 1
+
+        if self.cache and (self.relidos or set(anteriores) != set(self.arquivos)):
+            self.cache.parent.mkdir(parents=True, exist_ok=True)
+            temporario = self.cache.with_name(f"{self.cache.name}.{os.getpid()}.tmp")
+            with open(temporario, 'w', encoding='utf-8') as f:
+                json.dump({'versao': VERSAO_CACHE, 'classificador': CLASSIFICADOR,
+                           'pasta': str(self.pasta.resolve()), 'arquivos': self.arquivos},
+                          f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temporario, self.cache)
+
+    # ---- índices ----
+
+    def _indexar(self):
+        # Versão escolhida de cada dia: (é o próprio dia?, data do snapshot) maior vence
+        escolhido = {}
+        for nome, info in self.arquivos.items():
+            dia_arquivo = Path(nome).stem
+            for posicao, (data, linhas) in info['blocos'].items():
+                prioridade = (data == dia_arquivo and posicao == 'atual', dia_arquivo)
+                if data not in escolhido or prioridade > escolhido[data][0]:
+                    escolhido[data] = (prioridade, linhas)
+
+        self.linhas = []
+        for data in sorted(escolhido):
+            self.linhas.extend(tuple(l) for l in escolhido[data][1])
+        self.datas = [l[0] for l in self.linhas]  # ordenado: permite bisect
+
+        self.por_profissional = defaultdict(list)
+        self.por_setor = defaultdict(list)
+        self.por_tipo = defaultdict(list)
+        for i, (_, profissional, setor, _, _, tipo) in enumerate(self.linhas):
+            self.por_profissional[normalizar(profissional)].append(i)
+            self.por_setor[normalizar(setor)].append(i)
+            self.por_tipo[tipo].append(i)
+
+    def _ids_por_texto(self, indice, termo):
+        """Ids de todas as chaves do índice que casam com `termo` (ver casa())."""
+        ids = set()
+        for chave, lista in indice.items():
+            if casa(termo, chave):
+                ids.update(lista)
+        return ids
+
+    # ---- API ----
+
+    def periodo(self):
+        return (self.datas[0], self.datas[-1]) if self.datas else (None, None)
+
+    def turnos(self, profissional=None, setor=None, tipo=None, inicio=None, fim=None):
+        """Plantões que atendem a todos os filtros dados, em ordem de data.
+        profissional/setor: palavras do nome (ver casa()), sem diferenciar
+        acento e caixa.
+        tipo: matutino, vespertino, noturno, diurno, 24h, plantao...
+        inicio/fim: date ou 'AAAA-MM-DD', inclusive."""
+        inicio = inicio.isoformat() if isinstance(inicio, date) else inicio
+        fim = fim.isoformat() if isinstance(fim, date) else fim
+        lo = bisect.bisect_left(self.datas, inicio) if inicio else 0
+        hi = bisect.bisect_right(self.datas, fim) if fim else len(self.datas)
+
+        candidatos = None
+        if profissional:
+            candidatos = self._ids_por_texto(self.por_profissional, profissional)
+        if setor:
+            ids = self._ids_por_texto(self.por_setor, setor)
+            candidatos = ids if candidatos is None else candidatos & ids
+        if tipo:
+            ids = set(self.por_tipo.get(APELIDOS_TIPO.get(tipo, tipo), ()))
+            candidatos = ids if candidatos is None else candidatos & ids
+
+        if candidatos is None:
+            selecionados = range(lo, hi)
+        else:
+            selecionados = sorted(i for i in candidatos if lo <= i < hi)
+        return [dict(zip(CAMPOS, self.linhas[i])) for i in selecionados]
+
+    def cobertura(self, setor, tipo=None, inicio=None, fim=None):
+        """Quem cobriu o setor no período: Counter {profissional: nº de plantões}."""
+        return Counter(t['profissional'] for t in self.turnos(setor=setor, tipo=tipo, inicio=inicio, fim=fim))
+
+
+def _intervalo(args):
+    if args.mes:
+        ano, mes = map(int, args.mes.split('-'))
+        return date(ano, mes, 1), date(ano, mes, calendar.monthrange(ano, mes)[1])
+    return args.de, args.ate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Consultas sobre data/historico/")
+    sub = parser.add_subparsers(dest='comando', required=True)
+    for nome, ajuda in (('turnos', 'lista os plantões que atendem aos filtros'),
+                        ('cobertura', 'quem cobriu o setor, com nº de plantões')):
+        p = sub.add_parser(nome, help=ajuda)
+        p.add_argument('--profissional', help="trecho do nome")
+        p.add_argument('--setor', required=(nome == 'cobertura'), help="trecho do setor")
+        p.add_argument('--tipo', help="matutino, vespertino, noturno, diurno, 24h, plantao")
+        p.add_argument('--mes', help="AAAA-MM (atalho para --de/--ate)")
+        p.add_argument('--de', type=date.fromisoformat, help="AAAA-MM-DD")
+        p.add_argument('--ate', type=date.fromisoformat, help="AAAA-MM-DD")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    consulta = HistoricoConsulta()
+    t1 = time.perf_counter()
+    inicio, fim = _intervalo(args)
+
+    if args.comando == 'turnos':
+        resultado = consulta.turnos(args.profissional, args.setor, args.tipo, inicio, fim)
+        t2 = time.perf_counter()
+        for t in resultado:
+            print(f"{t['data']}  {t['profissional'][:32]:<32} {t['setor'][:34]:<34} "
+                  f"{t['tipo_turno'][:24]:<24} {t['horario']}")
+        print(f"\n{len(resultado)} plantão(ões)", end='')
+    else:
+        resultado = consulta.cobertura(args.setor, args.tipo, inicio, fim)
+        t2 = time.perf_counter()
+        for profissional, n in resultado.most_common():
+            print(f"{n:4d}x  {profissional}")
+        print(f"\n{len(resultado)} profissional(is), {sum(resultado.values())} plantão(ões)", end='')
+
+    de, ate = consulta.periodo()
+    print(f" · histórico {de} … {ate} · índice {(t1 - t0) * 1000:.0f} ms "
+          f"({consulta.relidos} snapshot(s) relido(s)) · consulta {(t2 - t1) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
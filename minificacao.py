@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Build de produção do dashboard (--producao do gerador).
+
+A página vai para celulares em rede instável, mas saía como escrita: CSS e JS
+indentados, comentários e ~20 console.log de depuração. Aqui, sem dependências
+externas:
+
+- minificar_js()   tira comentários, indentação e espaços entre símbolos e
+                   troca console.log/console.debug por `void 0`. As quebras de
+                   linha entre instruções ficam (a inserção automática de ';'
+                   do JS depende delas) — é um lexer, não um parser;
+- minificar_css()  tira comentários e espaços em volta de { } ; , > e após ':';
+- minificar_html() aplica os dois aos <script>/<style> e tira comentários e
+                   indentação da marcação;
+- ORCAMENTO_GZIP_KB: teto do index.html comprimido — acima dele o build falha.
+
+Não grava .gz/.br ao lado dos arquivos: o GitHub Pages comprime sozinho e não
+serve pré-comprimidos, então seriam saída morta no CI.
+"""
+
+import gzip
+import re
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+# Teto do index.html publicado, comprimido com gzip (o que o celular baixa).
+# Nos snapshots de data/historico/ (jul–ago/2026) o build de produção fica entre
+# 45,3 e 53,3 KB (30/07/2026) — 5,5 a 7,5 KB são os cards do dia pré-renderizados
+# (pre_renderizacao.py). O teto é esse máximo com ~3% de folga: uma regressão
+# de verdade (uma tabela embutida duas vezes, mais marcação por card) o
+# estoura. Se a escala crescer e ele estourar sem regressão, remeça e suba
+# junto com este comentário.
+ORCAMENTO_GZIP_KB = 55
+
+# Chamadas trocadas por `void 0` (console.warn/error ficam)
+LOGS_DEPURACAO = ('log', 'debug')
+
+# Depois destes, '/' começa uma regex; depois do resto, é divisão
+_ANTES_DE_REGEX_SIMBOLOS = set('(,=:[!&|?{};+-*%<>~^}')
+_ANTES_DE_REGEX_PALAVRAS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete',
+                            'void', 'throw', 'case', 'do', 'else', 'yield', 'await'}
+# Pares de símbolos que, sem o espaço entre eles, viram outro operador
+_JUNTAM = {'++', '--', '//', '/*'}
+
+_PALAVRA = re.compile(r'[\w$\u0080-\uffff]+')
+_ESPACO = re.compile(r'\s+')
+
+
+# ---------------------------------------------------------------- JavaScript
+
+def _tokens_js(js):
+    """Lista de (tipo, texto). Tipos: 'espaco', 'comentario', 'string',
+    'template' (pedaço de template literal, opaco, incluindo `${` e `}`),
+    'regex', 'palavra' (identificador/número/palavra-chave) e 'simbolo'
+    (um caractere)."""
+    tokens = []
+    n = len(js)
+    i = 0
+    # Um item por ${ ... } aberto: quantas chaves normais estão abertas dentro dele
+    substituicoes = []
+
+    def significativo():
+        for tipo, texto in reversed(tokens):
+            if tipo not in ('espaco', 'comentario'):
+                return tipo, texto
+        return None, ''
+
+    def ler_template(inicio):
+        # a partir de `inicio` (logo após ` ou do } de uma substituição) até ` ou ${
+        j = inicio
+        while j < n:
+            c = js[j]
+            if c == '\\':
+                j += 2
+            elif c == '`':
+                return j + 1, False
+            elif c == '$' and js.startswith('${', j):
+                return j + 2, True
+            else:
+                j += 1
+        raise ValueError("template literal sem fim")
+
+    while i < n:
+        c = js[i]
+        if c.isspace():
+            m = _ESPACO.match(js, i)
+            tokens.append(('espaco', m.group()))
+            i = m.end()
+        elif js.startswith('//', i):
+            fim = js.find('\n', i)
+            fim = n if fim < 0 else fim
+            tokens.append(('comentario', js[i:fim]))
+            i = fim
+        elif js.startswith('/*', i):
+            fim = js.find('*/', i + 2)
+            if fim < 0:
+                raise ValueError("comentário sem fim")
+            tokens.append(('comentario', js[i:fim + 2]))
+            i = fim + 2
+        elif c in '\'"':
+            j = i + 1
+            while j < n and js[j] != c:
+                if js[j] == '\n':
+                    raise ValueError(f"string sem fim na posição {i}")
+                j += 2 if js[j] == '\\' else 1
+            if j >= n:
+                raise ValueError(f"string sem fim na posição {i}")
+            tokens.append(('string', js[i:j + 1]))
+            i = j + 1
+        elif c == '`':
+            fim, abriu = ler_template(i + 1)
+            tokens.append(('template', js[i:fim]))
+            if abriu:
+                substituicoes.append(0)
+            i = fim
+        elif c == '}' and substituicoes and substituicoes[-1] == 0:
+            substituicoes.pop()
+            fim, abriu = ler_template(i + 1)
+            tokens.append(('template', js[i:fim]))
+            if abriu:
+                substituicoes.append(0)
+            i = fim
+        elif c == '/':
+            tipo, texto = significativo()
+            eh_regex = (tipo is None
+                        or (tipo == 'simbolo' and texto in _ANTES_DE_REGEX_SIMBOLOS)
+                        or (tipo == 'palavra' and texto in _ANTES_DE_REGEX_PALAVRAS)
+                        or (tipo == 'template' and texto.endswith('${')))
+            if not eh_regex:
+                tokens.append(('simbolo', c))
+                i += 1
+                continue
+            j, classe = i + 1, False
+            while j < n and (classe or js[j] != '/'):
+                if js[j] == '\n':
+                    raise ValueError(f"regex sem fim na posição {i}")
+                if js[j] == '\\':
+                    j += 1
+                elif js[j] == '[':
+                    classe = True
+                elif js[j] == ']':
+                    classe = False
+                j += 1
+            m = _PALAVRA.match(js, j + 1)
+            fim = m.end() if m else j + 1
+            tokens.append(('regex', js[i:fim]))
+            i = fim
+        else:
+            m = _PALAVRA.match(js, i)
+            if m:
+                tokens.append(('palavra', m.group()))
+                i = m.end()
+                continue
+            if substituicoes:
+                if c == '{':
+                    substituicoes[-1] += 1
+                elif c == '}':
+                    substituicoes[-1] -= 1
+            tokens.append(('simbolo', c))
+            i += 1
+    if substituicoes:
+        raise ValueError("template literal sem fim")
+    return tokens
+
+
+def _sem_logs(tokens):
+    """Troca console.log(...)/console.debug(...) por `void 0` — vale em
+    qualquer posição (instrução, corpo de arrow, `if (x) console.log()`)."""
+    saida = []
+    i = 0
+    while i < len(tokens):
+        sig = [k for k in range(i, min(i + 12, len(tokens))) if tokens[k][0] not in ('espaco', 'comentario')][:4]
+        anterior = next((t for t in reversed(saida) if t[0] not in ('espaco', 'comentario')), None)
+        if (len(sig) == 4 and sig[0] == i
+                and [tokens[k] for k in sig[:2]] == [('palavra', 'console'), ('simbolo', '.')]
+                and tokens[sig[2]][0] == 'palavra' and tokens[sig[2]][1] in LOGS_DEPURACAO
+                and tokens[sig[3]] == ('simbolo', '(')
+                and anterior != ('simbolo', '.')):
+            profundidade = 0
+            for k in range(sig[3], len(tokens)):
+                if tokens[k][0] == 'simbolo' and tokens[k][1] in '([{':
+                    profundidade += 1
+                elif tokens[k][0] == 'simbolo' and tokens[k][1] in ')]}':
+                    profundidade -= 1
+                    if profundidade == 0:
+                        break
+            saida.append(('palavra', 'void 0'))
+            i = k + 1
+            continue
+        saida.append(tokens[i])
+        i += 1
+    return saida
+
+
+def minificar_js(js, remover_logs=True):
+    """JS sem comentários, indentação e espaços desnecessários. Não renomeia
+    nada e mantém as quebras de linha onde podem terminar uma instrução."""
+    tokens = _tokens_js(js)
+    if remover_logs:
+        tokens = _sem_logs(tokens)
+
+    # Espaço + comentários seguidos viram um separador só: '\n' se havia
+    # quebra de linha, ' ' se não
+    compactos = []
+    for tipo, texto in tokens:
+        if tipo in ('espaco', 'comentario'):
+            quebra = '\n' in texto or (tipo == 'comentario' and texto.startswith('//'))
+            if compactos and compactos[-1][0] == 'espaco':
+                quebra = quebra or compactos[-1][1] == '\n'
+                compactos[-1] = ('espaco', '\n' if quebra else ' ')
+            else:
+                compactos.append(('espaco', '\n' if quebra else ' '))
+        else:
+            compactos.append((tipo, texto))
+
+    partes = []
+    for k, (tipo, texto) in enumerate(compactos):
+        if tipo != 'espaco':
+            partes.append(texto)
+            continue
+        if k == 0 or k == len(compactos) - 1:
+            continue
+        (tipo_a, antes), (tipo_d, depois) = compactos[k - 1], compactos[k + 1]
+        if texto == '\n':
+            # A quebra só some onde não pode terminar uma instrução
+            if (tipo_a == 'simbolo' and antes in '{;,([') or (tipo_d == 'simbolo' and depois in '});,]'):
+                continue
+            partes.append('\n')
+            continue
+        palavras = tipo_a in ('palavra', 'regex') and tipo_d in ('palavra', 'regex')
+        numero_ponto = tipo_a == 'palavra' and antes[:1].isdigit() and depois == '.'
+        if palavras or numero_ponto or (antes[-1:] + depois[:1]) in _JUNTAM:
+            partes.append(' ')
+    return ''.join(partes)
+
+
+def sintaxe_js_valida(js):
+    """`node --check` no texto. None se o node não estiver disponível."""
+    node = shutil.which('node')
+    if not node:
+        return None
+    with tempfile.NamedTemporaryFile('w', suffix='.js', encoding='utf-8', delete=False) as f:
+        f.write(js)
+    try:
+        return subprocess.run([node, '--check', f.name], capture_output=True, timeout=60).returncode == 0
+    finally:
+        Path(f.name).unlink()
+
+
+def scripts_validos(html):
+    """sintaxe_js_valida() de cada <script> inline da página: False se algum
+    não compila, None se o node não estiver disponível."""
+    for m in re.finditer(r'<script(?:\s[^>]*)?>(.*?)</script>', html, re.S | re.I):
+        ok = sintaxe_js_valida(m.group(1))
+        if ok is not True:
+            return ok
+    return True
+
+
+# ---------------------------------------------------------------- CSS
+
+_CSS_STRING = r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\''
+_CSS_COMENTARIOS = re.compile(rf'/\*.*?\*/|{_CSS_STRING}', re.S)
+_CSS_PARTES = re.compile(rf'{_CSS_STRING}|[^"\']+')
+
+
+def minificar_css(css):
+    css = _CSS_COMENTARIOS.sub(lambda m: ' ' if m.group().startswith('/*') else m.group(), css)
+    partes = []
+    for m in _CSS_PARTES.finditer(css):
+        trecho = m.group()
+        if trecho[0] not in '"\'':
+            trecho = _ESPACO.sub(' ', trecho)
+            trecho = re.sub(r' ?([{};,>]) ?', r'\1', trecho)
+            trecho = re.sub(r': ', ':', trecho)
+            trecho = re.sub(r';+}', '}', trecho)
+        partes.append(trecho)
+    return ''.join(partes).strip()
+
+
+# ---------------------------------------------------------------- HTML
+
+_HTML_BLOCOS = re.compile(
+    r'(<script(?:\s[^>]*)?>)(.*?)(</script>)'
+    r'|(<style(?:\s[^>]*)?>)(.*?)(</style>)'
+    r'|<(pre|textarea)\b.*?</\7>'
+    r'|<!--.*?-->', re.S | re.I)
+
+
+def _marcacao(texto):
+    # Espaço com quebra de linha (indentação) vira uma quebra só
+    return re.sub(r'[ \t]*\n\s*', '\n', texto)
+
+
+def minificar_html(html, remover_logs=True):
+    """Página com <script> e <style> minificados e sem comentários nem
+    indentação na marcação. O aviso "NÃO EDITE" do topo fica."""
+    partes = []
+    pos = 0
+    for m in _HTML_BLOCOS.finditer(html):
+        marcacao = _marcacao(html[pos:m.start()])
+        if partes[-2:-1] and partes[-1] == '' and partes[-2].endswith('\n'):
+            marcacao = marcacao.lstrip()  # linha de um comentário retirado
+        partes.append(marcacao)
+        pos = m.end()
+        if m.group(1):
+            abre, corpo, fecha = m.group(1, 2, 3)
+            tipo = re.search(r'type=["\']?([\w/+-]+)', abre)
+            if 'src=' in abre or (tipo and tipo.group(1) not in ('text/javascript', 'module')):
+                partes.append(m.group())
+            else:
+                partes.append(abre + minificar_js(corpo, remover_logs) + fecha)
+        elif m.group(4):
+            partes.append(m.group(4) + minificar_css(m.group(5)) + m.group(6))
+        elif m.group().startswith('<!--'):
+            partes.append(m.group() if 'NÃO EDITE' in m.group() else '')
+        else:
+            partes.append(m.group())
+    partes.append(_marcacao(html[pos:]))
+    return ''.join(partes).strip() + '\n'
+
+
+# ---------------------------------------------------------------- compressão
+
+def tamanho_gzip(texto):
+    """Bytes do texto com gzip -9 — o que o orçamento mede."""
+    return len(gzip.compress(texto.encode('utf-8'), compresslevel=9, mtime=0))
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Modelos (templates) da página do dashboard, em templates/.
+
+A página era uma única string Python de ~3.400 linhas dentro de
+gerar_dashboard_executivo.py, com json.dumps concatenados no meio e
+html.replace() varrendo os ~250 KB no fim. Agora a casca estática fica em
+arquivos — dashboard.html, dashboard.css, dashboard.js — com duas marcações:
+
+- {{> arquivo }}   inclui outro arquivo de templates/ (resolvido ao compilar);
+- {{ nome }}       valor injetado ao renderizar, como texto pronto (JSON já
+                   serializado, tags...) — nada é escapado.
+
+Compilar = resolver as inclusões e partir o texto em trechos fixos e nomes.
+O compilado fica em cache em data/.cache/modelos/ (fora do git), com o hash de
+todos os arquivos de templates/ no nome: enquanto a casca não muda, a geração
+só intercala os trechos com os valores do dia, numa única passada.
+
+compilar(..., minificar=True) (build --producao) minifica a casca antes de
+partir — uma vez por versão dos templates e de minificacao.py, não a cada
+geração; os valores do dia já chegam compactos. Modelos .js (o worker de
+busca) são minificados como JS; os demais, como HTML.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+import minificacao
+
+BASE_DIR = Path(__file__).parent
+PASTA_MODELOS = BASE_DIR / 'templates'
+PASTA_CACHE = BASE_DIR / 'data' / '.cache' / 'modelos'
+VERSAO_CACHE = 1
+
+_INCLUSAO = re.compile(r'\{\{>\s*([\w.-]+)\s*\}\}')
+_VALOR = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+
+class Modelo:
+    def __init__(self, trechos, hash_modelos):
+        # [texto, nome, texto, nome, ..., texto] — nomes nas posições ímpares
+        self.trechos = trechos
+        self.hash = hash_modelos
+
+    @property
+    def nomes(self):
+        return set(self.trechos[1::2])
+
+    def renderizar(self, valores):
+        """Texto final. Todo nome usado no modelo precisa estar em `valores`."""
+        faltando = self.nomes - set(valores)
+        if faltando:
+            raise KeyError(f"valores ausentes para o modelo: {', '.join(sorted(faltando))}")
+        partes = list(self.trechos)
+        for i in range(1, len(partes), 2):
+            partes[i] = valores[partes[i]]
+        return ''.join(partes)
+
+
+def hash_modelos(pasta=PASTA_MODELOS):
+    """Hash do conteúdo (e dos nomes) de todos os arquivos de `pasta`."""
+    h = hashlib.sha256()
+    for caminho in sorted(Path(pasta).iterdir()):
+        if caminho.is_file():
+            h.update(caminho.name.encode('utf-8') + b'\0')
+            h.update(caminho.read_bytes() + b'\0')
+    return h.hexdigest()[:16]
+
+
+def _expandir(nome, pasta, pilha=()):
+    if nome in pilha:
+        raise ValueError(f"inclusão circular em templates/: {' → '.join(pilha + (nome,))}")
+    texto = (Path(pasta) / nome).read_text(encoding='utf-8')
+    return _INCLUSAO.sub(lambda m: _expandir(m.group(1), pasta, pilha + (nome,)), texto)
+
+
+def compilar(nome, pasta=PASTA_MODELOS, cache=PASTA_CACHE, minificar=False):
+    """Modelo compilado de templates/<nome>, do cache quando os arquivos de
+    templates/ não mudaram desde a última compilação. minificar=True: casca
+    minificada (ver minificacao.py), com cache próprio."""
+    chave = hash_modelos(pasta)
+    prefixo = Path(nome).stem
+    if minificar:
+        fonte = Path(minificacao.__file__).read_bytes()
+        chave = hashlib.sha256(chave.encode('utf-8') + fonte).hexdigest()[:16]
+        prefixo += '-min'
+    arquivo_cache = Path(cache) / f"{prefixo}.{chave}.json" if cache else None
+    if arquivo_cache and arquivo_cache.exists():
+        try:
+            dados = json.loads(arquivo_cache.read_text(encoding='utf-8'))
+            if dados.get('versao') == VERSAO_CACHE:
+                return Modelo(dados['trechos'], chave)
+        except (OSError, ValueError):
+            pass
+
+    texto = _expandir(nome, pasta)
+    if minificar:
+        if Path(nome).suffix == '.js':
+            texto = minificacao.minificar_js(texto)
+        else:
+            texto = minificacao.minificar_html(texto)
+    trechos = _VALOR.split(texto)
+    if arquivo_cache:
+        arquivo_cache.parent.mkdir(parents=True, exist_ok=True)
+        for antigo in arquivo_cache.parent.glob(f"{prefixo}.*.json"):
+            antigo.unlink()
+        temporario = arquivo_cache.with_name(f"{arquivo_cache.name}.{os.getpid()}.tmp")
+        temporario.write_text(json.dumps({'versao': VERSAO_CACHE, 'trechos': trechos},
+                                         ensure_ascii=False), encoding='utf-8')
+        os.replace(temporario, arquivo_cache)
+    return Modelo(trechos, chave)
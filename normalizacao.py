@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Correções de texto dos registros extraídos do escala.med.br.
+
+Separado de extracao_inteligente.py (que importa selenium) para que o gerador
+e o diff (diff_escala.py) possam normalizar snapshots antigos sem o navegador.
+"""
+
+import re
+
+# Mapa de correções (errado → correto)
+CORRECOES_PORTUGUES = {
+    'Residencia': 'Residência',
+    'Clinica': 'Clínica',
+    'Clinica Médica': 'Clínica Médica',
+    'Obstetrícia': 'Obstetrícia',  # Já está certo, mas por segurança
+    # A UTI Adulto IV foi cadastrada na origem com "intensiva" minúsculo.
+    # Sem isto ela ordena depois de todas as outras UTIs (o sort compara
+    # código de caractere: 'I' < 'i') e aparece longe das irmãs.
+    'Terapia intensiva': 'Terapia Intensiva',
+    # Turno "Res. Clinica Méidica Intermediário" da origem. Era corrigido no
+    # gerador com json.dumps → replace → json.loads na escala inteira — que
+    # nem funcionava: o dumps escapa o "é" e o texto nunca casava.
+    'Méidica': 'Médica',
+}
+# Todas as correções numa única passada; a mais longa vence onde duas começam
+# no mesmo ponto ('Clinica Médica' antes de 'Clinica')
+_CORRECOES_PORTUGUES = re.compile('|'.join(
+    re.escape(errado) for errado in sorted(CORRECOES_PORTUGUES, key=len, reverse=True)))
+
+
+def corrigir_portugues(texto):
+    """Corrige erros comuns de ortografia em textos extraídos do website"""
+    if not texto:
+        return texto
+    return _CORRECOES_PORTUGUES.sub(lambda m: CORRECOES_PORTUGUES[m.group()], texto)
+
+
+# A origem começou a anexar " - ESCALA MÉDICA" (e variações de caixa) ao nome de
+# alguns setores. O sufixo não diz nada ao leitor e quebrava o casamento com as
+# tabelas de ramais e de impressão, que guardam o nome limpo.
+_SUFIXO_ESCALA_MEDICA = re.compile(r'\s*[-–]\s*escala\s+m[eé]dica\s*$', re.IGNORECASE)
+
+
+def normalizar_setor(texto):
+    """Nome de setor pronto para exibir: ortografia corrigida e sem o sufixo
+    administrativo que o escala.med.br anexa."""
+    if not texto:
+        return texto
+    return _SUFIXO_ESCALA_MEDICA.sub('', corrigir_portugues(texto)).strip()
+
+
+def normalizar_registro(reg):
+    """Normaliza, no próprio registro, os campos de texto que vão para a tela:
+    setor (normalizar_setor) e tipo de turno (corrigir_portugues). Feito uma
+    vez, na extração — o gerador recebe os dados já corrigidos — e nos
+    snapshots antigos comparados pelo diff (diff_escala.py)."""
+    reg['setor'] = normalizar_setor(reg['setor'])
+    if reg.get('tipo_turno'):
+        reg['tipo_turno'] = corrigir_portugues(reg['tipo_turno'])
+    return reg
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Pré-renderização (no gerador) dos cards do dia inicial.
+
+Sem isto a primeira pintura do index.html é uma página vazia até o JS
+desserializar os dados e montar os ~60 setores. Com isto o dia "atual" já
+chega como HTML dentro de #categorias (<div class="vista-dia"
+data-dia="atual" data-pre="N">) e o JS só ADOTA esses nós — mesma marcação de
+htmlSetor() em templates/dashboard.js, conferida por
+tests/test_pre_renderizacao.py —, sem recriá-los.
+
+Só o dia inicial: os três dias triplicariam a página (e o orçamento de gzip
+do build --producao); "anterior" e "seguinte" são montados pelo JS em tempo
+ocioso depois da carga. No modo --assets nada é pré-renderizado: a casca
+precisa sair igual enquanto só a escala muda.
+"""
+
+import re
+from html import escape
+
+# Setores excluídos da impressão (foco no PS) — injetado no JS como EXCLUIR_PRINT
+EXCLUIR_PRINT = (
+    'Alojamento Conjunto',
+    'Ambulatório De Oncologia Pediátrica',
+    'Ambulatório Oncologia - Triagem',
+    'Núcleo Interno de Regulação (NIR) Médico Regulador',
+    'R2 Clínica Médica UTI',
+    'Residência de Clínica Médica',
+    'Transplante - Sobreaviso Cirurgia',
+    'Unidade de Cuidados Intermediários Neonatais - UCINCo E Sala de Parto',
+    'Unidade de Terapia Intensiva (UTI) Adulto I',
+    'Unidade de Terapia Intensiva (UTI) Adulto II',
+    'Unidade de Terapia Intensiva (UTI) Adulto III',
+    'Unidade de Terapia Intensiva (UTI) Adulto IV',
+    'Unidade de Terapia Intensiva (UTI) Neonatal - Plantão',
+    'Unidade de Terapia Intensiva (UTI) Pediátrica',
+)
+
+# Iguais aos de formatarTipoBadge() e ao nome curto de htmlSetor()
+ROTULOS_BADGE = {
+    'badge-24h': '24H',
+    'matutino': 'MATUTINO',
+    'vespertino': 'VESPERTINO',
+    'noturno': 'NOTURNO',
+    'sobreaviso': 'SOBREAVISO',
+    'rotina': 'ROTINA',
+    'plantao': 'PLANTÃO',
+    'misto': 'MISTO',
+    'outro': 'OUTRO',
+}
+_SUFIXO_CURTO = re.compile(r'\s*[-–]\s*(Sobreaviso|Plantão|Plantao).*$', re.I)
+
+
+def _e(valor):
+    return escape(str(valor))
+
+
+def _nome_curto(nome):
+    partes = nome.split()
+    return ' '.join(partes) if len(partes) <= 2 else f"{partes[0]} {partes[-1]}"
+
+
+def _html_profissional(reg, id_, telefones):
+    telefone = str(telefones.get(reg['profissional'].lower(), 'N/A'))
+    icone = ''
+    if telefone != 'N/A':
+        icone = (f'<a href="https://wa.me/55{re.sub(r"[^0-9]", "", telefone)}" target="_blank" '
+                 f'class="telefone-icon-btn" data-phone="{_e(telefone)}" title="WhatsApp: {_e(telefone)}">'
+                 f'<span class="telefone-icon"></span></a>\n')
+    badge = reg['tipo_badge']
+    return (
+        f'<div class="profissional stripe-{_e(badge)}" data-id="{id_}" data-hora="{_e(reg["horario"])}">\n'
+        f'<div class="profissional-nome">\n{icone}'
+        f'<div class="profissional-nome-wrapper">\n'
+        f'<span class="profissional-nome-text">{_e(reg["profissional"])}</span>'
+        f'<span class="profissional-nome-curto">{_e(_nome_curto(reg["profissional"]))}</span>\n'
+        f'</div>\n</div>\n'
+        f'<div class="profissional-info">\n'
+        f'<span class="info-horario">{_e(reg["horario"])}</span>\n'
+        f'<span class="turno-badge {_e(badge)}" title="{_e(reg["tipo_turno"])}">'
+        f'{_e(ROTULOS_BADGE.get(badge, badge.upper()))}</span>\n'
+        f'</div>\n</div>\n'
+    )
+
+
+def html_setor(setor, registros, ids, telefones, excluido_print=False):
+    """HTML do card de um setor, como htmlSetor() no JS (sem favorito: as
+    preferências ficam no localStorage). `ids`: registro → data-id."""
+    turnos = {}  # nome → registros, na ordem de aparição
+    ordem = {}
+    for reg in registros:
+        turnos.setdefault(reg['turno_nome'], []).append(reg)
+        ordem[reg['turno_nome']] = reg['turno_ordem']
+    multiplos = len(turnos) > 1
+
+    classes = 'category category-full' if multiplos else 'category'
+    if excluido_print:
+        classes += ' print-exclude'
+    setor_e = _e(setor)
+    partes = [
+        f'<div class="{classes}" data-setor="{setor_e}">\n'
+        f'<div class="categoria-header expanded">\n'
+        f'<div class="categoria-header-text">\n'
+        f'<div class="categoria-nome"><span class="setor-nome-full">{setor_e}</span>'
+        f'<span class="setor-nome-curto">{_e(_SUFIXO_CURTO.sub("", setor).strip())}</span></div>\n'
+        f'</div>\n'
+        f'<div class="setor-pref-btns" onclick="event.stopPropagation()">\n'
+        f'<button class="btn-pref" onclick="toggleFavorito(\'{setor_e}\')" title="Favoritar setor">★</button>\n'
+        f'<button class="btn-pref" onclick="toggleOcultar(\'{setor_e}\')" '
+        f'title="Ocultar este setor da lista (reversível no rodapé)">✕</button>\n'
+        f'</div>\n</div>\n'
+        f'<div class="categoria-content">\n'
+    ]
+    if multiplos:
+        partes.append('<div class="turnos-container">\n')
+        for turno in sorted(turnos, key=ordem.__getitem__):
+            profs = turnos[turno]
+            partes.append(
+                f'<div class="turno-coluna">\n'
+                f'<div class="turno-title" data-count="{len(profs)}">{_e(turno)}</div>\n'
+                f'<div class="profissionais-list">\n')
+            partes.extend(_html_profissional(r, ids[id(r)], telefones) for r in profs)
+            partes.append('</div>\n</div>\n')
+        partes.append('</div>\n')
+    else:
+        partes.append('<div class="profissionais-list">\n')
+        partes.extend(_html_profissional(r, ids[id(r)], telefones) for r in registros)
+        partes.append('</div>\n')
+    partes.append('</div>\n</div>\n')
+    return ''.join(partes)
+
+
+def renderizar_vista(bloco, profissionais_data, dia='atual', excluir_print=EXCLUIR_PRINT):
+    """<div class="vista-dia"> com os cards de todos os setores do `bloco` de
+    um dia (registros já classificados), em ordem alfabética — a ordem do JS
+    sem favoritos nem ocultos. '' para dia sem registros."""
+    registros = bloco.get('registros') or []
+    if not registros:
+        return ''
+    telefones = {}
+    for prof in profissionais_data.get('professionals') or []:
+        telefones[prof['name'].lower()] = prof.get('phone')
+    ids = {id(r): i for i, r in enumerate(registros)}
+    por_setor = {}
+    for reg in registros:
+        por_setor.setdefault(reg['setor'], []).append(reg)
+    cards = ''.join(html_setor(s, por_setor[s], ids, telefones, s in excluir_print)
+                    for s in sorted(por_setor))
+    return f'<div class="vista-dia" data-dia="{_e(dia)}" data-pre="{len(registros)}">\n{cards}</div>'
+
+
+def renderizar_stats(bloco):
+    """Cartões de totais (#stats) do dia, como renderizarEscala() no JS."""
+    registros = bloco.get('registros') or []
+    if not registros:
+        return ''
+    setores = len({r['setor'] for r in registros})
+    return (f'<div class="stat-card">\n<div class="stat-number">{_e(bloco.get("total", len(registros)))}</div>\n'
+            f'<div class="stat-label">Profissionais</div>\n</div>\n'
+            f'<div class="stat-card">\n<div class="stat-number">{setores}</div>\n'
+            f'<div class="stat-label">Setores</div>\n</div>')
+
+
+# Valores do modelo (templates/dashboard.html) sem pré-renderização (--assets)
+VALORES_VAZIOS = {'vista_inicial': '', 'stats_iniciais': '', 'data_inicial': ''}
+
+
+def valores_iniciais(bloco, profissionais_data):
+    """Valores do modelo com o dia `bloco` ("atual") pré-renderizado."""
+    return {
+        'vista_inicial': renderizar_vista(bloco, profissionais_data),
+        'stats_iniciais': renderizar_stats(bloco),
+        'data_inicial': _e(bloco.get('data', '')),
+    }
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark da correção de ortografia da escala, antes e depois de ela sair do
+gerador para a extração.
+
+- antes: gerar_dashboard fazia json.dumps → replace('Méidica', 'Médica') →
+  json.loads na escala inteira, a cada geração;
+- depois: a geração não faz nada; a extração chama normalizar_registro()
+  (normalizacao.py) campo a campo, uma vez por registro.
+
+Para cada snapshot de data/historico/ mede o tempo dos dois passos (melhor de
+N repetições) e conta quantos registros cada um de fato corrigiu.
+
+Uso:
+    python3 scripts/benchmark_correcoes.py
+    python3 scripts/benchmark_correcoes.py --repeticoes 50
+"""
+
+import argparse
+import copy
+import json
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from historico_compacto import ler_snapshot
+from normalizacao import normalizar_registro
+
+HISTORICO = BASE_DIR / 'data' / 'historico'
+DIAS = ('anterior', 'atual', 'seguinte')
+
+
+def correcao_antiga(escalas):
+    """O passo que saiu de gerar_dashboard, como era."""
+    escalas_str = json.dumps(escalas)
+    escalas_str = escalas_str.replace('Méidica', 'Médica')
+    return json.loads(escalas_str)
+
+
+def correcao_nova(escalas):
+    for dia in DIAS:
+        for reg in (escalas.get(dia) or {}).get('registros') or []:
+            normalizar_registro(reg)
+    return escalas
+
+
+def _registros(escalas):
+    return [r for dia in DIAS for r in (escalas.get(dia) or {}).get('registros') or []]
+
+
+def _corrigidos(original, corrigida):
+    return sum(a != b for a, b in zip(_registros(original), _registros(corrigida)))
+
+
+def _melhor_tempo(funcao, escalas, repeticoes):
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        copia = copy.deepcopy(escalas)  # a nova corrige no lugar
+        t0 = time.perf_counter()
+        funcao(copia)
+        melhor = min(melhor, time.perf_counter() - t0)
+    return melhor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Correção de ortografia: gerador (antes) × extração (depois)")
+    parser.add_argument('--repeticoes', type=int, default=20)
+    args = parser.parse_args()
+
+    snapshots = sorted(HISTORICO.glob('*.json'))
+    if not snapshots:
+        print(f"❌ Nenhum snapshot em {HISTORICO}")
+        return 1
+
+    print(f"{'snapshot':<16}{'registros':>10}{'antes (ms)':>12}{'corrigidos':>12}"
+          f"{'extração (ms)':>15}{'corrigidos':>12}")
+    totais = [0, 0.0, 0, 0.0, 0]
+    for caminho in snapshots:
+        escalas = ler_snapshot(caminho)
+        n = len(_registros(escalas))
+        antes = _melhor_tempo(correcao_antiga, escalas, args.repeticoes)
+        depois = _melhor_tempo(correcao_nova, escalas, args.repeticoes)
+        corrigidos_antes = _corrigidos(escalas, correcao_antiga(escalas))
+        corrigidos_depois = _corrigidos(escalas, correcao_nova(copy.deepcopy(escalas)))
+        print(f"{caminho.stem:<16}{n:>10}{antes * 1000:>12.2f}{corrigidos_antes:>12}"
+              f"{depois * 1000:>15.2f}{corrigidos_depois:>12}")
+        for i, valor in enumerate((n, antes, corrigidos_antes, depois, corrigidos_depois)):
+            totais[i] += valor
+
+    n, antes, corrigidos_antes, depois, corrigidos_depois = totais
+    print(f"{'total':<16}{n:>10}{antes * 1000:>12.2f}{corrigidos_antes:>12}"
+          f"{depois * 1000:>15.2f}{corrigidos_depois:>12}")
+    print(f"\n⏱️  Geração: {antes * 1000 / len(snapshots):.2f} ms/snapshot a menos (o passo saiu); "
+          f"a extração ganha {depois * 1000 / len(snapshots):.2f} ms/snapshot de normalização por campo")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Service worker do dashboard (sw.js), gerado junto com o index.html.
+
+Numa rede instável a página (~250 KB) e as fontes do Google eram baixadas a
+cada abertura. Com o service worker:
+
+- a casca (index.html, manifest, ícone, worker de busca e, no modo --assets,
+  os arquivos de dados) é pré-carregada na instalação, num cache com a versão da geração no
+  nome — uma geração nova instala um cache novo e apaga os antigos;
+- index.html e escala.json saem do cache NA HORA (abre até offline) e são
+  revalidados em segundo plano; se o publicado mudou, a página recebe uma
+  mensagem {tipo: 'atualizado'} e avisa o usuário;
+- assets com hash no nome e fontes do Google: cache primeiro (não mudam).
+"""
+
+import json
+
+ARQUIVO = 'sw.js'
+WORKER_BUSCA = 'worker-busca.js'  # gerado de templates/worker_busca.js
+SHELL = ('./', 'manifest.json', 'icon.svg', WORKER_BUSCA)
+
+_MODELO = """// ARQUIVO GERADO por gerar_dashboard_executivo.py (service_worker.py) — não edite
+const VERSAO = __VERSAO__;
+const CACHE = 'escala-hro-' + VERSAO;
+const CACHE_FONTES = 'escala-hro-fontes';
+// Caminhos relativos ao escopo do service worker
+const PRECACHE = __PRECACHE__;
+const REVALIDAR = __REVALIDAR__;
+const ESCOPO = new URL(self.registration.scope);
+const CHAVE_INDEX = new URL('./', ESCOPO).href;
+
+self.addEventListener('install', ev => {
+    ev.waitUntil(caches.open(CACHE)
+        .then(cache => cache.addAll(PRECACHE.map(c => new Request(c, { cache: 'reload' }))))
+        .then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', ev => {
+    ev.waitUntil(caches.keys()
+        .then(nomes => Promise.all(nomes
+            .filter(n => n.startsWith('escala-hro-') && n !== CACHE && n !== CACHE_FONTES)
+            .map(n => caches.delete(n))))
+        .then(() => self.clients.claim()));
+});
+
+async function mesmoConteudo(antiga, nova) {
+    const etagAntiga = antiga.headers.get('etag');
+    const etagNova = nova.headers.get('etag');
+    if (etagAntiga && etagNova) return etagAntiga === etagNova;
+    return (await antiga.text()) === (await nova.text());
+}
+
+async function avisarClientes(url) {
+    const clientes = await self.clients.matchAll({ type: 'window' });
+    clientes.forEach(c => c.postMessage({ tipo: 'atualizado', url }));
+}
+
+// Responde do cache na hora e busca a versão publicada em segundo plano
+async function cacheERevalidar(ev, chave) {
+    const cache = await caches.open(CACHE);
+    const emCache = await cache.match(chave);
+    const copia = emCache ? emCache.clone() : null;
+    const rede = fetch(ev.request, { cache: 'no-cache' }).then(async resposta => {
+        if (resposta.ok) {
+            const mudou = copia && !(await mesmoConteudo(copia, resposta.clone()));
+            await cache.put(chave, resposta.clone());
+            if (mudou) await avisarClientes(chave);
+        }
+        return resposta;
+    });
+    if (emCache) {
+        ev.waitUntil(rede.catch(() => {}));
+        return emCache;
+    }
+    return rede;
+}
+
+async function cachePrimeiro(ev, nomeCache) {
+    const cache = await caches.open(nomeCache);
+    const emCache = await cache.match(ev.request);
+    if (emCache) return emCache;
+    const resposta = await fetch(ev.request);
+    if (resposta.ok || resposta.type === 'opaque') {
+        ev.waitUntil(cache.put(ev.request, resposta.clone()));
+    }
+    return resposta;
+}
+
+self.addEventListener('fetch', ev => {
+    if (ev.request.method !== 'GET') return;
+    const url = new URL(ev.request.url);
+
+    if (url.origin === ESCOPO.origin && url.pathname.startsWith(ESCOPO.pathname)) {
+        const caminho = url.pathname.slice(ESCOPO.pathname.length);
+        if (caminho === '' || caminho === 'index.html') {
+            ev.respondWith(cacheERevalidar(ev, CHAVE_INDEX));
+        } else if (REVALIDAR.includes(caminho)) {
+            ev.respondWith(cacheERevalidar(ev, url.origin + url.pathname));
+        } else if (PRECACHE.includes(caminho) || caminho.startsWith('assets/')) {
+            ev.respondWith(cachePrimeiro(ev, CACHE));
+        }
+    } else if (url.hostname === 'fonts.googleapis.com' || url.hostname === 'fonts.gstatic.com') {
+        ev.respondWith(cachePrimeiro(ev, CACHE_FONTES));
+    }
+});
+"""
+
+
+def gerar_service_worker(versao, assets=(), revalidar=()):
+    """Texto do sw.js. `versao`: a da geração (VERSAO_GERACAO); `assets`:
+    caminhos extras para pré-carregar; `revalidar`: caminhos servidos do cache
+    e revalidados em segundo plano (além do index.html)."""
+    precache = list(SHELL) + [c for c in list(revalidar) + list(assets) if c not in SHELL]
+    return (_MODELO
+            .replace('__VERSAO__', json.dumps(versao))
+            .replace('__PRECACHE__', json.dumps(precache, ensure_ascii=False))
+            .replace('__REVALIDAR__', json.dumps(list(revalidar), ensure_ascii=False)))
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Sessão do escala.med.br persistida entre execuções.
+
+O login pelo navegador é a etapa mais cara da extração (até ~210s no pior caso,
+com as retentativas). Depois de um login bem-sucedido, os cookies e o
+localStorage do domínio (onde o SPA guarda o token) são gravados cifrados num
+arquivo do runner; na execução seguinte eles são reaplicados e, se a sessão
+ainda valer, o login é pulado (retomar_ou_entrar). A sessão é regravada a cada
+entrada, com o que o servidor tiver renovado.
+
+Configuração pelo ambiente:
+
+    ESCALA_SESSAO_CHAVE    chave Fernet (gerar com: python3 sessao_persistente.py --gerar-chave).
+                           Sem ela a persistência fica desligada.
+    ESCALA_SESSAO_ARQUIVO  onde gravar (padrão: ~/.cache/escala-hro/sessao.bin)
+
+Só usa driver.get/get_cookies/add_cookie/execute_script, então dá para testar
+com um driver falso. `cryptography` é importada só na hora de cifrar.
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+URL_BASE = "https://escala.med.br/painel/"
+
+ARQUIVO_PADRAO = Path.home() / '.cache' / 'escala-hro' / 'sessao.bin'
+
+_JS_LER_STORAGE = """
+var itens = {};
+for (var i = 0; i < localStorage.length; i++) {
+    var k = localStorage.key(i);
+    itens[k] = localStorage.getItem(k);
+}
+return itens;
+"""
+
+_JS_GRAVAR_STORAGE = """
+var itens = arguments[0];
+for (var k in itens) { localStorage.setItem(k, itens[k]); }
+"""
+
+
+def caminho_sessao():
+    return Path(os.getenv('ESCALA_SESSAO_ARQUIVO') or ARQUIVO_PADRAO)
+
+
+def _fernet(chave=None):
+    """Fernet com a chave do ambiente, ou None se a persistência estiver
+    desligada (sem chave, sem cryptography ou chave malformada)."""
+    chave = chave or os.getenv('ESCALA_SESSAO_CHAVE')
+    if not chave:
+        return None
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError:
+        print("⚠️  Pacote 'cryptography' ausente; sessão não será persistida")
+        return None
+    try:
+        return Fernet(chave.encode() if isinstance(chave, str) else chave)
+    except (ValueError, TypeError) as e:
+        print(f"⚠️  ESCALA_SESSAO_CHAVE inválida ({e}); sessão não será persistida")
+        return None
+
+
+def capturar(driver):
+    """Cookies + localStorage da página atual (precisa estar no domínio)."""
+    return {
+        'salvo_em': time.time(),
+        'cookies': driver.get_cookies(),
+        'local_storage': driver.execute_script(_JS_LER_STORAGE) or {},
+    }
+
+
+def aplicar(driver, sessao, agora=None):
+    """Reaplica a sessão capturada: abre o domínio (cookies só podem ser
+    gravados na origem certa), grava cookies ainda não vencidos e o
+    localStorage. Não navega para a rota autenticada — isso é a sonda."""
+    agora = time.time() if agora is None else agora
+    driver.get(URL_BASE)
+    aplicados = 0
+    for cookie in sessao.get('cookies', []):
+        if cookie.get('expiry') is not None and cookie['expiry'] <= agora:
+            continue
+        try:
+            driver.add_cookie(cookie)
+            aplicados += 1
+        except Exception as e:
+            print(f"   ⚠️  Cookie {cookie.get('name')!r} recusado: {e}")
+    if sessao.get('local_storage'):
+        driver.execute_script(_JS_GRAVAR_STORAGE, sessao['local_storage'])
+    return aplicados
+
+
+def salvar_sessao(driver, caminho=None, chave=None):
+    """Grava a sessão atual cifrada. Devolve True se gravou."""
+    fernet = _fernet(chave)
+    if fernet is None:
+        return False
+    caminho = Path(caminho or caminho_sessao())
+    try:
+        dados = fernet.encrypt(json.dumps(capturar(driver)).encode('utf-8'))
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        # Grava em temporário + rename: workers paralelos podem salvar juntos
+        temporario = caminho.with_name(f"{caminho.name}.{os.getpid()}.tmp")
+        temporario.write_bytes(dados)
+        os.chmod(temporario, 0o600)
+        os.replace(temporario, caminho)
+        print(f"🔒 Sessão salva em {caminho}")
+        return True
+    except Exception as e:
+        print(f"⚠️  Não foi possível salvar a sessão: {type(e).__name__}: {e}")
+        return False
+
+
+def carregar_sessao(caminho=None, chave=None):
+    """Sessão decifrada do disco, ou None (sem arquivo, sem chave, chave
+    trocada ou arquivo corrompido)."""
+    fernet = _fernet(chave)
+    caminho = Path(caminho or caminho_sessao())
+    if fernet is None or not caminho.exists():
+        return None
+    try:
+        return json.loads(fernet.decrypt(caminho.read_bytes()))
+    except Exception as e:
+        print(f"⚠️  Sessão salva ilegível ({type(e).__name__}); será descartada")
+        return None
+
+
+def descartar_sessao(caminho=None):
+    caminho = Path(caminho or caminho_sessao())
+    if caminho.exists():
+        caminho.unlink()
+
+
+def retomar_ou_entrar(driver, sessao_valida, login, caminho=None, chave=None):
+    """Reaplica a sessão salva e só chama `login()` se ela não existir ou se
+    `sessao_valida()` disser que venceu. Nos dois casos regrava a sessão no
+    fim: o servidor pode ter renovado cookies/token, e sem regravar a salva
+    venceria na validade do primeiro login. Devolve True se pulou o login."""
+    sessao = carregar_sessao(caminho, chave)
+    pulou = False
+    if sessao:
+        try:
+            aplicar(driver, sessao)
+            pulou = sessao_valida()
+            if pulou:
+                print(f"[{datetime.now()}] ♻️  Sessão anterior reaproveitada (login pulado)")
+            else:
+                print("⚠️  Sessão salva expirou; fazendo login completo...")
+        except Exception as e:
+            print(f"⚠️  Falha ao restaurar sessão ({type(e).__name__}: {e}); fazendo login completo...")
+        if not pulou:
+            descartar_sessao(caminho)
+    if not pulou:
+        login()
+    salvar_sessao(driver, caminho, chave)
+    return pulou
+
+
+if __name__ == '__main__':
+    if '--gerar-chave' in sys.argv:
+        from cryptography.fernet import Fernet
+        print(Fernet.generate_key().decode())
+    else:
+        print(__doc__)
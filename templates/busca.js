@@ -0,0 +1,49 @@
+        // ── Busca: tokens e consulta ──────────────────────────────
+        // Sem DOM: roda no worker de busca (worker_busca.js) e, sem worker,
+        // na própria página. Tokens sem acento → ids dos registros (posição
+        // em escalas[dia].registros, o data-id do card).
+        function dobrarTexto(texto) {
+            return String(texto || '').normalize('NFD').replace(/[\u0300-\u036f]/g, '').toLowerCase();
+        }
+
+        function tokensDe(texto) {
+            return dobrarTexto(texto).split(/[^a-z0-9]+/).filter(Boolean);
+        }
+
+        // { porToken: token → ids, ordenados: tokens em ordem } de `textos` (um por id)
+        function indexarTextos(textos) {
+            const porToken = new Map();
+            textos.forEach((texto, id) => {
+                new Set(tokensDe(texto)).forEach(t => {
+                    if (!porToken.has(t)) porToken.set(t, []);
+                    porToken.get(t).push(id);
+                });
+            });
+            return { porToken, ordenados: [...porToken.keys()].sort() };
+        }
+
+        // Ids com algum token começando por `prefixo` (busca binária nos ordenados)
+        function idsDoPrefixo(indice, prefixo) {
+            const { ordenados, porToken } = indice;
+            let lo = 0, hi = ordenados.length;
+            while (lo < hi) {
+                const meio = (lo + hi) >> 1;
+                if (ordenados[meio] < prefixo) lo = meio + 1; else hi = meio;
+            }
+            const ids = new Set();
+            for (let i = lo; i < ordenados.length && ordenados[i].startsWith(prefixo); i++) {
+                porToken.get(ordenados[i]).forEach(id => ids.add(id));
+            }
+            return ids;
+        }
+
+        // Ids que casam com a busca (toda palavra é começo de algum token), ou null = todos
+        function idsDaBusca(indice, busca) {
+            let ids = null;
+            for (const palavra of new Set(tokensDe(busca))) {
+                const doPrefixo = idsDoPrefixo(indice, palavra);
+                ids = ids === null ? doPrefixo : new Set([...ids].filter(id => doPrefixo.has(id)));
+                if (ids.size === 0) break;
+            }
+            return ids;
+        }
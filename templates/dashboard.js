@@ -0,0 +1,1481 @@
+        // Autenticação persistente via localStorage
+
+        // Dados da página: embutidos no HTML (padrão) ou, no modo --assets,
+        // buscados em paralelo (escala.json + tabelas com hash no nome).
+        // aplicarDados() preenche as variáveis abaixo antes da renderização.
+        let escalas = null;
+        let ramaisData = {};
+        // Setor do dashboard → ramais (sem repetição), pré-calculado pelo gerador
+        let ramaisPorSetor = {};
+        // Por dia da janela: {adicionados, removidos, trocas, desde}
+        let mudancas = {};
+        let profissionaisData = { professionals: [] };
+        // Mapa de profissionais por nome para acessar telefones
+        const mapaProfissionais = {};
+
+        const DADOS_EMBUTIDOS = {{ dados_embutidos }};
+        const ASSETS = {{ assets }};
+
+        function buscarJSON(url, opcoes) {
+            return fetch(url, opcoes).then(r => {
+                if (!r.ok) throw new Error(`${url}: HTTP ${r.status}`);
+                return r.json();
+            });
+        }
+
+        const dadosProntos = DADOS_EMBUTIDOS ? Promise.resolve(DADOS_EMBUTIDOS) : Promise.all([
+            // A escala muda todo dia: sempre revalida. As tabelas têm hash no nome.
+            buscarJSON(ASSETS.escala, { cache: 'no-cache' }),
+            ...ASSETS.tabelas.map(t => buscarJSON(t.url))
+        ]).then(([dados, ...tabelas]) => {
+            ASSETS.tabelas.forEach((t, i) => { dados[t.nome] = tabelas[i]; });
+            return dados;
+        });
+
+        let dadosCarregados = null;
+        function aplicarDados(dados) {
+            dadosCarregados = dados;
+            escalas = dados.escalas;
+            ramaisData = dados.ramais || {};
+            ramaisPorSetor = dados.ramaisPorSetor || {};
+            mudancas = dados.mudancas || {};
+            profissionaisData = dados.profissionais || { professionals: [] };
+            (profissionaisData.professionals || []).forEach(prof => {
+                mapaProfissionais[prof.name.toLowerCase()] = prof;
+            });
+            console.log('✅ Dados carregados:', escalas ? Object.keys(escalas).length : 0, 'keys em escalas,',
+                (ramaisData.departments || []).length, 'departments de ramais');
+        }
+
+        let diaSelecionado = 'atual';
+
+        // Função para obter ramais de um setor
+        function obterRamaisSetor(setorNome) {
+            return ramaisPorSetor[setorNome] || [];
+        }
+
+        // Função para formatar ramais para exibição
+        function formatarRamaisDisplay(extensions) {
+            try {
+                if (!extensions || extensions.length === 0) {
+                    return '';
+                }
+
+                // Remover duplicatas
+                const uniqueExts = [...new Set(extensions)];
+
+                // Limitar exibição a 5 ramais
+                if (uniqueExts.length > 5) {
+                    const extsStr = uniqueExts.slice(0, 5).join(', ');
+                    const allExtsStr = uniqueExts.join(', ');
+                    return ` <span class="setor-ramais" title="${allExtsStr}">(${extsStr}...)</span>`;
+                } else {
+                    const extsStr = uniqueExts.join(', ');
+                    return ` <span class="setor-ramais">(${extsStr})</span>`;
+                }
+            } catch (e) {
+                console.error('❌ Erro em formatarRamaisDisplay:', e);
+                return '';
+            }
+        }
+
+        // Funções para o modal de ramais
+        function abrirDiretorioRamais() {
+            const modal = document.getElementById('ramais-modal');
+            modal.classList.add('active');
+            renderizarDiretorioRamais();
+        }
+
+        function fecharDiretorioRamais() {
+            const modal = document.getElementById('ramais-modal');
+            modal.classList.remove('active');
+        }
+
+        function renderizarDiretorioRamais() {
+            try {
+                const ramaisList = document.getElementById('ramais-list');
+
+                console.log('%c🔄 renderizarDiretorioRamais - INICIANDO', 'color: green; font-weight: bold');
+                console.log('ramaisData type:', typeof ramaisData);
+                console.log('ramaisData keys:', ramaisData ? Object.keys(ramaisData) : 'null/undefined');
+                console.log('ramaisData.departments:', ramaisData && ramaisData.departments ? 'exists, length: ' + ramaisData.departments.length : 'NOT FOUND');
+
+                if (!ramaisList) {
+                    console.error('❌ CRÍTICO: #ramais-list element not found!');
+                    return;
+                }
+
+                if (!ramaisData || !ramaisData.departments) {
+                    console.warn('⚠️  ramaisData.departments not available');
+                    console.warn('Full ramaisData:', ramaisData);
+                    ramaisList.innerHTML = '<p style="text-align: center; color: #666;">Dados de ramais não disponíveis.</p>';
+                    return;
+                }
+
+                console.log('✅ ramaisData.departments encontrado com', ramaisData.departments.length, 'itens');
+
+                const departamentos = [...ramaisData.departments].sort((a, b) =>
+                    a.name.localeCompare(b.name, 'pt-BR')
+                );
+
+                const html = departamentos.map(dept => {
+                    const extsStr = dept.extensions.join(', ');
+                    // Cada ramal vira um link tel: (no celular, toca para discar)
+                    const extsDisplay = dept.extensions.map(ext =>
+                        `<a href="tel:${String(ext).replace(/\D/g, '')}" class="ramal-tel-link">${ext}</a>`
+                    ).join(' | ');
+                    // Split department name by " - " to get main name and sub-area
+                    const nameParts = dept.name.split(' - ');
+                    const mainName = nameParts[0];
+                    const subArea = nameParts.length > 1 ? nameParts.slice(1).join(' - ') : '';
+
+                    return `
+                        <div class="ramal-item" data-search="${dept.name.toLowerCase()} ${extsStr}">
+                            <div class="ramal-dept-line">${mainName}${subArea ? ' | ' + subArea : ''}</div>
+                            <div class="ramal-exts-line">${extsDisplay}</div>
+                        </div>
+                    `;
+                }).join('');
+
+                ramaisList.innerHTML = html;
+                console.log('✅ renderizarDiretorioRamais completado com', departamentos.length, 'departamentos');
+            } catch (error) {
+                console.error('❌ ERRO em renderizarDiretorioRamais:', error.message);
+                console.error('Stack:', error.stack);
+                const ramaisList = document.getElementById('ramais-list');
+                if (ramaisList) {
+                    ramaisList.innerHTML = '<p style="text-align: center; color: #cc0000;">Erro ao carregar ramais: ' + error.message + '</p>';
+                }
+            }
+        }
+
+        function filtrarRamais() {
+            const searchText = document.getElementById('ramais-search').value.toLowerCase();
+            const ramalItems = document.querySelectorAll('.ramal-item');
+
+            ramalItems.forEach(item => {
+                const searchData = item.getAttribute('data-search');
+                if (searchData.includes(searchText)) {
+                    item.style.display = 'block';
+                } else {
+                    item.style.display = 'none';
+                }
+            });
+        }
+
+        // Fechar modal de ramais ao clicar fora
+        document.getElementById('ramais-modal').addEventListener('click', function(e) {
+            if (e.target === this) {
+                fecharDiretorioRamais();
+            }
+        });
+
+        // Filtro ativo por período ('' = todos). Combina com a busca por texto.
+        let filtroPeriodo = '';
+
+        // Mapeia o tipo de badge para o grupo do chip de filtro
+        function grupoDoTipo(tipo) {
+            if (tipo === 'matutino' || tipo === 'diurno') return 'manha';
+            if (tipo === 'vespertino') return 'tarde';
+            if (tipo === 'noturno') return 'noite';
+            if (tipo === 'sobreaviso') return 'sobreaviso';
+            if (tipo === 'badge-24h') return '24h';
+            return 'outro';
+        }
+
+        // ── Índice de busca ───────────────────────────────────────
+        // Montado uma vez por vista de dia (ver montarVista) e guardado nela:
+        // o nó de cada card, os ids de cada categoria e o grupo de período de
+        // cada registro. Os tokens (busca.js) ficam no worker de busca
+        // (worker-busca.js, gerado de templates/worker_busca.js), que também
+        // responde às consultas: a página só troca a classe dos cards que
+        // mudaram de estado. Sem worker (file://, navegador sem suporte, erro
+        // ao carregar) o mesmo busca.js roda aqui.
+{{> busca.js }}
+        let indiceBusca = null;
+        const tokensPorDia = new WeakMap();  // registros do dia → tokens (busca sem worker)
+        const chavesPorDia = new WeakMap();  // registros do dia → chave do índice no worker
+        let _chaveBusca = 0;
+        let workerBusca = null;
+        let _buscaPendente = null;  // { seq, indice, search } à espera do worker
+        let _seqBusca = 0;
+
+        function textoDeBusca(r) {
+            return `${r.profissional} ${r.setor} ${r.tipo_turno}`;
+        }
+
+        function tokensDoDia(registros) {
+            let indice = tokensPorDia.get(registros);
+            if (!indice) {
+                indice = indexarTextos(registros.map(textoDeBusca));
+                tokensPorDia.set(registros, indice);
+            }
+            return indice;
+        }
+
+        function iniciarWorkerBusca() {
+            if (!window.Worker || !/^https?:$/.test(location.protocol)) return;
+            try {
+                workerBusca = new Worker('worker-busca.js');
+            } catch (e) {
+                console.warn('⚠️  Worker de busca indisponível:', e.message);
+                return;
+            }
+            workerBusca.onmessage = ev => {
+                const pendente = _buscaPendente;
+                if (!pendente || ev.data.seq !== pendente.seq) return;  // já há busca mais nova
+                _buscaPendente = null;
+                if (pendente.indice !== indiceBusca) return;
+                const casam = !ev.data.valido
+                    ? idsDaBusca(tokensDoDia(pendente.indice.registros), pendente.search)
+                    : ev.data.ids === null ? null : new Set(ev.data.ids);
+                aplicarBusca(casam, pendente.search);
+            };
+            workerBusca.onerror = ev => {
+                console.warn('⚠️  Worker de busca falhou — buscando na página:', ev.message);
+                workerBusca.terminate();
+                workerBusca = null;
+                if (_buscaPendente) {
+                    _buscaPendente = null;
+                    filtrarProfissionais();
+                }
+            };
+        }
+        iniciarWorkerBusca();
+
+        // Manda os tokens do dia para o worker, uma vez por registros; a chave
+        // identifica o índice nas consultas (null sem worker)
+        function indexarNoWorker(dia, registros) {
+            if (!workerBusca) return null;
+            let chave = chavesPorDia.get(registros);
+            if (chave === undefined) {
+                chave = ++_chaveBusca;
+                chavesPorDia.set(registros, chave);
+                workerBusca.postMessage({ tipo: 'indexar', dia, chave, textos: registros.map(textoDeBusca) });
+            }
+            return chave;
+        }
+
+        function construirIndiceBusca(container, registros, dia) {
+            const nos = new Array(registros.length);
+            container.querySelectorAll('.profissional').forEach(el => {
+                nos[+el.getAttribute('data-id')] = el;
+            });
+            const categorias = Array.from(container.querySelectorAll('.category'), el => ({
+                el,
+                ids: Array.from(el.querySelectorAll('.profissional'), p => +p.getAttribute('data-id')),
+                oculta: el.classList.contains('filtro-oculto')
+            }));
+            // Cards reaproveitados chegam com o estado da última busca
+            const ocultos = new Uint8Array(registros.length);
+            nos.forEach((el, id) => { if (el.classList.contains('filtro-oculto')) ocultos[id] = 1; });
+            return {
+                container,
+                registros,
+                dia,
+                chave: indexarNoWorker(dia, registros),
+                nos,
+                categorias,
+                grupos: registros.map(r => grupoDoTipo(r.tipo_badge)),
+                ocultos
+            };
+        }
+
+        // Digitação: espera a pessoa parar e filtra no próximo quadro
+        let _buscaTimer = null;
+        function agendarBusca() {
+            clearTimeout(_buscaTimer);
+            _buscaTimer = setTimeout(() => requestAnimationFrame(filtrarProfissionais), 120);
+        }
+
+        // Com texto e worker, a consulta vai para o worker e o resultado é
+        // aplicado quando chega (se ainda for a última); senão, na hora
+        function filtrarProfissionais() {
+            clearTimeout(_buscaTimer);
+            if (!indiceBusca) return;
+            const search = document.getElementById('search').value.trim();
+            if (search && workerBusca && indiceBusca.chave !== null) {
+                _buscaPendente = { seq: ++_seqBusca, indice: indiceBusca, search };
+                workerBusca.postMessage({
+                    tipo: 'buscar', dia: indiceBusca.dia, chave: indiceBusca.chave, busca: search, seq: _seqBusca
+                });
+                return;
+            }
+            _buscaPendente = null;
+            aplicarBusca(search ? idsDaBusca(tokensDoDia(indiceBusca.registros), search) : null, search);
+        }
+
+        // Mostra só os cards em `casam` (ids, ou null = todos) e do filtro de período
+        function aplicarBusca(casam, search) {
+            const { nos, categorias, grupos, ocultos } = indiceBusca;
+
+            // Primeiro decide tudo, depois escreve só o que mudou
+            const mudaram = [];
+            let visibleCount = 0;
+            nos.forEach((prof, id) => {
+                let passa = casam === null || casam.has(id);
+                if (passa && filtroPeriodo === 'agora') {
+                    passa = prof.classList.contains('plantao-agora');
+                } else if (passa && filtroPeriodo) {
+                    passa = grupos[id] === filtroPeriodo;
+                }
+                if (passa) visibleCount++;
+                if (ocultos[id] !== (passa ? 0 : 1)) {
+                    ocultos[id] = passa ? 0 : 1;
+                    mudaram.push(id);
+                }
+            });
+            mudaram.forEach(id => nos[id].classList.toggle('filtro-oculto', ocultos[id] === 1));
+
+            // Esconde categorias sem profissionais visíveis
+            categorias.forEach(cat => {
+                const oculta = cat.ids.every(id => ocultos[id]);
+                if (oculta !== cat.oculta) {
+                    cat.oculta = oculta;
+                    cat.el.classList.toggle('filtro-oculto', oculta);
+                }
+            });
+
+            // Estado vazio com saída clara
+            let emptyEl = indiceBusca.container.querySelector(':scope > .empty-state');
+            if (visibleCount === 0 && (search || filtroPeriodo)) {
+                if (!emptyEl) {
+                    emptyEl = document.createElement('div');
+                    emptyEl.className = 'empty-state';
+                    indiceBusca.container.appendChild(emptyEl);
+                }
+                const criterio = search ? `para "<strong>${search}</strong>"` : 'para este filtro';
+                emptyEl.innerHTML = `<p>Nenhum profissional encontrado ${criterio} neste dia.</p>` +
+                    `<button onclick="limparFiltros()">Limpar busca e filtros</button>`;
+                emptyEl.style.display = 'block';
+            } else if (emptyEl) {
+                emptyEl.style.display = 'none';
+            }
+        }
+
+        function limparFiltros() {
+            document.getElementById('search').value = '';
+            filtroPeriodo = '';
+            document.querySelectorAll('.filter-chip').forEach(c =>
+                c.classList.toggle('active', c.getAttribute('data-filtro') === ''));
+            filtrarProfissionais();
+        }
+
+        function definirFiltroPeriodo(filtro) {
+            filtroPeriodo = (filtroPeriodo === filtro) ? '' : filtro;
+            if (filtroPeriodo === '') filtro = '';
+            document.querySelectorAll('.filter-chip').forEach(c =>
+                c.classList.toggle('active', c.getAttribute('data-filtro') === filtroPeriodo));
+            filtrarProfissionais();
+        }
+
+        function temMultiplosTurnos(setor) {
+            // Check if this sector has multiple different shifts (turnos)
+            // by examining the actual data, not just the sector name
+            const profissionaisDaSetor = escalas.atual.registros.filter(reg => reg.setor === setor);
+            if (profissionaisDaSetor.length === 0) return false;
+
+            const turnosUnicos = new Set(profissionaisDaSetor.map(prof => prof.turno_nome));
+
+            return turnosUnicos.size > 1;
+        }
+
+        function formatarTipoBadge(tipoBadge) {
+            // Converte o tipo de turno em texto legível para a badge
+            const mapping = {
+                'badge-24h': '24H',
+                'matutino': 'MATUTINO',
+                'vespertino': 'VESPERTINO',
+                'noturno': 'NOTURNO',
+                'sobreaviso': 'SOBREAVISO',
+                'rotina': 'ROTINA',
+                'plantao': 'PLANTÃO',
+                'misto': 'MISTO',
+                'outro': 'OUTRO'
+            };
+            return mapping[tipoBadge] || tipoBadge.toUpperCase();
+        }
+
+        function pluralizarProfissional(count) {
+            // Retorna singular ou plural corretamente
+            return count === 1 ? `${count} profissional` : `${count} profissionais`;
+        }
+
+        function selecionarDia(dia) {
+            diaSelecionado = dia;
+            document.querySelectorAll('.date-btn').forEach(btn => btn.classList.remove('active'));
+            document.querySelector(`[data-dia="${dia}"]`).classList.add('active');
+            document.getElementById('search').value = '';
+            renderizarEscala();
+        }
+
+        // ── Preferências por usuário ──────────────────────────────
+        function getPrefs() {
+            const user = localStorage.getItem('auth_user') || 'guest';
+            const raw = localStorage.getItem('prefs_' + user);
+            return raw ? JSON.parse(raw) : { favoritos: [], ocultos: [] };
+        }
+        function savePrefs(prefs) {
+            const user = localStorage.getItem('auth_user') || 'guest';
+            localStorage.setItem('prefs_' + user, JSON.stringify(prefs));
+        }
+        function toggleFavorito(setor) {
+            const prefs = getPrefs();
+            const idx = prefs.favoritos.indexOf(setor);
+            if (idx === -1) prefs.favoritos.push(setor);
+            else prefs.favoritos.splice(idx, 1);
+            savePrefs(prefs);
+            renderizarEscala();
+        }
+        function toggleOcultar(setor) {
+            const prefs = getPrefs();
+            const oIdx = prefs.ocultos.indexOf(setor);
+            let ocultou = false;
+            if (oIdx === -1) {
+                prefs.ocultos.push(setor);
+                const fIdx = prefs.favoritos.indexOf(setor);
+                if (fIdx !== -1) prefs.favoritos.splice(fIdx, 1);
+                ocultou = true;
+            } else {
+                prefs.ocultos.splice(oIdx, 1);
+            }
+            savePrefs(prefs);
+            renderizarEscala();
+            if (ocultou) mostrarToast('Setor ocultado — reexiba na barra no rodapé da lista.');
+        }
+
+        // Aviso temporário no rodapé da tela
+        // (com `acao`, o aviso fica mais tempo e responde ao toque)
+        let _toastTimer = null;
+        function mostrarToast(msg, acao) {
+            let t = document.getElementById('toast');
+            if (!t) {
+                t = document.createElement('div');
+                t.id = 'toast';
+                t.className = 'toast';
+                document.body.appendChild(t);
+            }
+            t.textContent = msg;
+            t.classList.toggle('acionavel', !!acao);
+            t.onclick = acao ? () => { t.classList.remove('show'); acao(); } : null;
+            t.classList.add('show');
+            clearTimeout(_toastTimer);
+            _toastTimer = setTimeout(() => t.classList.remove('show'), acao ? 10000 : 3200);
+        }
+        // ─────────────────────────────────────────────────────────
+
+        // ── Renderização por setor ────────────────────────────────
+        // Setores excluídos da impressão (foco no PS) — lista em pre_renderizacao.py
+        const EXCLUIR_PRINT = {{ excluir_print }};
+
+        // HTML do card de um setor (um nó .category)
+        function htmlSetor(setor, profissionais, idDe, isFavorito, isPrintExcluded) {
+            // Note: ramais display is disabled for now - only shown in the Ramais modal
+            // const ramaisSetor = obterRamaisSetor(setor);
+            // const ramaisDisplay = formatarRamaisDisplay(ramaisSetor);
+
+            if (temMultiplosTurnos(setor)) {
+                const porTurno = {};
+                const turnoOrdem = {};
+
+                profissionais.forEach(prof => {
+                    const nome = prof.turno_nome;
+                    turnoOrdem[nome] = prof.turno_ordem;
+                    if (!porTurno[nome]) {
+                        porTurno[nome] = [];
+                    }
+                    porTurno[nome].push(prof);
+                });
+
+                const turnosOrdenados = Object.keys(porTurno).sort((a, b) => turnoOrdem[a] - turnoOrdem[b]);
+
+                return `
+                <div class="category category-full${isFavorito ? ' setor-favorito' : ''}${isPrintExcluded ? ' print-exclude' : ''}" data-setor="${setor}">
+                    <div class="categoria-header expanded">
+                        <div class="categoria-header-text">
+                            <div class="categoria-nome">${isFavorito ? '★ ' : ''}<span class="setor-nome-full">${setor}</span><span class="setor-nome-curto">${setor.replace(/\s*[-–]\s*(Sobreaviso|Plantão|Plantao).*$/i, '').trim()}</span></div>
+                        </div>
+                        <div class="setor-pref-btns" onclick="event.stopPropagation()">
+                            <button class="btn-pref${isFavorito ? ' favorito-ativo' : ''}" onclick="toggleFavorito('${setor.replace(/'/g, "\'")}')" title="${isFavorito ? 'Remover dos favoritos' : 'Favoritar setor'}">★</button>
+                            <button class="btn-pref" onclick="toggleOcultar('${setor.replace(/'/g, "\'")}')" title="Ocultar este setor da lista (reversível no rodapé)">✕</button>
+                        </div>
+                    </div>
+                    <div class="categoria-content">
+                        <div class="turnos-container">
+                            ${turnosOrdenados.map(turno => {
+                                const profs = porTurno[turno];
+                                return `
+                                <div class="turno-coluna">
+                                    <div class="turno-title" data-count="${profs.length}">${turno}</div>
+                                    <div class="profissionais-list">
+                                        ${profs.map(prof => {
+                                            const profData = mapaProfissionais[prof.profissional.toLowerCase()];
+                                            const telefone = profData ? profData.phone : 'N/A';
+                                            const telefoneLimpo = telefone.replace(/\D/g, '');
+                                            const whatsappUrl = `https://wa.me/55${telefoneLimpo}`;
+                                            return `
+                                            <div class="profissional stripe-${prof.tipo_badge}" data-id="${idDe.get(prof)}" data-hora="${prof.horario}">
+                                                <div class="profissional-nome">
+                                                    ${telefone !== 'N/A' ? `<a href="${whatsappUrl}" target="_blank" class="telefone-icon-btn" data-phone="${telefone}" title="WhatsApp: ${telefone}"><span class="telefone-icon"></span></a>` : ''}
+                                                    <div class="profissional-nome-wrapper">
+                                                        <span class="profissional-nome-text">${prof.profissional}</span><span class="profissional-nome-curto">${(p => p.length <= 2 ? p.join(' ') : p[0] + ' ' + p[p.length-1])(prof.profissional.trim().split(/\s+/))}</span>
+                                                    </div>
+                                                </div>
+                                                <div class="profissional-info">
+                                                    <span class="info-horario">${prof.horario}</span>
+                                                    <span class="turno-badge ${prof.tipo_badge}" title="${prof.tipo_turno}">${formatarTipoBadge(prof.tipo_badge)}</span>
+                                                </div>
+                                            </div>
+                                        `}).join('')}
+                                    </div>
+                                </div>
+                                `;
+                            }).join('')}
+                        </div>
+                    </div>
+                </div>
+                `;
+            } else {
+                return `
+                <div class="category${isFavorito ? ' setor-favorito' : ''}${isPrintExcluded ? ' print-exclude' : ''}" data-setor="${setor}">
+                    <div class="categoria-header expanded">
+                        <div class="categoria-header-text">
+                            <div class="categoria-nome">${isFavorito ? '★ ' : ''}<span class="setor-nome-full">${setor}</span><span class="setor-nome-curto">${setor.replace(/\s*[-–]\s*(Sobreaviso|Plantão|Plantao).*$/i, '').trim()}</span></div>
+                        </div>
+                        <div class="setor-pref-btns" onclick="event.stopPropagation()">
+                            <button class="btn-pref${isFavorito ? ' favorito-ativo' : ''}" onclick="toggleFavorito('${setor.replace(/'/g, "\'")}')" title="${isFavorito ? 'Remover dos favoritos' : 'Favoritar setor'}">★</button>
+                            <button class="btn-pref" onclick="toggleOcultar('${setor.replace(/'/g, "\'")}')" title="Ocultar este setor da lista (reversível no rodapé)">✕</button>
+                        </div>
+                    </div>
+                    <div class="categoria-content">
+                        <div class="profissionais-list">
+                            ${profissionais.map(prof => {
+                                const profData = mapaProfissionais[prof.profissional.toLowerCase()];
+                                const telefone = profData ? profData.phone : 'N/A';
+                                const telefoneLimpo = telefone.replace(/\D/g, '');
+                                const whatsappUrl = `https://wa.me/55${telefoneLimpo}`;
+                                return `
+                                <div class="profissional stripe-${prof.tipo_badge}" data-id="${idDe.get(prof)}" data-hora="${prof.horario}">
+                                    <div class="profissional-nome">
+                                        ${telefone !== 'N/A' ? `<a href="${whatsappUrl}" target="_blank" class="telefone-icon-btn" data-phone="${telefone}" title="WhatsApp: ${telefone}"><span class="telefone-icon"></span></a>` : ''}
+                                        <div class="profissional-nome-wrapper">
+                                            <span class="profissional-nome-text">${prof.profissional}</span><span class="profissional-nome-curto">${(p => p.length <= 2 ? p.join(' ') : p[0] + ' ' + p[p.length-1])(prof.profissional.trim().split(/\s+/))}</span>
+                                        </div>
+                                    </div>
+                                    <div class="profissional-info">
+                                        <span class="info-horario">${prof.horario}</span>
+                                        <span class="turno-badge ${prof.tipo_badge}" title="${prof.tipo_turno}">${formatarTipoBadge(prof.tipo_badge)}</span>
+                                    </div>
+                                </div>
+                            `}).join('')}
+                        </div>
+                    </div>
+                </div>
+                `;
+            }
+        }
+
+        // Cada dia tem a sua vista (<div class="vista-dia"> em #categorias) e
+        // trocar de dia só troca qual está visível: a vista já montada com os
+        // mesmos registros e preferências nem é tocada, e o índice de busca
+        // dela é reaproveitado. Depois da primeira renderização os outros dias
+        // são montados em tempo ocioso. A vista do dia inicial pode chegar
+        // pré-renderizada pelo gerador (pre_renderizacao.py): é adotada, não
+        // recriada.
+        //
+        // Dentro da vista, cada setor é um nó guardado por dia (registros do
+        // dia → setor → nó) e reaproveitado: favoritar ou ocultar só move,
+        // insere ou tira nós; recria só o setor cujo card mudou (favorito).
+        // Quando há muito a montar, os primeiros setores entram na hora e o
+        // resto em tempo ocioso; só então vêm índice de busca, chips...
+        const SETORES_IMEDIATOS = 8;
+        const DIAS = ['anterior', 'atual', 'seguinte'];
+        const nosPorDia = new WeakMap();
+        const vistas = {};  // dia → { el, registros, chave, indice, pendente, porSetor, setoresVisiveis }
+        let _preMontagem = null;
+        const quandoOcioso = window.requestIdleCallback
+            ? cb => requestIdleCallback(cb, { timeout: 300 })
+            : cb => setTimeout(() => cb({ timeRemaining: () => 8 }), 16);
+        const cancelarOcioso = window.requestIdleCallback
+            ? id => cancelIdleCallback(id)
+            : id => clearTimeout(id);
+
+        function cancelarVista(vista) {
+            if (vista.pendente !== null) {
+                cancelarOcioso(vista.pendente);
+                vista.pendente = null;
+            }
+        }
+
+        // Esquece todas as vistas (antes de reescrever #categorias inteiro)
+        function descartarVistas() {
+            if (_preMontagem !== null) {
+                cancelarOcioso(_preMontagem);
+                _preMontagem = null;
+            }
+            Object.keys(vistas).forEach(dia => {
+                cancelarVista(vistas[dia]);
+                delete vistas[dia];
+            });
+            indiceBusca = null;
+        }
+
+        // Container da vista do dia (criado, ou adotado do HTML pré-renderizado)
+        function vistaDoDia(dia, registros) {
+            if (vistas[dia]) return vistas[dia];
+            const container = document.getElementById('categorias');
+            let el = container.querySelector(`.vista-dia[data-dia="${dia}"]`);
+            if (el && el.hasAttribute('data-pre')) {
+                // Cards do gerador: viram os nós do dia se são destes registros
+                if (+el.getAttribute('data-pre') === registros.length) {
+                    const nos = new Map();
+                    Array.from(el.children).forEach(cat =>
+                        nos.set(cat.getAttribute('data-setor'), { el: cat, favorito: false }));
+                    nosPorDia.set(registros, nos);
+                } else {
+                    el.textContent = '';
+                }
+                el.removeAttribute('data-pre');
+            }
+            if (!el) {
+                el = document.createElement('div');
+                el.className = 'vista-dia';
+                el.setAttribute('data-dia', dia);
+                el.hidden = dia !== diaSelecionado;
+                container.appendChild(el);
+            }
+            vistas[dia] = {
+                el, registros: null, chave: null, indice: null, pendente: null,
+                porSetor: null, setoresVisiveis: null
+            };
+            return vistas[dia];
+        }
+
+        function mostrarVista(dia) {
+            document.querySelectorAll('#categorias > .vista-dia').forEach(el => {
+                el.hidden = el.getAttribute('data-dia') !== dia;
+            });
+        }
+
+        // Vista do dia selecionado (ou #categorias, antes da primeira)
+        function vistaAtual() {
+            const vista = vistas[diaSelecionado];
+            return vista ? vista.el : document.getElementById('categorias');
+        }
+
+        function setoresDoDia(registros, prefs) {
+            const porSetor = {};
+            registros.forEach(prof => {
+                if (!porSetor[prof.setor]) {
+                    porSetor[prof.setor] = [];
+                }
+                porSetor[prof.setor].push(prof);
+            });
+            const todosSetores = Object.keys(porSetor).sort();
+            const setoresVisiveis = [
+                ...todosSetores.filter(s => prefs.favoritos.includes(s)),
+                ...todosSetores.filter(s => !prefs.favoritos.includes(s) && !prefs.ocultos.includes(s))
+            ];
+            const setoresOcultos = todosSetores.filter(s => prefs.ocultos.includes(s));
+            return { porSetor, setoresVisiveis, setoresOcultos };
+        }
+
+        // Deixa em `container` exatamente os nós de `alvo`, nessa ordem, tirando
+        // os que sobram e movendo só os que estão fora do lugar
+        function reconciliar(container, alvo) {
+            const manter = new Set(alvo);
+            Array.from(container.children).forEach(el => { if (!manter.has(el)) el.remove(); });
+            let ref = container.firstElementChild;
+            alvo.forEach(el => {
+                if (el === ref) ref = ref.nextElementSibling;
+                else container.insertBefore(el, ref);
+            });
+        }
+
+        // Monta (ou atualiza) a vista de `dia`; aoConcluir(vista) quando todos
+        // os cards estão no lugar e o índice de busca da vista está pronto
+        function montarVista(dia, registros, prefs, aoConcluir) {
+            const vista = vistaDoDia(dia, registros);
+            const chave = JSON.stringify([prefs.favoritos, prefs.ocultos]);
+            if (vista.registros === registros && vista.chave === chave) {
+                aoConcluir(vista);
+                return;
+            }
+            cancelarVista(vista);
+            vista.registros = null;  // até todos os cards estarem no lugar
+            vista.indice = null;
+            const container = vista.el;
+            const { porSetor, setoresVisiveis, setoresOcultos } = setoresDoDia(registros, prefs);
+
+            let nos = nosPorDia.get(registros);
+            if (!nos) {
+                nos = new Map();
+                nosPorDia.set(registros, nos);
+            }
+            let idDe = null;  // registro → posição em registros (data-id do card)
+            const pronto = setor => {
+                const item = nos.get(setor);
+                return item && item.favorito === prefs.favoritos.includes(setor);
+            };
+            const noDoSetor = setor => {
+                if (!pronto(setor)) {
+                    if (!idDe) idDe = new Map(registros.map((r, id) => [r, id]));
+                    const favorito = prefs.favoritos.includes(setor);
+                    const molde = document.createElement('template');
+                    molde.innerHTML = htmlSetor(setor, porSetor[setor], idDe, favorito, EXCLUIR_PRINT.includes(setor)).trim();
+                    nos.set(setor, { el: molde.content.firstElementChild, favorito });
+                }
+                return nos.get(setor).el;
+            };
+
+            // Poucos nós a montar (favoritar, ocultar, cards adotados): tudo na
+            // hora. Muitos (primeira vez no dia): os primeiros na hora
+            const faltam = setoresVisiveis.filter(s => !pronto(s)).length;
+            const imediatos = faltam <= SETORES_IMEDIATOS
+                ? setoresVisiveis.length
+                : Math.min(SETORES_IMEDIATOS, setoresVisiveis.length);
+            reconciliar(container, setoresVisiveis.slice(0, imediatos).map(noDoSetor));
+
+            const concluir = () => {
+                vista.pendente = null;
+                if (setoresOcultos.length > 0) {
+                    const molde = document.createElement('template');
+                    molde.innerHTML = `
+                <details class="setores-ocultos-bar">
+                    <summary>🚫 ${setoresOcultos.length} setor${setoresOcultos.length > 1 ? 'es' : ''} oculto${setoresOcultos.length > 1 ? 's' : ''} — clique para gerenciar</summary>
+                    <div class="setores-ocultos-lista">
+                        ${setoresOcultos.map(s => `
+                        <div class="setor-oculto-chip">
+                            <span>${s}</span>
+                            <button onclick="toggleOcultar('${s.replace(/'/g, "\'")}')" title="Mostrar setor">👁 mostrar</button>
+                        </div>`).join('')}
+                    </div>
+                </details>`.trim();
+                    container.appendChild(molde.content.firstElementChild);
+                }
+                // Índice da busca para os cards no lugar
+                Object.assign(vista, {
+                    registros, chave, porSetor, setoresVisiveis,
+                    indice: construirIndiceBusca(container, registros, dia)
+                });
+                aoConcluir(vista);
+            };
+
+            // O resto em tempo ocioso, em lotes, sem segurar a primeira pintura
+            let proximo = imediatos;
+            const montarResto = prazo => {
+                try {
+                    const lote = document.createDocumentFragment();
+                    do {
+                        lote.appendChild(noDoSetor(setoresVisiveis[proximo++]));
+                    } while (proximo < setoresVisiveis.length && prazo.timeRemaining() > 2);
+                    container.appendChild(lote);
+                    if (proximo < setoresVisiveis.length) vista.pendente = quandoOcioso(montarResto);
+                    else concluir();
+                } catch (e) {
+                    vista.pendente = null;
+                    console.error('❌ Erro ao montar setores:', e.message);
+                }
+            };
+            if (proximo < setoresVisiveis.length) vista.pendente = quandoOcioso(montarResto);
+            else concluir();
+        }
+
+        // Os outros dias, em tempo ocioso: a troca de dia já os encontra prontos
+        function preMontarOutrosDias() {
+            if (_preMontagem !== null) cancelarOcioso(_preMontagem);
+            _preMontagem = quandoOcioso(() => {
+                _preMontagem = null;
+                try {
+                    const prefs = getPrefs();
+                    DIAS.forEach(dia => {
+                        const dados = escalas && escalas[dia];
+                        if (dia === diaSelecionado || !dados || !Array.isArray(dados.registros) ||
+                            dados.registros.length === 0) return;
+                        montarVista(dia, dados.registros, prefs, () => {});
+                    });
+                } catch (e) {
+                    console.error('❌ Erro ao pré-montar os outros dias:', e.message);
+                }
+            });
+        }
+
+        function renderizarEscala() {
+            try {
+                console.log('%c🔄 Dashboard v3-ramais - INICIANDO RENDERIZAÇÃO', 'color: blue; font-weight: bold');
+
+                // Validate escalas data structure
+                console.log('1️⃣  Validando escalas:', typeof escalas, escalas ? 'não-null' : 'null');
+                if (!escalas) {
+                    console.error('❌ escalas é null/undefined');
+                    return;
+                }
+
+                console.log('2️⃣  Chaves de escalas:', Object.keys(escalas));
+                if (!escalas[diaSelecionado]) {
+                    console.error(`❌ escalas['${diaSelecionado}'] não existe. Chaves disponíveis:`, Object.keys(escalas));
+                    return;
+                }
+
+                const dados = escalas[diaSelecionado];
+                console.log('3️⃣  Dados do dia selecionado:', dados ? 'obtido' : 'null', 'Keys:', dados ? Object.keys(dados) : 'N/A');
+
+                if (!dados || !dados.registros || !Array.isArray(dados.registros)) {
+                    console.error('❌ dados.registros não é um array:', dados);
+                    return;
+                }
+
+                console.log(`✅ 4️⃣  Renderizando ${dados.registros.length} profissionais para ${diaSelecionado}`);
+
+                document.getElementById('data-selecionada').textContent = dados.data;
+                document.getElementById('print-date-display').textContent = dados.data;
+
+                // Dia sem dados (ex: "Amanhã" ainda não disponível): mostra aviso
+                if (dados.registros.length === 0) {
+                    const vista = vistaDoDia(diaSelecionado, dados.registros);
+                    cancelarVista(vista);
+                    Object.assign(vista, { registros: null, indice: null });
+                    indiceBusca = null;
+                    const rotuloDia = diaSelecionado === 'seguinte' ? 'do dia seguinte'
+                                    : diaSelecionado === 'anterior' ? 'do dia anterior' : 'deste dia';
+                    document.getElementById('stats').innerHTML = '';
+                    vista.el.innerHTML =
+                        '<p style="text-align:center;color:#666;padding:40px 20px;">A escala ' + rotuloDia +
+                        ' ainda não está disponível.</p>';
+                    mostrarVista(diaSelecionado);
+                    return;
+                }
+
+            // Mostrar indicador de status (dot colorido)
+            const statusAtualizacao = escalas.status_atualizacao;
+            const statusIndicator = document.getElementById('status-indicator');
+            statusIndicator.className = 'update-status-indicator';
+
+            if (statusAtualizacao === 'sucesso') {
+                statusIndicator.classList.add('sucesso');
+            } else if (statusAtualizacao === 'pendente') {
+                statusIndicator.classList.add('pendente');
+            } else {
+                statusIndicator.classList.add('erro');
+            }
+
+            // Texto com data/hora da última atualização
+            const statusText = document.getElementById('status-text');
+            if (statusText) {
+                const dataAtu = escalas.data_atualizacao || 'N/A';
+                const horaAtu = escalas.hora_atualizacao || '';
+                statusText.textContent = horaAtu
+                    ? `Atualizado em ${dataAtu} às ${horaAtu}`
+                    : `Atualizado em ${dataAtu}`;
+            }
+
+            // Setores: uma vista por dia, nós reaproveitados (ver montarVista).
+            // Pós-render ("agora", chips, índice de setores, frescor) só se o
+            // dia ainda é o selecionado quando a vista fica pronta
+            const dia = diaSelecionado;
+            indiceBusca = null;  // até todos os cards da vista estarem no lugar
+            mostrarVista(dia);
+            montarVista(dia, dados.registros, getPrefs(), vista => {
+                if (dia !== diaSelecionado) return;
+                indiceBusca = vista.indice;
+                aposRenderizar(vista.porSetor, vista.setoresVisiveis);
+                preMontarOutrosDias();
+            });
+
+            const totalSetores = new Set(dados.registros.map(prof => prof.setor)).size;
+            document.getElementById('stats').innerHTML = `
+                <div class="stat-card">
+                    <div class="stat-number">${dados.total}</div>
+                    <div class="stat-label">Profissionais</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-number">${totalSetores}</div>
+                    <div class="stat-label">Setores</div>
+                </div>
+            `;
+            } catch (error) {
+                descartarVistas();
+                console.error('❌ ERRO CRÍTICO em renderizarEscala:', error.message);
+                console.error('Stack:', error.stack);
+
+                // Display error message to user
+                const categoriasEl = document.getElementById('categorias');
+                if (categoriasEl) {
+                    categoriasEl.innerHTML = `
+                        <div style="padding: 20px; background: #ffe6e6; border: 2px solid #cc0000; border-radius: 8px; margin: 20px; color: #cc0000;">
+                            <h3>⚠️ Erro ao carregar dados</h3>
+                            <p>Mensagem: ${error.message}</p>
+                            <p style="font-size: 12px; color: #999;">Tente recarregar a página.</p>
+                        </div>
+                    `;
+                }
+            }
+        }
+
+
+        /* ============================================================
+           MELHORIAS V4 — tema, "agora", chips, índice, frescor, troca
+           ============================================================ */
+
+        const ROTULOS_PERIODO = {
+            manha: 'Manhã', tarde: 'Tarde', noite: 'Noite',
+            sobreaviso: 'Sobreaviso', '24h': '24h', outro: 'Outro'
+        };
+
+        // ── Plantão agora ─────────────────────────────────────────
+        // escalas.atual.agenda (dashboard_logic.agenda_plantoes): quem está em
+        // serviço às 00:00 e os eventos do dia [minuto, estado, ids], em ordem.
+        // O estado de um minuto sai de repassar os eventos; um único timer
+        // dorme até o próximo evento e só os cards que mudaram são tocados.
+        // Só o dia "atual" tem "agora".
+        const EM_SERVICO = 1, ENCERRADO = 2;
+        let estadoAgora = null;  // estado de cada card de _agoraNos
+        let _agoraNos = null;
+        let _agoraTimer = null;
+
+        function minutoDoDia(data) {
+            return data.getHours() * 60 + data.getMinutes();
+        }
+
+        function agendaDeHoje() {
+            return escalas && escalas.atual && escalas.atual.agenda;
+        }
+
+        // Cards da vista do dia atual, por id (null se a vista não está pronta)
+        function cardsDeHoje() {
+            const vista = vistas.atual;
+            return vista && vista.indice && vista.registros === escalas.atual.registros ? vista.indice.nos : null;
+        }
+
+        function estadosNoMinuto(agenda, total, minuto) {
+            const estados = new Uint8Array(total);
+            agenda.inicio.forEach(id => { estados[id] = EM_SERVICO; });
+            for (const [quando, estado, ids] of agenda.eventos) {
+                if (quando > minuto) break;
+                ids.forEach(id => { estados[id] = estado; });
+            }
+            return estados;
+        }
+
+        function marcarCard(prof, estado) {
+            prof.classList.toggle('plantao-agora', estado === EM_SERVICO);
+            prof.classList.toggle('plantao-encerrado', estado === ENCERRADO);
+            const pill = prof.querySelector('.agora-pill');
+            if (estado === EM_SERVICO && !pill) {
+                const info = prof.querySelector('.profissional-info');
+                if (info) {
+                    const span = document.createElement('span');
+                    span.className = 'agora-pill';
+                    span.textContent = 'Agora';
+                    info.appendChild(span);
+                }
+            } else if (estado !== EM_SERVICO && pill) {
+                pill.remove();
+            }
+        }
+
+        // Marca todos os cards do dia atual (depois de renderizar: cards
+        // recriados chegam sem marca) e arma o timer
+        function marcarAgora() {
+            const agenda = agendaDeHoje();
+            const nos = diaSelecionado === 'atual' && agenda ? cardsDeHoje() : null;
+            if (!nos) return;
+            estadoAgora = estadosNoMinuto(agenda, nos.length, minutoDoDia(new Date()));
+            _agoraNos = nos;
+            nos.forEach((prof, id) => marcarCard(prof, estadoAgora[id]));
+            agendarAgora();
+        }
+
+        // Dorme até o próximo evento da agenda (ou a meia-noite, quando o dia
+        // recomeça do estado das 00:00)
+        function agendarAgora() {
+            clearTimeout(_agoraTimer);
+            _agoraTimer = null;
+            const agenda = agendaDeHoje();
+            if (!agenda || document.hidden) return;
+            const agora = new Date();
+            const minuto = minutoDoDia(agora);
+            const proximo = agenda.eventos.find(([quando]) => quando > minuto);
+            const espera = ((proximo ? proximo[0] : 24 * 60) - minuto) * 60000 -
+                           agora.getSeconds() * 1000 - agora.getMilliseconds();
+            _agoraTimer = setTimeout(avancarAgora, Math.max(espera, 0) + 50);
+        }
+
+        // Aplica os eventos até agora: só os cards cujo estado mudou
+        function avancarAgora() {
+            const agenda = agendaDeHoje();
+            const nos = agenda ? cardsDeHoje() : null;
+            if (nos && nos === _agoraNos) {
+                const novo = estadosNoMinuto(agenda, nos.length, minutoDoDia(new Date()));
+                let mudou = false;
+                novo.forEach((estado, id) => {
+                    if (estado !== estadoAgora[id]) {
+                        marcarCard(nos[id], estado);
+                        mudou = true;
+                    }
+                });
+                estadoAgora = novo;
+                if (mudou && diaSelecionado === 'atual') {
+                    renderizarChips();
+                    if (filtroPeriodo === 'agora') filtrarProfissionais();
+                }
+            }
+            agendarAgora();
+        }
+
+        // Chips de filtro por período, com contagens do dia visível
+        function renderizarChips() {
+            const el = document.getElementById('filter-chips');
+            if (!el) return;
+            const contagens = { manha: 0, tarde: 0, noite: 0, sobreaviso: 0, '24h': 0 };
+            let agoraCount = 0;
+            if (indiceBusca) {
+                indiceBusca.nos.forEach((prof, id) => {
+                    const g = indiceBusca.grupos[id];
+                    if (contagens[g] !== undefined) contagens[g]++;
+                    if (prof.classList.contains('plantao-agora')) agoraCount++;
+                });
+            }
+
+            let html = `<button class="filter-chip${filtroPeriodo === '' ? ' active' : ''}" data-filtro="" onclick="definirFiltroPeriodo('')">Todos</button>`;
+            if (agoraCount > 0) {
+                html += `<button class="filter-chip${filtroPeriodo === 'agora' ? ' active' : ''}" data-filtro="agora" onclick="definirFiltroPeriodo('agora')"><span class="chip-dot"></span>Agora · ${agoraCount}</button>`;
+            }
+            ['manha', 'tarde', 'noite', 'sobreaviso', '24h'].forEach(g => {
+                if (contagens[g] > 0) {
+                    html += `<button class="filter-chip${filtroPeriodo === g ? ' active' : ''}" data-filtro="${g}" onclick="definirFiltroPeriodo('${g}')">${ROTULOS_PERIODO[g]} · ${contagens[g]}</button>`;
+                }
+            });
+            el.innerHTML = html;
+        }
+
+        // Dropdown "Ir para setor" (compacto, sem scroll horizontal)
+        function renderizarSetorIndex(porSetor, setoresVisiveis) {
+            const el = document.getElementById('setor-index');
+            if (!el) return;
+            const options = setoresVisiveis.map(setor => {
+                const n = (porSetor[setor] || []).length;
+                const nomeCurto = setor.replace(/\s*[-–]\s*(Sobreaviso|Plantão|Plantao|Escala).*$/i, '').trim();
+                return `<option value="${setor.replace(/"/g, '&quot;')}">${nomeCurto} (${n})</option>`;
+            }).join('');
+            el.innerHTML = `<option value="">Ir para setor…</option>` + options;
+        }
+
+        function irParaSetor(setor) {
+            const alvo = Array.from(vistaAtual().querySelectorAll('.category')).find(cat => {
+                const nome = cat.querySelector('.setor-nome-full');
+                return nome && nome.textContent === setor;
+            });
+            if (!alvo) return;
+            alvo.scrollIntoView({ behavior: 'smooth', block: 'start' });
+        }
+
+        // Chip "próxima troca de plantão" (07h / 13h / 19h)
+        function atualizarProximaTroca() {
+            const el = document.getElementById('proxima-troca');
+            if (!el) return;
+            const TROCAS = [7 * 60, 13 * 60, 19 * 60];
+            const agora = new Date();
+            const agoraMin = agora.getHours() * 60 + agora.getMinutes();
+            let proxima = TROCAS.find(t => t > agoraMin);
+            let delta;
+            if (proxima === undefined) {
+                proxima = TROCAS[0];
+                delta = (24 * 60 - agoraMin) + proxima;
+            } else {
+                delta = proxima - agoraMin;
+            }
+
+            const h = Math.floor(delta / 60);
+            const m = delta % 60;
+            const quando = h > 0 ? `${h}h${String(m).padStart(2, '0')}` : `${m} min`;
+            el.innerHTML = `<svg class="ic" width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" aria-hidden="true"><circle cx="12" cy="12" r="10"/><polyline points="12 6 12 12 16 14"/></svg> Próxima troca às ${String(proxima / 60).padStart(2, '0')}:00 · em ${quando}`;
+            el.hidden = false;
+        }
+
+        // A contagem muda a cada minuto: um texto só, reescrito na virada do
+        // minuto e só com a página visível
+        let _trocaTimer = null;
+        function agendarProximaTroca() {
+            clearTimeout(_trocaTimer);
+            _trocaTimer = null;
+            atualizarProximaTroca();
+            if (document.hidden) return;
+            const agora = new Date();
+            _trocaTimer = setTimeout(agendarProximaTroca,
+                60000 - agora.getSeconds() * 1000 - agora.getMilliseconds() + 50);
+        }
+
+        // Selo de frescor: verde se os dados são de hoje, vermelho caso contrário
+        function atualizarFrescor() {
+            const stamp = document.getElementById('freshness-stamp');
+            const statusText = document.getElementById('status-text');
+            if (!stamp || !statusText || !escalas) return;
+            const dataAtu = escalas.data_atualizacao || escalas.data_backup ||
+                            (escalas.atual && escalas.atual.data_simples) || '';
+            if (!statusText.textContent && dataAtu) {
+                const horaAtu = escalas.hora_atualizacao || escalas.hora_backup || '';
+                statusText.textContent = horaAtu ? `Atualizado em ${dataAtu} às ${horaAtu}` : `Atualizado em ${dataAtu}`;
+            }
+            const hoje = new Date();
+            const hojeStr = String(hoje.getDate()).padStart(2, '0') + '/' +
+                            String(hoje.getMonth() + 1).padStart(2, '0') + '/' + hoje.getFullYear();
+            stamp.classList.remove('fresco', 'velho');
+            if (dataAtu === hojeStr) {
+                stamp.classList.add('fresco');
+            } else if (dataAtu) {
+                stamp.classList.add('velho');
+                statusText.textContent = `⚠️ Dados de ${dataAtu} — atualização pode ter falhado`;
+            }
+        }
+
+        // Tema claro/escuro (segue o sistema por padrão; toggle persiste)
+        const SVG_SOL = `<svg class="ic" width="17" height="17" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" aria-hidden="true"><circle cx="12" cy="12" r="5"/><line x1="12" y1="1" x2="12" y2="3"/><line x1="12" y1="21" x2="12" y2="23"/><line x1="4.22" y1="4.22" x2="5.64" y2="5.64"/><line x1="18.36" y1="18.36" x2="19.78" y2="19.78"/><line x1="1" y1="12" x2="3" y2="12"/><line x1="21" y1="12" x2="23" y2="12"/><line x1="4.22" y1="19.78" x2="5.64" y2="18.36"/><line x1="18.36" y1="5.64" x2="19.78" y2="4.22"/></svg>`;
+        const SVG_LUA = `<svg class="ic" width="17" height="17" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" aria-hidden="true"><path d="M21 12.79A9 9 0 1 1 11.21 3 7 7 0 0 0 21 12.79z"/></svg>`;
+        function aplicarTema(tema) {
+            document.documentElement.setAttribute('data-theme', tema);
+            const btn = document.getElementById('btn-theme');
+            if (btn) btn.innerHTML = tema === 'dark' ? SVG_SOL : SVG_LUA;
+            const btnM = document.querySelector('#btn-theme-mobile .bb-icon');
+            if (btnM) btnM.innerHTML = tema === 'dark' ? SVG_SOL : SVG_LUA;
+        }
+
+        function alternarTema() {
+            const atual = document.documentElement.getAttribute('data-theme') === 'dark' ? 'dark' : 'light';
+            const novo = atual === 'dark' ? 'light' : 'dark';
+            localStorage.setItem('tema', novo);
+            aplicarTema(novo);
+        }
+
+        function iniciarTema() {
+            // Padrão é SEMPRE claro; escuro só se o usuário escolheu no toggle
+            aplicarTema(localStorage.getItem('tema') === 'dark' ? 'dark' : 'light');
+        }
+
+        // Modo compacto (densidade)
+        function alternarCompacto() {
+            const ativo = document.body.classList.toggle('compacto');
+            localStorage.setItem('compacto', ativo ? '1' : '0');
+            const btn = document.getElementById('btn-compacto');
+            if (btn) btn.title = ativo ? 'Voltar ao modo normal' : 'Alternar modo compacto (mais setores por tela)';
+        }
+
+        function focarBusca() {
+            window.scrollTo({ top: 0, behavior: 'smooth' });
+            setTimeout(() => document.getElementById('search').focus(), 350);
+        }
+
+
+        // Banner de mudanças do dia selecionado (texto via textContent: nomes vêm do site)
+        function renderizarMudancas() {
+            const banner = document.getElementById('mudancas');
+            if (!banner) return;
+            const diff = mudancas[diaSelecionado];
+            if (!diff) { banner.hidden = true; return; }
+            const itens = [];
+            diff.trocas.forEach(t => itens.push(`🔁 ${t.setor} · ${t.tipo_turno} (${t.horario}): ${t.saiu} → ${t.entrou}`));
+            diff.adicionados.forEach(r => itens.push(`➕ ${r.profissional} — ${r.setor} · ${r.tipo_turno} (${r.horario})`));
+            diff.removidos.forEach(r => itens.push(`➖ ${r.profissional} — ${r.setor} · ${r.tipo_turno} (${r.horario})`));
+            const n = itens.length;
+            document.getElementById('mudancas-resumo').textContent =
+                `🔄 ${n} ${n === 1 ? 'mudança' : 'mudanças'} desde a última atualização (${diff.desde})`;
+            const lista = document.getElementById('mudancas-lista');
+            lista.textContent = '';
+            itens.forEach(texto => {
+                const li = document.createElement('li');
+                li.textContent = texto;
+                lista.appendChild(li);
+            });
+            banner.hidden = false;
+        }
+
+        // Pós-render: tudo que depende do DOM das categorias
+        function aposRenderizar(porSetor, setoresVisiveis) {
+            marcarAgora();
+            renderizarMudancas();
+            renderizarChips();
+            renderizarSetorIndex(porSetor, setoresVisiveis);
+            agendarProximaTroca();
+            atualizarFrescor();
+            // Sempre: cards reaproveitados podem ter ficado ocultos pela busca anterior
+            filtrarProfissionais();
+        }
+
+
+        // Mostrar data atual no header
+        const hoje = new Date();
+        const diasSemana = ['Domingo', 'Segunda', 'Terça', 'Quarta', 'Quinta', 'Sexta', 'Sábado'];
+        const meses = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez'];
+        const dataFormatada = `${diasSemana[hoje.getDay()]}, ${hoje.getDate()} ${meses[hoje.getMonth()]} ${hoje.getFullYear()}`;
+        document.getElementById('data-atual-header').textContent = dataFormatada;
+
+        // Autenticar: aceita a senha geral OU os 4 últimos dígitos do telefone
+        // de qualquer profissional cadastrado (preserva o hábito antigo de login).
+        // O cadastro vem com os dados (dadosProntos): no modo --assets ele pode
+        // ainda estar a caminho — ou não chegar, offline sem cache —, e isso não
+        // é credencial errada.
+        function autenticarOutro() {
+          const campo = document.getElementById('auth-input-outro');
+          const input = campo.value.trim();
+          const errorMsg = document.getElementById('auth-error-outro');
+          const senhaCorreta = 'HRO-ALVF';
+
+          function avisar(texto) {
+            errorMsg.textContent = texto;
+            errorMsg.classList.add('show');
+          }
+          function liberar(usuario) {
+            localStorage.setItem('authenticated', 'true');
+            localStorage.setItem('auth_user', usuario);
+            document.getElementById('auth-modal').classList.add('hidden');
+            document.getElementById('main-content').classList.remove('blurred');
+            errorMsg.classList.remove('show');
+          }
+          function recusar() {
+            avisar('Telefone ou senha não reconhecidos');
+            campo.value = '';
+          }
+
+          if (!input) {
+            avisar('Digite os 4 dígitos do telefone ou a senha');
+            return;
+          }
+
+          // Aceita a senha geral (case-insensitive) ...
+          if (input.toLowerCase() === senhaCorreta.toLowerCase()) {
+            liberar('admin');
+            return;
+          }
+          // ... ou os 4 últimos dígitos de algum profissional cadastrado.
+          const digitos = input.replace(/\D/g, '');
+          if (digitos.length !== 4) {
+            recusar();
+            return;
+          }
+          avisar('Verificando cadastro...');
+          dadosProntos.then(dados => {
+            const cadastro = (dados.profissionais || {}).professionals || [];
+            if (cadastro.some(prof => (prof.last4 || '') === digitos)) {
+              liberar(digitos);
+            } else {
+              recusar();
+            }
+          }, () => {
+            avisar('Cadastro indisponível agora (sem conexão?). Tente de novo ou use a senha');
+          });
+        }
+
+        // Verifica autenticação ao carregar
+        function verificarAutenticacao() {
+          // Verificar se já foi autenticado
+          if (localStorage.getItem('authenticated') === 'true') {
+            // Já foi autenticado, esconder modal e mostrar dashboard
+            document.getElementById('auth-modal').classList.add('hidden');
+            document.getElementById('main-content').classList.remove('blurred');
+          } else {
+            // Não foi autenticado, mostrar modal
+            document.getElementById('auth-modal').classList.remove('hidden');
+            document.getElementById('main-content').classList.add('blurred');
+          }
+        }
+
+        // Funções para o modal de contatos
+        function abrirListaContatos() {
+          const modal = document.getElementById('contacts-modal');
+          modal.classList.add('active');
+          renderizarContatos();
+        }
+
+        function fecharListaContatos() {
+          const modal = document.getElementById('contacts-modal');
+          modal.classList.remove('active');
+        }
+
+        function renderizarContatos() {
+          const contactsList = document.getElementById('contacts-list');
+          const profissionais = [...profissionaisData.professionals].sort((a, b) =>
+            a.name.localeCompare(b.name, 'pt-BR')
+          );
+
+          contactsList.innerHTML = profissionais.map(prof => {
+            const telefoneLimpo = (prof.phone || '').replace(/\D/g, '');
+            const temTelefone = telefoneLimpo.length >= 10;
+            const whatsappUrl = `https://wa.me/55${telefoneLimpo}`;
+            const infoHtml = temTelefone
+              ? `<a href="${whatsappUrl}" target="_blank" class="contact-phone">${prof.phone}</a>`
+              : `<span class="contact-phone-vazio">Sem telefone cadastrado</span>`;
+            return `
+              <div class="contact-item">
+                <div class="contact-name">${prof.name}</div>
+                <div class="contact-info">${infoHtml}</div>
+              </div>
+            `;
+          }).join('');
+        }
+
+        function filtrarContatos() {
+          const searchText = document.getElementById('contacts-search').value.toLowerCase();
+          const contactItems = document.querySelectorAll('.contact-item');
+
+          contactItems.forEach(item => {
+            const nome = item.querySelector('.contact-name').textContent.toLowerCase();
+            const telefone = item.querySelector('.contact-info').textContent.toLowerCase();
+
+            if (nome.includes(searchText) || telefone.includes(searchText)) {
+              item.style.display = 'block';
+            } else {
+              item.style.display = 'none';
+            }
+          });
+        }
+
+        // Fechar modal ao clicar fora
+        document.getElementById('contacts-modal').addEventListener('click', function(e) {
+          if (e.target === this) {
+            fecharListaContatos();
+          }
+        });
+
+        // Tooltip positioning for WhatsApp icons
+        function setupPhoneTooltips() {
+            const phoneButtons = document.querySelectorAll('.telefone-icon-btn');
+            phoneButtons.forEach(btn => {
+                // Create tooltip element
+                const tooltip = document.createElement('div');
+                tooltip.className = 'phone-tooltip';
+                tooltip.textContent = btn.getAttribute('data-phone');
+                document.body.appendChild(tooltip);
+
+                // Create arrow element
+                const arrow = document.createElement('div');
+                arrow.className = 'phone-tooltip-arrow';
+                document.body.appendChild(arrow);
+
+                // Position tooltip on hover
+                btn.addEventListener('mouseenter', (e) => {
+                    const rect = btn.getBoundingClientRect();
+                    const tooltipWidth = 120; // Approximate width
+                    const tooltipHeight = 40; // Approximate height
+
+                    let left = rect.left + rect.width / 2 - tooltipWidth / 2;
+                    let top = rect.top - tooltipHeight - 15;
+
+                    // Adjust if tooltip goes off-screen horizontally
+                    if (left < 10) {
+                        left = 10;
+                    } else if (left + tooltipWidth > window.innerWidth - 10) {
+                        left = window.innerWidth - tooltipWidth - 10;
+                    }
+
+                    // Adjust if tooltip goes off-screen vertically
+                    if (top < 10) {
+                        top = rect.bottom + 10;
+                        arrow.style.transform = 'rotate(180deg)';
+                    } else {
+                        arrow.style.transform = 'rotate(0deg)';
+                    }
+
+                    tooltip.style.left = left + 'px';
+                    tooltip.style.top = top + 'px';
+                    tooltip.classList.add('show');
+
+                    arrow.style.left = (rect.left + rect.width / 2) + 'px';
+                    arrow.style.top = (top + (top < rect.top - 10 ? 40 : -10)) + 'px';
+                    arrow.classList.add('show');
+                });
+
+                btn.addEventListener('mouseleave', () => {
+                    tooltip.classList.remove('show');
+                    arrow.classList.remove('show');
+                });
+            });
+        }
+
+        // Global error handler
+        window.addEventListener('error', function(event) {
+            console.error('❌ GLOBAL ERROR:', event.message);
+            console.error('Source:', event.filename, 'Line:', event.lineno, 'Column:', event.colno);
+            console.error('Error object:', event.error);
+        });
+
+        // Setup tooltips after page loads
+        try {
+            console.log('📍 Iniciando setup...');
+            setupPhoneTooltips();
+            console.log('✅ Tooltips configurados');
+        } catch (e) {
+            console.error('❌ Erro ao configurar tooltips:', e.message);
+        }
+
+        // Service worker (sw.js): a página abre do cache na hora, até offline,
+        // e o publicado é revalidado em segundo plano. Quando muda, o sw avisa.
+        if ('serviceWorker' in navigator && (location.protocol === 'https:' || location.hostname === 'localhost')) {
+            navigator.serviceWorker.register('sw.js').catch(e =>
+                console.warn('⚠️  Service worker não registrado:', e.message));
+            navigator.serviceWorker.addEventListener('message', ev => {
+                if (!ev.data || ev.data.tipo !== 'atualizado') return;
+                if (ASSETS && dadosCarregados && ev.data.url.endsWith('/' + ASSETS.escala)) {
+                    // Só a escala mudou: aplica sem recarregar a página
+                    buscarJSON(ASSETS.escala).then(escala => {
+                        aplicarDados(Object.assign({}, dadosCarregados, escala));
+                        renderizarEscala();
+                        mostrarToast('🔄 Escala atualizada');
+                    }).catch(e => console.warn('⚠️  Falha ao aplicar escala nova:', e.message));
+                } else {
+                    mostrarToast('🔄 Escala atualizada — toque para ver', () => location.reload());
+                }
+            });
+        }
+
+        // Aguardar DOM estar completamente carregado antes de verificar autenticação
+        document.addEventListener('DOMContentLoaded', function() {
+            // Tema e densidade (antes de renderizar, para evitar flash)
+            try {
+                iniciarTema();
+                if (localStorage.getItem('compacto') === '1') {
+                    document.body.classList.add('compacto');
+                }
+            } catch (e) {
+                console.error('❌ Erro ao aplicar tema:', e.message);
+            }
+
+            // Verifica antes de renderizar
+            try {
+                console.log('📍 Verificando autenticação...');
+                verificarAutenticacao();
+                console.log('✅ Autenticação verificada');
+            } catch (e) {
+                console.error('❌ Erro ao verificar autenticação:', e.message);
+            }
+
+            // Renderizar escala assim que os dados estiverem disponíveis
+            dadosProntos.catch(e => {
+                console.error('❌ Erro ao carregar dados da escala:', e.message);
+                return { escalas: { atual: { data: 'Erro', registros: [] }, anterior: { data: 'Erro', registros: [] }, seguinte: { data: 'Erro', registros: [] }, data_atualizacao: 'N/A', hora_atualizacao: 'N/A', status_atualizacao: 'erro' } };
+            }).then(dados => {
+                aplicarDados(dados);
+                try {
+                    console.log('📍 Iniciando renderização...');
+                    renderizarEscala();
+                    console.log('✅ Renderização concluída');
+                } catch (e) {
+                    console.error('❌ Erro ao renderizar escala:', e.message);
+                    console.error('Stack:', e.stack);
+                }
+
+                // "Agora" e a contagem da próxima troca têm timers próprios
+                // (agendarAgora, agendarProximaTroca), parados com a página oculta
+                document.addEventListener('visibilitychange', () => {
+                    try {
+                        if (document.hidden) {
+                            clearTimeout(_agoraTimer);
+                            clearTimeout(_trocaTimer);
+                        } else {
+                            avancarAgora();
+                            agendarProximaTroca();
+                        }
+                    } catch (e) { /* silencioso */ }
+                });
+            });
+        });
+
@@ -0,0 +1,23 @@
+// ARQUIVO GERADO por gerar_dashboard_executivo.py (templates/worker_busca.js) — não edite
+// Worker de busca do dashboard: tokeniza os registros de cada dia e responde
+// às consultas fora da thread principal. Mensagens da página:
+//   { tipo: 'indexar', dia, chave, textos }   textos[id] = texto buscável
+//   { tipo: 'buscar', dia, chave, busca, seq } → { seq, valido, ids }
+// ids: Int32Array dos registros que casam, ou null = todos; valido = false se
+// o índice do dia não é o da `chave` (a página então busca sozinha).
+'use strict';
+{{> busca.js }}
+const indices = {};  // dia → { chave, porToken, ordenados } (só o último de cada dia)
+
+self.onmessage = ev => {
+    const msg = ev.data;
+    if (msg.tipo === 'indexar') {
+        indices[msg.dia] = Object.assign({ chave: msg.chave }, indexarTextos(msg.textos));
+    } else if (msg.tipo === 'buscar') {
+        const indice = indices[msg.dia];
+        const valido = Boolean(indice) && indice.chave === msg.chave;
+        const casam = valido ? idsDaBusca(indice, msg.busca) : null;
+        const ids = casam === null ? null : Int32Array.from(casam);
+        self.postMessage({ seq: msg.seq, valido, ids }, ids ? [ids.buffer] : []);
+    }
+};
@@ -0,0 +1,72 @@
+"""Testes dos arquivos de dados separados do dashboard (modo --assets)."""
+
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from assets_estaticos import ARQUIVO_ESCALA, gravar_assets, preparar_assets, relatorio_tamanhos
+
+
+TABELAS = {'ramais': {'departments': [{'name': 'UTI', 'extensions': ['2201']}]},
+           'profissionais': {'professionals': []}}
+
+
+class TestPrepararAssets:
+    def test_nomes_com_hash_e_manifesto(self):
+        arquivos, manifesto = preparar_assets({'escalas': {}}, TABELAS)
+        assert manifesto['escala'] == ARQUIVO_ESCALA
+        nomes = [t['nome'] for t in manifesto['tabelas']]
+        assert nomes == ['ramais', 'profissionais']
+        for t in manifesto['tabelas']:
+            assert t['url'].startswith(f"assets/{t['nome']}.")
+            assert json.loads(arquivos[t['url']]) == TABELAS[t['nome']]
+
+    def test_hash_muda_so_com_o_conteudo(self):
+        _, m1 = preparar_assets({'escalas': {'a': 1}}, TABELAS)
+        _, m2 = preparar_assets({'escalas': {'a': 2}}, TABELAS)
+        assert m1 == m2  # escala diferente, tabelas iguais: mesmas URLs
+        outras = dict(TABELAS, ramais={'departments': []})
+        _, m3 = preparar_assets({'escalas': {}}, outras)
+        assert m3['tabelas'][0]['url'] != m1['tabelas'][0]['url']
+        assert m3['tabelas'][1]['url'] == m1['tabelas'][1]['url']
+
+
+class TestGravarAssets:
+    def test_grava_e_poda_so_depois_do_prazo(self, tmp_path):
+        antigos, _ = preparar_assets({'escalas': {}}, TABELAS)
+        gravar_assets(antigos, tmp_path, hoje=date(2026, 8, 1))
+        for relativo in antigos:
+            assert (tmp_path / relativo).exists()
+
+        novos, _ = preparar_assets({'escalas': {}}, dict(TABELAS, ramais={'departments': []}))
+        ramais_antigo = next(r for r in antigos if 'ramais.' in r)
+        assert gravar_assets(novos, tmp_path, manter_dias=7, hoje=date(2026, 8, 5)) == []
+        assert (tmp_path / ramais_antigo).exists()  # ainda dentro do prazo
+
+        apagados = gravar_assets(novos, tmp_path, manter_dias=7, hoje=date(2026, 8, 9))
+        assert apagados == [Path(ramais_antigo).name]
+        assert not (tmp_path / ramais_antigo).exists()
+        for relativo in novos:
+            assert (tmp_path / relativo).exists()
+        usados = json.loads((tmp_path / 'assets' / 'usados.json').read_text())
+        assert Path(ramais_antigo).name not in usados
+
+
+class TestRelatorioTamanhos:
+    HTML = "<html><style>body{}</style><script>const D = {\"a\":1};</script></html>"
+
+    def test_blocos_embutidos_descontados_do_js(self):
+        relatorio = relatorio_tamanhos(self.HTML, {'escalas': '{"a":1}'})
+        linhas = relatorio.splitlines()
+        assert linhas[0].startswith("📦 Página:")
+        assert any(l.strip().startswith("dados: escalas") for l in linhas)
+        assert any(l.strip().startswith("JS (código)") for l in linhas)
+
+    def test_modo_assets_lista_arquivos(self):
+        relatorio = relatorio_tamanhos(self.HTML, {'escala.json': 'x' * 2048}, embutidos=False)
+        assert "dados: escala" not in relatorio
+        assert "escala.json" in relatorio and "2.0 KB" in relatorio
+
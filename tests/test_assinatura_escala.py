@@ -0,0 +1,81 @@
+"""Testes da assinatura de conteúdo usada para pular gerações sem mudança."""
+
+import copy
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from assinatura_escala import assinatura, ler_assinatura_salva, salvar_assinatura
+
+SNAPSHOT = Path(__file__).parent.parent / 'data' / 'historico' / '2026-08-22.json'
+
+
+def _escala():
+    with open(SNAPSHOT, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class TestAssinatura:
+    def test_ignora_pos_x_hora_e_ordem(self):
+        base = _escala()
+        outra = copy.deepcopy(base)
+        outra['hora_atualizacao'] = '23:59'
+        for r in outra['atual']['registros']:
+            r['pos_x'] = r.get('pos_x', 0) + 37
+        outra['atual']['registros'].reverse()
+        assert assinatura(outra) == assinatura(base)
+
+    def test_muda_com_os_registros(self):
+        base = _escala()
+        outra = copy.deepcopy(base)
+        outra['seguinte']['registros'][0]['profissional'] += ' X'
+        assert assinatura(outra) != assinatura(base)
+
+    def test_muda_com_a_data_da_atualizacao(self):
+        base = _escala()
+        outra = copy.deepcopy(base)
+        outra['data_atualizacao'] = '23/08/2026'
+        assert assinatura(outra) != assinatura(base)
+
+    def test_muda_com_o_codigo_do_gerador(self, tmp_path):
+        escala = _escala()
+        (tmp_path / 'dashboard_logic.py').write_text('A = 1\n')
+        antes = assinatura(escala, base_dir=tmp_path)
+        (tmp_path / 'dashboard_logic.py').write_text('A = 2\n')
+        assert assinatura(escala, base_dir=tmp_path) != antes
+
+    def test_muda_com_os_modelos_da_pagina(self, tmp_path):
+        escala = _escala()
+        (tmp_path / 'templates').mkdir()
+        (tmp_path / 'templates' / 'dashboard.css').write_text('body {}\n')
+        antes = assinatura(escala, base_dir=tmp_path)
+        (tmp_path / 'templates' / 'dashboard.css').write_text('body { color: red; }\n')
+        assert assinatura(escala, base_dir=tmp_path) != antes
+
+    def test_muda_com_os_telefones_dos_profissionais(self, tmp_path):
+        escala = _escala()
+        arquivo = tmp_path / 'profissionais_autenticacao.json'
+        arquivo.write_text('{"professionals": []}\n')
+        antes = assinatura(escala, base_dir=tmp_path)
+        arquivo.write_text('{"professionals": [{"name": "Ana", "phone": "1"}]}\n')
+        assert assinatura(escala, base_dir=tmp_path) != antes
+
+    def test_muda_com_as_opcoes_de_build(self):
+        escala = _escala()
+        simples = assinatura(escala)
+        assert assinatura(escala, opcoes=['--assets']) != simples
+        assert assinatura(escala, opcoes=['--producao']) != simples
+        assert assinatura(escala, opcoes=['--producao', '--assets']) == \
+            assinatura(escala, opcoes=['--assets', '--producao'])
+        # --forcar e afins não mudam a página
+        assert assinatura(escala, opcoes=['--forcar']) == simples
+
+
+class TestArquivo:
+    def test_ida_e_volta(self, tmp_path):
+        arquivo = tmp_path / 'ultima_geracao.json'
+        assert ler_assinatura_salva(arquivo) is None
+        salvar_assinatura('abc123', arquivo)
+        assert ler_assinatura_salva(arquivo) == 'abc123'
@@ -0,0 +1,68 @@
+"""Equivalência do classificador compilado com as regras antigas.
+
+O oráculo é a cópia congelada em classificador_legado.py. Conferimos TODAS as
+combinações (tipo_turno, horario) de data/historico/ — inclusive snapshots que
+chegarem depois deste teste — mais casos sintéticos que exercitam cada ramo de
+análise do horário.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from classificador_legado import normalizar_turno_legado, obter_tipo_turno_legado
+from dashboard_logic import normalizar_turno, obter_tipo_turno
+from historico_compacto import ler_snapshot
+
+HISTORICO = Path(__file__).parent.parent / 'data' / 'historico'
+
+TURNOS_SINTETICOS = [
+    '', 'Plantão', 'Sobreaviso', 'Sobre aviso Cirurgia', 'Sobreaviso Final de Semana',
+    'Rotina', 'Rotina - Final de Semana', 'Rotina Vespertino', 'FDS', 'Finais de semana',
+    'P1', 'p4', 'DIA', 'Noite', 'UTI', 'A-1', 'Diurno', 'Plantão Diurno', 'Madrugada',
+    'Plantão 24h', 'Ambulatório', 'Hospitalista Comanejo Tarde', 'Hospitalista Urgência 07:00',
+    'Hospitalista', 'Regular', 'Alojamento Noite', 'Sobreaviso Cirurgia Equipe 2',
+    'Sobreaviso Neurologia Pediátrica', 'Plantão Matutino P2 Final', '  Espaços  ',
+]
+HORARIOS_SINTETICOS = [
+    '', '19:00/07:00', '18:30/07:30', '07:00/19:00', '07:00/07:00', ' 07:00 / 07:00',
+    '24:00/08:00', '05:00/11:00', '-1:00/03:00', '+8:00/12:00', '8/12', '13:00/xx',
+    'xx/13:00', 'abc/def', '07:00/13:00/19:00', '07:00', '1_2:00/13:00', '١٩:00/07:00',
+]
+
+
+def _combinacoes_do_historico():
+    pares = set()
+    for caminho in sorted(HISTORICO.glob('*.json')):
+        escala = ler_snapshot(caminho)
+        for dia in ('anterior', 'atual', 'seguinte'):
+            for r in (escala.get(dia) or {}).get('registros') or []:
+                pares.add((r.get('tipo_turno', ''), r.get('horario', '')))
+    return pares
+
+
+class TestEquivalencia:
+    def test_todo_o_historico(self):
+        pares = _combinacoes_do_historico()
+        assert pares, "data/historico/ vazio?"
+        for turno, horario in pares:
+            assert obter_tipo_turno(turno, horario) == obter_tipo_turno_legado(turno, horario), (turno, horario)
+            assert normalizar_turno(turno) == normalizar_turno_legado(turno), turno
+
+    def test_casos_sinteticos(self):
+        for turno in TURNOS_SINTETICOS + [None]:
+            assert normalizar_turno(turno) == normalizar_turno_legado(turno), turno
+            for horario in HORARIOS_SINTETICOS + [None]:
+                assert obter_tipo_turno(turno, horario) == obter_tipo_turno_legado(turno, horario), (turno, horario)
+
+    def test_anos_de_historico_em_menos_de_um_segundo(self):
+        # ~3 anos de escala (~300 registros/dia) com a variedade real de turnos
+        pares = list(_combinacoes_do_historico())
+        registros = pares * (3 * 365 * 300 // len(pares))
+        inicio = time.perf_counter()
+        for turno, horario in registros:
+            obter_tipo_turno(turno, horario)
+        assert time.perf_counter() - inicio < 1.0
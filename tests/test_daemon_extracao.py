@@ -0,0 +1,128 @@
+"""Testes do daemon de extração com um extrator falso (sem navegador)."""
+
+import signal
+import subprocess
+import sys
+import threading
+import urllib.error
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from daemon_extracao import DaemonExtracao, criar_servidor, pedir_snapshot
+
+
+class ExtratorFalso:
+    criados = 0
+
+    def __init__(self, totais):
+        self.totais = list(totais)
+        self.entradas = 0
+        self.aberturas = 0
+        self.fechado = False
+        ExtratorFalso.criados += 1
+
+    def entrar(self):
+        self.entradas += 1
+
+    def extrair_inteligente(self, abrir=True):
+        self.aberturas += abrir
+        total = self.totais.pop(0)
+        if isinstance(total, Exception):
+            raise total
+        return {'atual': {'total': total, 'registros': []}, 'seguinte': None, 'anterior': None}
+
+    def close(self):
+        self.fechado = True
+
+
+@pytest.fixture
+def servidor():
+    servidores = []
+
+    def subir(daemon):
+        srv = criar_servidor(daemon, 'http://127.0.0.1:0')
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        servidores.append(srv)
+        return f"http://127.0.0.1:{srv.server_address[1]}"
+
+    yield subir
+    for srv in servidores:
+        srv.shutdown()
+        srv.server_close()
+
+
+class TestDaemon:
+    def test_reaproveita_o_mesmo_navegador(self, servidor):
+        extrator = ExtratorFalso([10, 12])
+        url = servidor(DaemonExtracao(lambda: extrator))
+        assert pedir_snapshot(url)['atual']['total'] == 10
+        assert pedir_snapshot(url)['atual']['total'] == 12
+        assert extrator.entradas == 1
+        assert extrator.aberturas == 1  # o segundo pedido só relê a grade aberta
+
+    def test_grade_vazia_entra_de_novo_e_repete(self):
+        extrator = ExtratorFalso([0, 7])
+        daemon = DaemonExtracao(lambda: extrator)
+        assert daemon.snapshot()['atual']['total'] == 7
+        assert extrator.entradas == 2
+        assert extrator.aberturas == 2  # entrar() sai da grade: reabre
+
+    def test_navegador_morto_e_recriado(self):
+        extratores = iter([ExtratorFalso([RuntimeError("chrome caiu")]), ExtratorFalso([5])])
+        daemon = DaemonExtracao(lambda: next(extratores))
+        assert daemon.snapshot()['atual']['total'] == 5
+        assert daemon.saude()['extracoes'] == 1
+
+    def test_falha_persistente_vira_503(self, servidor):
+        url = servidor(DaemonExtracao(lambda: ExtratorFalso([RuntimeError("fora do ar")])))
+        with pytest.raises(urllib.error.HTTPError) as erro:
+            pedir_snapshot(url, timeout=5)
+        assert erro.value.code == 503
+
+
+class TestCriarServidor:
+    @pytest.mark.parametrize('url', ['http://0.0.0.0:0', 'http://192.168.0.10:0', 'http://escala.exemplo:0'])
+    def test_recusa_host_fora_do_loopback(self, url):
+        with pytest.raises(ValueError, match='loopback'):
+            criar_servidor(DaemonExtracao(lambda: ExtratorFalso([])), url)
+
+    def test_aceita_localhost(self, monkeypatch):
+        monkeypatch.setenv('ESCALA_DAEMON_URL', 'http://localhost:0')
+        srv = criar_servidor(DaemonExtracao(lambda: ExtratorFalso([])))
+        srv.server_close()
+
+
+_DAEMON_COM_EXTRATOR_FALSO = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from daemon_extracao import servir
+
+class Extrator:
+    def entrar(self):
+        pass
+
+    def close(self):
+        print('navegador fechado', flush=True)
+
+servir('http://127.0.0.1:0', fabrica=Extrator)
+"""
+
+
+class TestServir:
+    def test_sigterm_fecha_o_navegador(self):
+        processo = subprocess.Popen(
+            [sys.executable, '-c', _DAEMON_COM_EXTRATOR_FALSO, str(Path(__file__).parent.parent)],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        try:
+            for linha in processo.stdout:
+                if 'ouvindo' in linha:
+                    break
+            processo.send_signal(signal.SIGTERM)
+            saida = processo.communicate(timeout=10)[0]
+        finally:
+            processo.kill()
+        assert processo.returncode == 0
+        assert 'navegador fechado' in saida and 'Daemon encerrado' in saida
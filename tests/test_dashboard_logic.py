@@ -1,4 +1,5 @@
-"""Testes da lógica pura do dashboard (classificação de turnos e ramais)."""
+"""Testes da lógica pura do dashboard (classificação de turnos, agenda do
+"plantão agora" e ramais)."""
 
 import sys
 from pathlib import Path
@@ -6,6 +7,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dashboard_logic import (
+    EM_SERVICO,
+    ENCERRADO,
+    FORA,
+    MINUTOS_DIA,
+    agenda_plantoes,
+    estado_no_minuto,
+    intervalo_plantao,
+    classificar_registros,
+    chave_setor,
+    indexar_ramais,
+    IndiceSetores,
     obter_tipo_turno,
     normalizar_turno,
     obter_ramais_setor,
@@ -82,6 +94,82 @@ class TestNormalizarTurno:
         assert normalizar_turno("Turno Exótico") == (99, "Turno Exótico")
 
 
+class TestClassificarRegistros:
+    def test_anota_os_tres_dias(self):
+        escalas = {
+            'atual': {'registros': [{'tipo_turno': 'Plantão Noturno', 'horario': '19:00 / 07:00'}]},
+            'seguinte': {'registros': [{'tipo_turno': 'Sobreaviso Neurologia', 'horario': '07:00 / 07:00'}]},
+            'anterior': {'data': 'N/A', 'registros': []},
+            'ramais_hro': {'departments': []},
+        }
+        assert classificar_registros(escalas) == 2
+        noturno = escalas['atual']['registros'][0]
+        assert noturno['tipo_badge'] == obter_tipo_turno('Plantão Noturno', '19:00 / 07:00')
+        assert (noturno['turno_ordem'], noturno['turno_nome']) == normalizar_turno('Plantão Noturno')
+        sobreaviso = escalas['seguinte']['registros'][0]
+        assert sobreaviso['tipo_badge'] == 'badge-24h'
+        assert (sobreaviso['turno_ordem'], sobreaviso['turno_nome']) == (5, 'Sobreaviso Neurologia')
+
+    def test_campos_ausentes(self):
+        escalas = {'atual': {'registros': [{'profissional': 'X'}]}, 'anterior': None}
+        classificar_registros(escalas)
+        r = escalas['atual']['registros'][0]
+        assert (r['tipo_badge'], r['turno_ordem'], r['turno_nome']) == ('outro', 99, 'Outro')
+
+
+
+def _repassar(agenda, total, minuto):
+    """O que o JS faz (estadosNoMinuto): estado das 00:00 + eventos até `minuto`."""
+    estados = [FORA] * total
+    for id_ in agenda['inicio']:
+        estados[id_] = EM_SERVICO
+    for quando, estado, ids in agenda['eventos']:
+        if quando > minuto:
+            break
+        for id_ in ids:
+            estados[id_] = estado
+    return estados
+
+
+class TestAgendaPlantoes:
+    HORARIOS = ['07:00/19:00', '19:00/07:00', '07:00/07:00', ' 07:00 / 13:00', '19:00/00:00',
+                '00:00/06:00', '24:00/08:00', '-1:00/03:00', '07h/13h', '13:/19:', '07:00/13:00/19:00',
+                '07:00', '', 'abc/def', '07:xx/13:00', '23:59/00:01']
+
+    def test_intervalo_como_o_parseint_do_js(self):
+        assert intervalo_plantao('19:00/07:00') == (1140, 420)
+        assert intervalo_plantao(' 07:30 / 13:00') == (450, 780)
+        assert intervalo_plantao('07h/13h') == (420, 780)
+        assert intervalo_plantao('13:/19:') == (780, 1140)
+        assert intervalo_plantao('07:00/13:00/19:00') == (420, 780)
+        assert intervalo_plantao('-1:00/03:00') == (-60, 180)
+        for invalido in ('', '07:00', 'abc/def', '07:xx/13:00', '١٩:00/07:00'):
+            assert intervalo_plantao(invalido) is None
+
+    def test_estados(self):
+        diurno, noturno, plantao_24h = (420, 1140), (1140, 420), (420, 420)
+        assert [estado_no_minuto(diurno, m) for m in (419, 420, 1139, 1140)] == \
+            [FORA, EM_SERVICO, EM_SERVICO, ENCERRADO]
+        assert [estado_no_minuto(noturno, m) for m in (0, 419, 420, 1139, 1140)] == \
+            [EM_SERVICO, EM_SERVICO, FORA, FORA, EM_SERVICO]
+        assert {estado_no_minuto(plantao_24h, m) for m in range(MINUTOS_DIA)} == {EM_SERVICO}
+        assert estado_no_minuto(None, 600) == FORA
+
+    def test_eventos_em_ordem_e_agrupados(self):
+        agenda = agenda_plantoes([{'horario': h} for h in ('19:00/07:00', '07:00/19:00', '07:00/07:00', 'x')])
+        assert agenda == {'inicio': [0, 2],
+                          'eventos': [[420, FORA, [0]], [420, EM_SERVICO, [1]],
+                                      [1140, EM_SERVICO, [0]], [1140, ENCERRADO, [1]]]}
+
+    def test_repassar_a_agenda_da_o_estado_de_cada_minuto(self):
+        registros = [{'horario': h} for h in self.HORARIOS] + [{}]
+        agenda = agenda_plantoes(registros)
+        intervalos = [intervalo_plantao(r.get('horario') or '') for r in registros]
+        for minuto in range(MINUTOS_DIA):
+            assert _repassar(agenda, len(registros), minuto) == \
+                [estado_no_minuto(i, minuto) for i in intervalos], minuto
+
+
 class TestRamais:
     RAMAIS = {'departments': [
         {'name': 'UTI Geral', 'extensions': ['2201', '2202']},
@@ -100,6 +188,19 @@ class TestRamais:
     def test_dados_ausentes(self):
         assert obter_ramais_setor('UTI', None, self.MAPPING) == []
 
+    def test_indice_sem_repeticao_e_primeiro_mapeamento_vale(self):
+        ramais = {'departments': self.RAMAIS['departments'] + [
+            {'name': 'UTI Plantão', 'extensions': ['2202', '2203']},
+        ]}
+        mapping = {'sector_mappings': [
+            {'dashboard_sector': 'UTI', 'ramais_departments': ['UTI Geral', 'UTI Plantão', 'Sumido']},
+            {'dashboard_sector': 'UTI', 'ramais_departments': ['Emergência']},
+        ]}
+        indice = indexar_ramais(ramais, mapping)
+        assert indice == {'UTI': ['2201', '2202', '2203']}
+        assert obter_ramais_setor('UTI', None, None, indice=indice) == ['2201', '2202', '2203']
+        assert indexar_ramais(None, mapping) == {}
+
     def test_formatar_vazio(self):
         assert formatar_ramais_display([]) == ""
 
@@ -112,3 +213,44 @@ class TestRamais:
         exts = [str(2200 + i) for i in range(8)]
         out = formatar_ramais_display(exts)
         assert '...' in out
+
+
+class TestIndiceSetores:
+    MAPPING = {'sector_mappings': [
+        {'dashboard_sector': 'Unidade de Terapia Intensiva (UTI) Adulto I', 'ramais_departments': ['UTI 1']},
+        {'dashboard_sector': 'Unidade de Terapia Intensiva (UTI) Adulto II', 'ramais_departments': ['UTI 2']},
+        {'dashboard_sector': 'Ortopedia e Traumatologia - Sobreaviso', 'ramais_departments': ['Orto']},
+        {'dashboard_sector': 'Clínica Médica', 'ramais_departments': ['CM']},
+    ]}
+    RAMAIS = {'departments': [
+        {'name': 'UTI 1', 'extensions': ['1001']},
+        {'name': 'UTI 2', 'extensions': ['1002']},
+        {'name': 'Orto', 'extensions': ['3000']},
+        {'name': 'CM', 'extensions': ['4000']},
+    ]}
+
+    def test_chave_setor(self):
+        assert chave_setor('CLÍNICA MÉDICA - Escala Médica') == chave_setor('Médica Clínica')
+        assert chave_setor('Clínica Médica') == 'clinica medica'
+
+    def test_exato_normalizado_aproximado(self):
+        indice = IndiceSetores(self.MAPPING)
+        assert indice.resolver('Clínica Médica') == ('Clínica Médica', 'exato')
+        assert indice.resolver('CLINICA MEDICA - ESCALA MÉDICA') == ('Clínica Médica', 'normalizado')
+        assert indice.resolver('Ortopedia e Traumatologia') == (
+            'Ortopedia e Traumatologia - Sobreaviso', 'aproximado')
+
+    def test_numeral_diferente_nao_casa(self):
+        # "Adulto IV" é quase igual a "Adulto I", mas é outro setor
+        indice = IndiceSetores(self.MAPPING)
+        assert indice.resolver('Unidade de Terapia Intensiva (UTI) Adulto IV') == (None, None)
+        assert indice.resolver('Serviço de Urgência e Emergência') == (None, None)
+
+    def test_indexar_com_apelidos(self):
+        apelidos = {'CLINICA MEDICA - ESCALA MÉDICA': 'Clínica Médica'}
+        indice = indexar_ramais(self.RAMAIS, self.MAPPING, apelidos)
+        assert indice['CLINICA MEDICA - ESCALA MÉDICA'] == ['4000']
+
+    def test_obter_ramais_setor_sem_indice_normaliza(self):
+        assert obter_ramais_setor('Unidade de Terapia Intensiva (UTI) Adulto II - ESCALA MÉDICA',
+                                  self.RAMAIS, self.MAPPING) == ['1002']
@@ -0,0 +1,86 @@
+"""Testes do diff registro a registro entre extrações."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from diff_escala import (
+    diff_escalas,
+    diff_registros,
+    snapshot_anterior,
+    taxa_rotatividade,
+    total_mudancas,
+)
+
+
+def _reg(prof, setor='UTI Adulto', turno='Plantão Noturno', horario='19:00/07:00', **extra):
+    return {'profissional': prof, 'setor': setor, 'tipo_turno': turno, 'horario': horario, **extra}
+
+
+class TestDiffRegistros:
+    def test_sem_mudanca_ignora_pos_x_e_contato(self):
+        antes = [_reg('Ana', pos_x=10, phone='1')]
+        depois = [_reg('Ana', pos_x=99, phone='2')]
+        assert total_mudancas(diff_registros(antes, depois)) == 0
+
+    def test_troca_no_mesmo_posto(self):
+        diff = diff_registros([_reg('Ana'), _reg('Bia', setor='Pediatria')],
+                              [_reg('Caio'), _reg('Bia', setor='Pediatria')])
+        assert diff['trocas'] == [{'setor': 'UTI Adulto', 'tipo_turno': 'Plantão Noturno',
+                                   'horario': '19:00/07:00', 'saiu': 'Ana', 'entrou': 'Caio'}]
+        assert diff['adicionados'] == [] and diff['removidos'] == []
+
+    def test_adicao_e_remocao_em_postos_diferentes(self):
+        diff = diff_registros([_reg('Ana')], [_reg('Ana'), _reg('Caio', horario='07:00/19:00')])
+        assert [r['profissional'] for r in diff['adicionados']] == ['Caio']
+        diff = diff_registros([_reg('Ana'), _reg('Bia', setor='Pediatria')], [_reg('Ana')])
+        assert [r['profissional'] for r in diff['removidos']] == ['Bia']
+
+    def test_registros_repetidos_contam_como_multiconjunto(self):
+        diff = diff_registros([_reg('Ana'), _reg('Ana')], [_reg('Ana')])
+        assert len(diff['removidos']) == 1
+
+    def test_taxa_rotatividade(self):
+        diff = diff_registros([_reg('Ana'), _reg('Bia', setor='X'), _reg('Caio', setor='Y'), _reg('Davi', setor='Z')],
+                              [_reg('Eva'), _reg('Bia', setor='X'), _reg('Caio', setor='Y')])
+        assert taxa_rotatividade(diff, 4) == 0.5
+        assert taxa_rotatividade(diff, 0) == 0.0
+
+
+class TestDiffEscalas:
+    def test_compara_pela_data_mesmo_em_outra_posicao(self):
+        ontem = {'atual': {'data_simples': '21/08/2026', 'registros': [_reg('Zé')]},
+                 'seguinte': {'data_simples': '22/08/2026', 'registros': [_reg('Ana')]}}
+        hoje = {'atual': {'data_simples': '22/08/2026', 'registros': [_reg('Caio')]}}
+        diff = diff_escalas(ontem, hoje)
+        assert diff['trocas'][0]['saiu'] == 'Ana'
+
+    def test_snapshot_antigo_sem_correcao_nao_vira_troca(self):
+        antiga = {'atual': {'data_simples': '22/08/2026', 'registros': [
+            _reg('Ana', setor='Residencia de Clinica Médica - ESCALA MÉDICA', turno='Res. Clinica Méidica')]}}
+        nova = {'atual': {'data_simples': '22/08/2026', 'registros': [
+            _reg('Ana', setor='Residência de Clínica Médica', turno='Res. Clínica Médica')]}}
+        assert total_mudancas(diff_escalas(antiga, nova)) == 0
+        # o snapshot lido não é alterado
+        assert antiga['atual']['registros'][0]['setor'].startswith('Residencia')
+
+    def test_data_ausente_devolve_none(self):
+        antiga = {'atual': {'data_simples': '01/08/2026', 'registros': [_reg('Ana')]}}
+        nova = {'atual': {'data_simples': '22/08/2026', 'registros': [_reg('Ana')]}}
+        assert diff_escalas(antiga, nova) is None
+
+    def test_snapshot_anterior_pega_o_mais_recente_com_a_data(self, tmp_path):
+        def gravar(nome, atual, seguinte):
+            (tmp_path / nome).write_text(json.dumps({
+                'atual': {'data_simples': atual, 'registros': [_reg('A' + nome)]},
+                'seguinte': {'data_simples': seguinte, 'registros': [_reg('S' + nome)]},
+            }))
+        gravar('2026-08-20.json', '20/08/2026', '21/08/2026')
+        gravar('2026-08-21.json', '21/08/2026', '22/08/2026')
+        gravar('2026-08-22.json', '22/08/2026', '23/08/2026')
+        caminho, bloco = snapshot_anterior('21/08/2026', tmp_path)
+        assert caminho.name == '2026-08-21.json'
+        assert bloco['registros'][0]['profissional'] == 'A2026-08-21.json'
+        assert snapshot_anterior('01/01/2020', tmp_path) == (None, None)
@@ -0,0 +1,95 @@
+"""Testes das esperas orientadas a evento (sem navegador: driver falso)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from esperas import Esperas
+
+
+class DriverFalso:
+    """Devolve, a cada execute_script, o próximo valor da fila (o último se repete)."""
+
+    def __init__(self, respostas):
+        self.respostas = list(respostas)
+        self.chamadas = 0
+
+    def execute_script(self, script, *args):
+        self.chamadas += 1
+        if len(self.respostas) > 1:
+            return self.respostas.pop(0)
+        return self.respostas[0]
+
+
+class TestAte:
+    def test_atende_quando_predicado_fica_verdadeiro(self):
+        esperas = Esperas(DriverFalso([None]), intervalo=0.001)
+        valores = iter([False, False, True])
+        assert esperas.ate("etapa", lambda: next(valores), timeout=1) is True
+        assert esperas.tempos[0][0] == "etapa"
+        assert esperas.tempos[0][2] is True
+
+    def test_timeout_devolve_falso_e_registra(self):
+        esperas = Esperas(DriverFalso([None]), intervalo=0.001)
+        assert esperas.ate("nunca", lambda: False, timeout=0.02) is False
+        etapa, segundos, ok = esperas.tempos[0]
+        assert ok is False
+        assert segundos >= 0.02
+
+    def test_excecao_no_predicado_conta_como_falso(self):
+        esperas = Esperas(DriverFalso([None]), intervalo=0.001)
+        valores = iter([RuntimeError("stale"), True])
+
+        def predicado():
+            v = next(valores)
+            if isinstance(v, Exception):
+                raise v
+            return v
+
+        assert esperas.ate("instável", predicado, timeout=1) is True
+
+
+class TestCondicoes:
+    def test_dom_estavel_espera_quietude(self):
+        # ms desde a última mutação: ainda mexendo, mexendo, quieto
+        esperas = Esperas(DriverFalso([10, 200, 800]), intervalo=0.001)
+        assert esperas.dom_estavel("dom", quieto=0.5, timeout=1) is True
+
+    def test_rede_ociosa_exige_contagem_estavel(self):
+        # [nº de recursos, ms desde o último]: recursos chegando, depois parados
+        driver = DriverFalso([[5, 900], [7, 900], [7, 900]])
+        esperas = Esperas(driver, intervalo=0.001)
+        assert esperas.rede_ociosa("rede", quieto=0.5, timeout=1) is True
+        assert driver.chamadas == 3
+
+    def test_rede_ocupada_estoura_timeout(self):
+        esperas = Esperas(DriverFalso([[3, 10]]), intervalo=0.001)
+        assert esperas.rede_ociosa("rede", quieto=0.5, timeout=0.02) is False
+
+
+class TestRelatorio:
+    def test_relatorio_lista_etapas_e_total(self):
+        esperas = Esperas(DriverFalso([None]), intervalo=0.001)
+        esperas.ate("rápida", lambda: True, timeout=1)
+        esperas.ate("lenta", lambda: False, timeout=0.01)
+        texto = esperas.relatorio()
+        assert "2 etapas" in texto
+        assert "rápida" in texto and "lenta" in texto
+        assert "timeout" in texto
+
+    def test_relatorio_zera_o_registro(self):
+        # O extrator do daemon vive semanas: cada relatório cobre só a sua extração
+        esperas = Esperas(DriverFalso([None]), intervalo=0.001)
+        esperas.ate("primeira", lambda: True, timeout=1)
+        assert "1 etapas" in esperas.relatorio()
+        assert esperas.tempos == []
+        esperas.ate("segunda", lambda: True, timeout=1)
+        texto = esperas.relatorio()
+        assert "segunda" in texto and "primeira" not in texto
+
+    def test_relatorio_sem_zerar(self):
+        esperas = Esperas(DriverFalso([None]), intervalo=0.001)
+        esperas.ate("etapa", lambda: True, timeout=1)
+        esperas.relatorio(zerar=False)
+        assert len(esperas.tempos) == 1
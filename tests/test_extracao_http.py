@@ -0,0 +1,116 @@
+"""Testes da conversão da resposta da API da grade do dia (registros_da_api):
+o mapeamento heurístico de CAMPOS_API e o corte de horários de _hora."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('requests')
+pytest.importorskip('dotenv')
+
+from extracao_http import _campo, _hora, registros_da_api
+
+
+DIA = '22 agosto 2026'
+
+
+class TestHora:
+    @pytest.mark.parametrize('valor, esperado', [
+        ('2026-08-22T19:00:00-03:00', '19:00'),
+        ('2026-08-22T07:30:00Z', '07:30'),
+        ('2026-08-22T19:00:00.000000', '19:00'),
+        ('19:00:00', '19:00'),
+        ('19:00', '19:00'),
+        ('', ''),
+        (None, ''),
+    ])
+    def test_corta_em_hora_e_minuto(self, valor, esperado):
+        assert _hora(valor) == esperado
+
+
+class TestCampo:
+    @pytest.mark.parametrize('item, nome, esperado', [
+        ({'profissional': 'Ana Souza'}, 'profissional', 'Ana Souza'),
+        ({'plantonista': 'Ana Souza'}, 'profissional', 'Ana Souza'),
+        ({'name': '  Ana Souza  '}, 'profissional', 'Ana Souza'),
+        ({'medico': {'nome': 'Ana Souza'}}, 'profissional', 'Ana Souza'),
+        ({'escala': {'name': 'UTI Adulto'}}, 'setor', 'UTI Adulto'),
+        ({'nome_escala': 'UTI Adulto'}, 'setor', 'UTI Adulto'),
+        ({'periodo': 'Plantão Noturno'}, 'tipo_turno', 'Plantão Noturno'),
+        ({'shift': 'Plantão Diurno'}, 'tipo_turno', 'Plantão Diurno'),
+        ({'telefone': 51999990000}, 'phone', '51999990000'),
+        ({'e_mail': 'ana@hro.br'}, 'email', 'ana@hro.br'),
+        # Nome preferido vazio: cai para o próximo aceito
+        ({'profissional': '', 'nome': 'Ana Souza'}, 'profissional', 'Ana Souza'),
+        ({'setor': None, 'local': 'Emergência'}, 'setor', 'Emergência'),
+        ({'setor': {'id': 7}, 'sector': 'Emergência'}, 'setor', 'Emergência'),
+        # Ordem de preferência de CAMPOS_API quando vêm dois nomes
+        ({'nome': 'Outro', 'profissional': 'Ana Souza'}, 'profissional', 'Ana Souza'),
+        ({}, 'setor', ''),
+    ])
+    def test_primeiro_nome_aceito_nao_vazio(self, item, nome, esperado):
+        assert _campo(item, nome) == esperado
+
+
+class TestRegistrosDaApi:
+    @pytest.mark.parametrize('item, esperado', [
+        ({'profissional': 'Ana Souza', 'setor': 'UTI Adulto', 'tipo_turno': 'Plantão Noturno',
+          'horario': '19:00/07:00', 'email': 'ana@hro.br', 'phone': '51999990000'},
+         {'profissional': 'Ana Souza', 'setor': 'UTI Adulto', 'tipo_turno': 'Plantão Noturno',
+          'horario': '19:00/07:00', 'email': 'ana@hro.br', 'phone': '51999990000'}),
+        # Nomes alternativos, objetos aninhados e horário por início/fim ISO
+        ({'plantonista': {'nome': 'Ana Souza'}, 'escala': {'name': 'UTI Adulto'}, 'periodo': 'Plantão Noturno',
+          'hora_inicio': '2026-08-22T19:00:00-03:00', 'hora_fim': '2026-08-23T07:00:00-03:00',
+          'telefone': '51999990000'},
+         {'profissional': 'Ana Souza', 'setor': 'UTI Adulto', 'tipo_turno': 'Plantão Noturno',
+          'horario': '19:00/07:00', 'email': '', 'phone': '51999990000'}),
+        ({'name': 'Ana Souza', 'local': 'Emergência', 'shift': 'Plantão Diurno',
+          'start': '07:00:00', 'end': '19:00:00'},
+         {'profissional': 'Ana Souza', 'setor': 'Emergência', 'tipo_turno': 'Plantão Diurno',
+          'horario': '07:00/19:00', 'email': '', 'phone': ''}),
+        # 'horario' pronto tem precedência sobre início/fim
+        ({'nome': 'Ana Souza', 'turno': 'Rotina', 'horario_formatado': '08:00/14:00',
+          'inicio': '09:00', 'fim': '10:00'},
+         {'profissional': 'Ana Souza', 'setor': 'Plantão', 'tipo_turno': 'Rotina',
+          'horario': '08:00/14:00', 'email': '', 'phone': ''}),
+        # Sem setor vira 'Plantão'; só uma das pontas do horário não forma horário
+        ({'nome': 'Ana Souza', 'turno': 'Rotina', 'inicio': '2026-08-22T08:00:00'},
+         {'profissional': 'Ana Souza', 'setor': 'Plantão', 'tipo_turno': 'Rotina',
+          'horario': '', 'email': '', 'phone': ''}),
+    ])
+    def test_mapeia_os_campos(self, item, esperado):
+        (registro,) = registros_da_api([item], DIA)
+        assert registro == dict(esperado, data=DIA, pos_x=0)
+
+    @pytest.mark.parametrize('item', [
+        {'setor': 'UTI Adulto', 'tipo_turno': 'Plantão Noturno'},  # sem profissional
+        {'profissional': 'Ana Souza', 'setor': 'UTI Adulto'},  # sem turno
+        {'profissional': 'Al', 'tipo_turno': 'Plantão Noturno'},  # nome curto demais
+        {'profissional': 'Ana Souza', 'tipo_turno': 'P'},  # turno curto demais
+        {'profissional': {'id': 3}, 'tipo_turno': 'Plantão Noturno'},  # objeto sem nome
+        'Ana Souza',  # item que não é objeto
+        None,
+    ])
+    def test_descarta_itens_incompletos(self, item):
+        assert registros_da_api([item], DIA) == []
+
+    @pytest.mark.parametrize('chave', ['registros', 'plantoes', 'escalas', 'items', 'data', 'results'])
+    def test_lista_embrulhada(self, chave):
+        payload = {'total': 1, chave: [{'nome': 'Ana Souza', 'turno': 'Rotina'}]}
+        assert [r['profissional'] for r in registros_da_api(payload, DIA)] == ['Ana Souza']
+
+    def test_primeira_chave_de_lista_vence(self):
+        payload = {'data': {'dia': '2026-08-22'}, 'results': [{'nome': 'Bruno Lima', 'turno': 'Rotina'}],
+                   'registros': [{'nome': 'Ana Souza', 'turno': 'Rotina'}]}
+        assert [r['profissional'] for r in registros_da_api(payload, DIA)] == ['Ana Souza']
+
+    @pytest.mark.parametrize('payload', [{}, {'erro': 'sem escala'}, {'data': None}, [], None])
+    def test_payload_sem_lista(self, payload):
+        assert registros_da_api(payload, DIA) == []
+
+    def test_preserva_a_ordem_da_api(self):
+        itens = [{'nome': n, 'turno': 'Rotina'} for n in ('Carla Dias', 'Ana Souza', 'Bruno Lima')]
+        assert [r['profissional'] for r in registros_da_api(itens, DIA)] == ['Carla Dias', 'Ana Souza', 'Bruno Lima']
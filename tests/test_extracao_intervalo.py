@@ -0,0 +1,113 @@
+"""Testes da extração em lote (extrair_intervalo) e do preenchimento de
+data/historico/ (salvar_historico_intervalo), com uma grade falsa."""
+
+import json
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('selenium')
+pytest.importorskip('dotenv')
+
+import extracao_inteligente
+from extracao_inteligente import MESES_PT, ExtractorInteligente, montar_bloco, salvar_historico_intervalo
+from historico_compacto import FORMATO, ler_snapshot
+
+
+MESES = {n: nome for nome, n in MESES_PT.items()}
+
+
+def data_por_extenso(dia):
+    """date(2026, 8, 1) -> '01 agosto 2026', como no cabeçalho da grade."""
+    return f"{dia.day:02d} {MESES[dia.month]} {dia.year}"
+
+
+class EsperasFalsas:
+    def relatorio(self):
+        return ''
+
+
+class GradeFalsa(ExtractorInteligente):
+    """Grade sem navegador: um dia aberto, setas que andam um dia."""
+
+    def __init__(self, hoje, travar_em=None):
+        self.dia = hoje
+        self.travar_em = travar_em
+        self.aberturas = 0
+        self.esperas = EsperasFalsas()
+
+    def abrir_grade(self):
+        self.aberturas += 1
+
+    def extrair_dia(self):
+        texto = data_por_extenso(self.dia)
+        reg = {'profissional': f'Ana {self.dia.day}', 'setor': 'UTI Adulto - ESCALA MÉDICA',
+               'tipo_turno': 'Plantão Noturno', 'horario': '19:00/07:00', 'data': texto}
+        return {'data': texto, 'total': 1, 'registros': [reg]}
+
+    def navegar_dia(self, direcao='frente'):
+        antes = data_por_extenso(self.dia)
+        if self.dia != self.travar_em:
+            self.dia += timedelta(days=1 if direcao == 'frente' else -1)
+        return antes, data_por_extenso(self.dia)
+
+
+class TestExtrairIntervalo:
+    def test_anda_para_frente_a_partir_do_dia_aberto(self):
+        grade = GradeFalsa(date(2026, 8, 20))
+        dias = grade.extrair_intervalo(3, 'frente')
+        assert [d['data'] for d in dias] == ['20 agosto 2026', '21 agosto 2026', '22 agosto 2026']
+        assert grade.aberturas == 1
+
+    def test_anda_para_tras(self):
+        grade = GradeFalsa(date(2026, 8, 1))
+        dias = grade.extrair_intervalo(3, 'tras')
+        assert [d['data'] for d in dias] == ['01 agosto 2026', '31 julho 2026', '30 julho 2026']
+
+    def test_abrir_false_usa_a_grade_ja_aberta(self):
+        grade = GradeFalsa(date(2026, 8, 20))
+        grade.extrair_intervalo(2, abrir=False)
+        assert grade.aberturas == 0
+
+    def test_para_quando_a_navegacao_trava(self):
+        grade = GradeFalsa(date(2026, 8, 20), travar_em=date(2026, 8, 21))
+        assert len(grade.extrair_intervalo(5)) == 2
+
+    def test_direcao_invalida(self):
+        with pytest.raises(ValueError):
+            GradeFalsa(date(2026, 8, 20)).extrair_intervalo(2, 'lado')
+
+
+class TestSalvarHistoricoIntervalo:
+    @pytest.fixture
+    def blocos(self, monkeypatch):
+        monkeypatch.setattr(extracao_inteligente, 'carregar_ramais_data',
+                            lambda: ({'departments': [{'name': 'UTI', 'extensions': ['1234']}]}, None))
+        return [montar_bloco(r) for r in GradeFalsa(date(2026, 8, 20)).extrair_intervalo(3)]
+
+    def test_um_snapshot_compacto_por_dia_com_os_vizinhos(self, tmp_path, blocos):
+        gravados = salvar_historico_intervalo(blocos, pasta=str(tmp_path))
+        assert [Path(g).name for g in gravados] == ['2026-08-20.json', '2026-08-21.json', '2026-08-22.json']
+
+        bruto = json.loads((tmp_path / '2026-08-21.json').read_text(encoding='utf-8'))
+        assert bruto['formato'] == FORMATO and '$ref' in bruto['ramais_hro']
+
+        snapshot = ler_snapshot(tmp_path / '2026-08-21.json')
+        assert snapshot['atual']['data_simples'] == '21/08/2026'
+        assert snapshot['anterior']['data_simples'] == '20/08/2026'
+        assert snapshot['seguinte']['data_simples'] == '22/08/2026'
+        assert snapshot['atual']['registros'][0]['setor'] == 'UTI Adulto'
+        assert snapshot['ramais_hro']['departments'][0]['name'] == 'UTI'
+        # Nas pontas do intervalo o vizinho que não foi extraído fica vazio
+        assert ler_snapshot(tmp_path / '2026-08-20.json')['anterior']['registros'] == []
+
+    def test_nao_sobrescreve_dias_existentes(self, tmp_path, blocos):
+        existente = tmp_path / '2026-08-21.json'
+        existente.write_text('{"original": true}\n', encoding='utf-8')
+        gravados = salvar_historico_intervalo(blocos, pasta=str(tmp_path))
+        assert str(existente) not in gravados and len(gravados) == 2
+        assert json.loads(existente.read_text(encoding='utf-8')) == {'original': True}
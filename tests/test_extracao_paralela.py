@@ -0,0 +1,129 @@
+"""Testes da divisão e da mescla determinística da extração paralela."""
+
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from extracao_paralela import dividir_intervalo, extrair_fatias_http, mesclar, percorrer_fatia, plano_da_fatia
+
+
+def _bloco(data_simples, n=1):
+    return {'data_simples': data_simples, 'registros': [{}] * n, 'total': n}
+
+
+class TestDividirIntervalo:
+    def test_cobre_todos_os_dias_sem_sobrepor(self):
+        fatias = dividir_intervalo(date(2026, 7, 1), date(2026, 7, 30), 4)
+        assert [n for _, n in fatias] == [8, 8, 7, 7]
+        assert fatias[0][0] == date(2026, 7, 1)
+        assert fatias[1][0] == date(2026, 7, 9)
+        assert fatias[3][0] == date(2026, 7, 24)
+        assert sum(n for _, n in fatias) == 30
+
+    def test_nao_cria_mais_fatias_que_dias(self):
+        fatias = dividir_intervalo(date(2026, 8, 16), date(2026, 8, 17), 5)
+        assert fatias == [(date(2026, 8, 16), 1), (date(2026, 8, 17), 1)]
+
+    def test_intervalo_invertido_e_vazio(self):
+        assert dividir_intervalo(date(2026, 8, 2), date(2026, 8, 1), 3) == []
+
+
+class TestMesclar:
+    def test_ordena_por_data_independente_da_ordem_dos_workers(self):
+        fatias = [
+            [_bloco('03/08/2026'), _bloco('04/08/2026')],
+            [_bloco('01/08/2026'), _bloco('02/08/2026')],
+        ]
+        datas = [b['data_simples'] for b in mesclar(fatias)]
+        assert datas == ['01/08/2026', '02/08/2026', '03/08/2026', '04/08/2026']
+
+    def test_dia_repetido_fica_com_a_primeira_fatia(self):
+        fatias = [[_bloco('01/08/2026', 5)], [_bloco('01/08/2026', 9)]]
+        assert mesclar(fatias) == [_bloco('01/08/2026', 5)]
+
+    def test_descarta_blocos_sem_data(self):
+        assert mesclar([[_bloco('00/00/0000'), _bloco('N/A')]]) == []
+
+
+class GradeFalsa:
+    """Grade que só anda um dia por vez, contando os passos dados."""
+
+    def __init__(self, hoje):
+        self.dia = hoje
+        self.passos = 0
+        self.extraidos = []
+
+    def ir_para_data(self, alvo):
+        self.passos += abs((alvo - self.dia).days)
+        self.dia = alvo
+        return True
+
+    def extrair_intervalo(self, n_dias, direcao='frente', abrir=True):
+        passo = timedelta(days=1 if direcao == 'frente' else -1)
+        for i in range(n_dias):
+            self.extraidos.append(self.dia)
+            if i < n_dias - 1:
+                self.dia += passo
+                self.passos += 1
+        return list(self.extraidos)
+
+
+class TestPercorrerFatia:
+    HOJE = date(2026, 8, 31)
+
+    def _passos(self, fatias):
+        total = 0
+        for fatia in fatias:
+            grade = GradeFalsa(self.HOJE)
+            dias = percorrer_fatia(grade, fatia, self.HOJE)
+            primeiro, n = fatia
+            assert sorted(dias) == [primeiro + timedelta(days=i) for i in range(n)]
+            total += grade.passos
+        return total
+
+    def test_fatia_no_passado_parte_do_ultimo_dia(self):
+        assert plano_da_fatia((date(2026, 8, 1), 10), self.HOJE) == (date(2026, 8, 10), 'tras')
+
+    def test_fatia_no_futuro_parte_do_primeiro_dia(self):
+        assert plano_da_fatia((date(2026, 9, 5), 10), self.HOJE) == (date(2026, 9, 5), 'frente')
+
+    def test_navegador_em_paralelo_nao_ganharia_nada(self):
+        # 30 dias de julho, hoje 31/08. Com 3 navegadores, o da fatia mais
+        # distante anda 52 dias até 10/07 e mais 9 voltando: 61 passos. Uma
+        # varredura só anda 32 até 30/07 e 29 voltando: os mesmos 61 — por
+        # isso o navegador não é paralelizado
+        fatias = dividir_intervalo(date(2026, 7, 1), date(2026, 7, 30), 3)
+        pior_worker = max(self._passos([f]) for f in fatias)
+        assert pior_worker == 52 + 9
+        assert self._passos([(date(2026, 7, 1), 30)]) == 32 + 29 == pior_worker
+
+
+class ExtratorHTTPFalso:
+    def __init__(self, falhar_em=()):
+        self.pedidos = []
+        self.falhar_em = set(falhar_em)
+
+    def extrair_dia(self, dia):
+        if dia in self.falhar_em:
+            raise RuntimeError(f"HTTP 500 em {dia}")
+        self.pedidos.append(dia)
+        return {'data': dia.isoformat()}
+
+
+class TestFatiasHttp:
+    def test_cada_dia_e_pedido_direto_pela_data(self):
+        extrator = ExtratorHTTPFalso()
+        fatias = dividir_intervalo(date(2026, 7, 1), date(2026, 7, 10), 3)
+        resultados, falhas = extrair_fatias_http(extrator, fatias)
+        assert falhas == []
+        assert [len(r) for r in resultados] == [4, 3, 3]
+        assert sorted(extrator.pedidos) == [date(2026, 7, d) for d in range(1, 11)]
+
+    def test_falha_de_uma_fatia_volta_para_o_chamador(self):
+        extrator = ExtratorHTTPFalso(falhar_em={date(2026, 7, 6)})
+        fatias = dividir_intervalo(date(2026, 7, 1), date(2026, 7, 9), 3)
+        resultados, falhas = extrair_fatias_http(extrator, fatias)
+        assert [len(r) for r in resultados] == [3, 0, 3]
+        assert falhas == [((date(2026, 7, 4), 3), 'RuntimeError: HTTP 500 em 2026-07-06')]
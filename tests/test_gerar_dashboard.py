@@ -0,0 +1,32 @@
+"""Testes da preparação dos dados no gerador (gerar_dashboard_executivo.py)."""
+
+import copy
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from gerar_dashboard_executivo import preparar_escalas
+from historico_compacto import ler_snapshot
+
+SNAPSHOT = Path(__file__).parent.parent / 'data' / 'historico' / '2026-08-22.json'
+
+
+class TestPrepararEscalas:
+    def test_fallback_sem_atual(self):
+        # Fontes de fallback antigas não trazem o bloco 'atual'
+        escalas = {'seguinte': {'data_simples': '23/08/2026', 'registros': []}}
+        preparar_escalas(escalas)
+        assert escalas['atual']['registros'] == [] and escalas['atual']['agenda'] is not None
+        assert escalas['anterior']['data_simples'] == '00/00/0000'
+
+    def test_dias_vazios_nao_compartilham_a_lista(self):
+        escalas = preparar_escalas({})
+        escalas['anterior']['registros'].append({})
+        assert escalas['seguinte']['registros'] == []
+
+    def test_snapshot_completo_ganha_agenda(self):
+        escalas = copy.deepcopy(ler_snapshot(SNAPSHOT))
+        preparar_escalas(escalas)
+        assert escalas['atual']['registros'][0]['tipo_badge']
+        assert escalas['atual']['agenda']
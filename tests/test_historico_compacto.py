@@ -0,0 +1,42 @@
+"""Testes do formato compacto dos snapshots de data/historico/."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from historico_compacto import FORMATO, ler_snapshot, salvar_snapshot
+
+HISTORICO = Path(__file__).parent.parent / 'data' / 'historico'
+
+
+def _snapshot(nome='2026-08-22.json'):
+    with open(HISTORICO / nome, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class TestIdaEVolta:
+    def test_reconstroi_o_snapshot_original(self, tmp_path):
+        original = _snapshot()
+        destino = tmp_path / '2026-08-22.json'
+        tamanho = salvar_snapshot(original, destino)
+        assert json.loads(destino.read_text(encoding='utf-8'))['formato'] == FORMATO
+        assert ler_snapshot(destino) == original
+        assert tamanho < (HISTORICO / '2026-08-22.json').stat().st_size / 3
+
+    def test_tabelas_de_referencia_gravadas_uma_vez(self, tmp_path):
+        salvar_snapshot(_snapshot('2026-08-21.json'), tmp_path / '2026-08-21.json')
+        salvar_snapshot(_snapshot('2026-08-22.json'), tmp_path / '2026-08-22.json')
+        assert len(list((tmp_path / 'ref').glob('*.json'))) == 2
+
+    def test_le_snapshot_no_formato_antigo(self):
+        assert ler_snapshot(HISTORICO / '2026-08-22.json') == _snapshot()
+
+    def test_valor_nulo_cai_no_formato_completo(self, tmp_path):
+        escala = {'atual': {'data_simples': '22/08/2026', 'total': 1,
+                            'registros': [{'profissional': 'Ana', 'pos_x': None}]}}
+        destino = tmp_path / '2026-08-22.json'
+        salvar_snapshot(escala, destino)
+        assert 'formato' not in json.loads(destino.read_text(encoding='utf-8'))
+        assert ler_snapshot(destino) == escala
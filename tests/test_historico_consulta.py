@@ -0,0 +1,98 @@
+"""Testes da consulta indexada ao histórico."""
+
+import json
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import historico_consulta
+from historico_consulta import HistoricoConsulta, casa
+
+
+def _reg(prof, setor, turno='Plantão Noturno', horario='19:00/07:00'):
+    return {'profissional': prof, 'setor': setor, 'tipo_turno': turno, 'horario': horario}
+
+
+def _gravar(pasta, dia, atual, seguinte=None, anterior=None):
+    def bloco(data, regs):
+        return {'data_simples': data, 'registros': regs, 'total': len(regs)}
+    d, m, a = dia.split('-')[2], dia.split('-')[1], dia.split('-')[0]
+    escala = {'atual': bloco(f"{d}/{m}/{a}", atual)}
+    if seguinte:
+        escala['seguinte'] = bloco(*seguinte)
+    if anterior:
+        escala['anterior'] = bloco(*anterior)
+    (pasta / f"{dia}.json").write_text(json.dumps(escala), encoding='utf-8')
+
+
+class TestCasa:
+    def test_palavras_sem_acento_e_caixa(self):
+        assert casa('uti adulto ii', 'Unidade de Terapia Intensiva (UTI) Adulto II')
+        assert not casa('uti adulto ii', 'Unidade de Terapia Intensiva (UTI) Adulto III')
+        assert casa('clinica med', 'Residência de Clínica Médica')
+
+
+class TestConsulta:
+    def test_filtros_e_periodo(self, tmp_path):
+        _gravar(tmp_path, '2026-07-31', [_reg('Ana Souza', 'UTI Adulto II')])
+        _gravar(tmp_path, '2026-08-01', [_reg('Ana Souza', 'UTI Adulto II'),
+                                         _reg('Bruno Lima', 'UTI Adulto II', 'Plantão Diurno', '07:00/19:00')])
+        _gravar(tmp_path, '2026-08-02', [_reg('Bruno Lima', 'Clínica Médica')])
+        h = HistoricoConsulta(tmp_path, cache=None)
+
+        assert [t['data'] for t in h.turnos(profissional='ana')] == ['2026-07-31', '2026-08-01']
+        assert len(h.turnos(inicio=date(2026, 8, 1), fim='2026-08-31')) == 3
+        noites = h.cobertura('uti adulto ii', tipo='noturno', inicio='2026-08-01', fim='2026-08-31')
+        assert noites == {'Ana Souza': 1}
+
+    def test_versao_do_proprio_dia_vence(self, tmp_path):
+        # 01/08 como 'seguinte' do dia 31/07 e depois como 'atual' do próprio dia
+        _gravar(tmp_path, '2026-07-31', [_reg('Ana', 'UTI')], seguinte=('01/08/2026', [_reg('Velho', 'UTI')]))
+        _gravar(tmp_path, '2026-08-01', [_reg('Novo', 'UTI')])
+        _gravar(tmp_path, '2026-08-02', [_reg('Ana', 'UTI')], anterior=('01/08/2026', [_reg('Cache', 'UTI')]))
+        h = HistoricoConsulta(tmp_path, cache=None)
+        assert [t['profissional'] for t in h.turnos(inicio='2026-08-01', fim='2026-08-01')] == ['Novo']
+
+    def test_grafias_antigas_do_setor_e_do_turno_se_juntam(self, tmp_path):
+        _gravar(tmp_path, '2026-07-01', [_reg('Ana Souza', 'Unidade de Terapia intensiva (UTI) Adulto IV'),
+                                         _reg('Bia Reis', 'Clinica Médica', 'Res. Clinica Méidica Intermediário')])
+        _gravar(tmp_path, '2026-08-01', [_reg('Ana Souza', 'Unidade de Terapia Intensiva (UTI) Adulto IV - ESCALA MÉDICA')])
+        _gravar(tmp_path, '2026-08-02', [_reg('Caio Melo', 'Unidade de Terapia Intensiva (UTI) Adulto IV')])
+        registro = json.loads((tmp_path / '2026-07-01.json').read_text(encoding='utf-8'))
+        h = HistoricoConsulta(tmp_path, cache=None)
+
+        assert {t['setor'] for t in h.turnos(setor='uti adulto iv')} == {'Unidade de Terapia Intensiva (UTI) Adulto IV'}
+        assert h.cobertura('uti adulto iv', tipo='noturno') == {'Ana Souza': 2, 'Caio Melo': 1}
+        (bia,) = h.turnos(profissional='bia')
+        assert (bia['setor'], bia['tipo_turno']) == ('Clínica Médica', 'Res. Clínica Médica Intermediário')
+        # Os snapshots em disco não são alterados
+        assert json.loads((tmp_path / '2026-07-01.json').read_text(encoding='utf-8')) == registro
+
+    def test_cache_so_rele_arquivos_alterados(self, tmp_path):
+        pasta = tmp_path / 'historico'
+        pasta.mkdir()
+        cache = tmp_path / 'indice.json'
+        _gravar(pasta, '2026-08-01', [_reg('Ana', 'UTI')])
+        _gravar(pasta, '2026-08-02', [_reg('Bia', 'UTI')])
+        assert HistoricoConsulta(pasta, cache).relidos == 2
+        assert HistoricoConsulta(pasta, cache).relidos == 0
+
+        _gravar(pasta, '2026-08-02', [_reg('Caio', 'UTI'), _reg('Davi', 'UTI')])
+        os.utime(pasta / '2026-08-02.json', ns=(1, 1))
+        h = HistoricoConsulta(pasta, cache)
+        assert h.relidos == 1
+        assert {t['profissional'] for t in h.turnos()} == {'Ana', 'Caio', 'Davi'}
+
+    def test_regras_novas_do_classificador_invalidam_o_cache(self, tmp_path, monkeypatch):
+        pasta = tmp_path / 'historico'
+        pasta.mkdir()
+        cache = tmp_path / 'indice.json'
+        _gravar(pasta, '2026-08-01', [_reg('Ana', 'UTI')])
+        _gravar(pasta, '2026-08-02', [_reg('Bia', 'UTI')])
+        assert HistoricoConsulta(pasta, cache).relidos == 2
+        monkeypatch.setattr(historico_consulta, 'CLASSIFICADOR', 'outras-regras')
+        assert HistoricoConsulta(pasta, cache).relidos == 2
+        assert HistoricoConsulta(pasta, cache).relidos == 0
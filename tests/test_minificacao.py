@@ -0,0 +1,106 @@
+"""Testes da minificação do build de produção (minificacao.py)."""
+
+import gzip
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from minificacao import (
+    _tokens_js,
+    minificar_css,
+    minificar_html,
+    minificar_js,
+    sintaxe_js_valida,
+    tamanho_gzip,
+)
+from modelos import compilar
+
+
+def _js_do_dashboard():
+    """templates/dashboard.js com as inclusões resolvidas e valores neutros."""
+    modelo = compilar('dashboard.js', cache=None)
+    return modelo.renderizar(dict.fromkeys(modelo.nomes, 'null'))
+
+
+def _significativos(js):
+    return [t for t in _tokens_js(js) if t[0] not in ('espaco', 'comentario')]
+
+
+class TestMinificarJs:
+    def test_comentarios_e_espacos(self):
+        js = "// topo\nfunction soma(a, b) {\n    /* bloco */\n    return a + b;\n}\n"
+        assert minificar_js(js) == "function soma(a,b){return a+b;}"
+
+    def test_strings_templates_e_regex_intactos(self):
+        js = ("const a = 'x // nao é comentário';\n"
+              "const b = `  ${a.replace(/'/g, \"\\\\'\")}  ${`aninhado ${ {k: 1}.k }`} /* idem */ `;\n"
+              "const c = s.split(/\\s+/).length / 2;\n")
+        minificado = minificar_js(js)
+        assert "'x // nao é comentário'" in minificado
+        assert "`  ${a.replace(/'/g,\"\\\\'\")}  ${`aninhado ${{k:1}.k}`} /* idem */ `" in minificado
+        assert "s.split(/\\s+/).length/2" in minificado
+
+    def test_operadores_que_nao_podem_juntar(self):
+        assert minificar_js("x = a - -b;\ny = c + +d;\nz = /re/g in o;\n") == \
+            "x=a- -b;y=c+ +d;z=/re/g in o;"
+
+    def test_quebra_de_linha_mantida_onde_termina_instrucao(self):
+        # sem ';' a quebra é o que separa as instruções (e o return)
+        assert minificar_js("let a = 1\nlet b = 2\nreturn\nb\n") == "let a=1\nlet b=2\nreturn\nb"
+
+    def test_console_log_vira_void(self):
+        js = ("if (ok) console.log('a', f(1, [2]));\n"
+              "p.then(() => console.debug(`x ${y}`));\n"
+              "console.warn('fica');\nobj.console.log(1);\n")
+        assert minificar_js(js) == \
+            "if(ok)void 0;p.then(()=>void 0);console.warn('fica');obj.console.log(1);"
+        assert "console.log('a'" in minificar_js(js, remover_logs=False)
+
+    def test_mesmos_tokens_que_o_original(self):
+        js = _js_do_dashboard()
+        assert _significativos(minificar_js(js, remover_logs=False)) == _significativos(js)
+
+    def test_dashboard_minificado_compila(self):
+        minificado = minificar_js(_js_do_dashboard())
+        resultado = sintaxe_js_valida(minificado)
+        if resultado is None:
+            pytest.skip("node não disponível")
+        assert resultado
+        assert 'console.log' not in minificado
+
+    def test_template_sem_fim(self):
+        with pytest.raises(ValueError):
+            minificar_js("const a = `aberto ${b}")
+
+
+class TestMinificarCss:
+    def test_regras(self):
+        css = "/* tema */\n.a > .b ,\n.c:hover {\n    color : red;\n    margin: 0 auto;\n}\n@media (max-width: 600px) {\n    .a { display: none; }\n}\n"
+        assert minificar_css(css) == \
+            ".a>.b,.c:hover{color :red;margin:0 auto}@media (max-width:600px){.a{display:none}}"
+
+    def test_strings_e_seletor_descendente(self):
+        css = '.a :is(.b) { content: " ; , > "; }'
+        assert minificar_css(css) == '.a :is(.b){content:" ; , > "}'
+
+
+class TestMinificarHtml:
+    def test_blocos(self):
+        html = ("<!-- NÃO EDITE -->\n<html>\n    <!-- seção -->\n    <pre>\n  a\n</pre>\n"
+                "    <style>\n  p { color: red; }\n    </style>\n"
+                "    <script type=\"application/ld+json\">\n  {\"a\": 1}\n</script>\n"
+                "    <script>\n  // x\n  go( 1 );\n    </script>\n</html>\n")
+        assert minificar_html(html) == (
+            "<!-- NÃO EDITE -->\n<html>\n<pre>\n  a\n</pre>\n<style>p{color:red}</style>\n"
+            "<script type=\"application/ld+json\">\n  {\"a\": 1}\n</script>\n"
+            "<script>go(1);</script>\n</html>\n")
+
+
+class TestTamanhoGzip:
+    def test_deterministico_e_menor(self):
+        texto = '<p>escala</p>' * 100
+        assert tamanho_gzip(texto) == len(gzip.compress(texto.encode('utf-8'), 9, mtime=0)) < len(texto)
+        assert tamanho_gzip(texto) == tamanho_gzip(texto)
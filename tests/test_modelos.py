@@ -0,0 +1,73 @@
+"""Testes do motor de modelos da página (templates/)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modelos import PASTA_MODELOS, compilar
+
+
+def _modelos(pasta, **arquivos):
+    pasta.mkdir(exist_ok=True)
+    for nome, texto in arquivos.items():
+        (pasta / nome.replace('_', '.')).write_text(texto, encoding='utf-8')
+    return pasta
+
+
+class TestCompilar:
+    def test_inclusao_e_valores(self, tmp_path):
+        pasta = _modelos(tmp_path / 'm', pagina_html="<style>{{> estilo.css }}</style><p>{{ nome }}</p>{{nome}}",
+                         estilo_css="p { color: {{ cor }}; }")
+        modelo = compilar('pagina.html', pasta, cache=None)
+        assert modelo.nomes == {'nome', 'cor'}
+        assert modelo.renderizar({'nome': 'Ana', 'cor': 'red'}) == \
+            "<style>p { color: red; }</style><p>Ana</p>Ana"
+
+    def test_valor_ausente(self, tmp_path):
+        pasta = _modelos(tmp_path / 'm', pagina_html="{{ a }}{{ b }}")
+        with pytest.raises(KeyError, match='b'):
+            compilar('pagina.html', pasta, cache=None).renderizar({'a': ''})
+
+    def test_inclusao_circular(self, tmp_path):
+        pasta = _modelos(tmp_path / 'm', a_html="{{> b.html }}", b_html="{{> a.html }}")
+        with pytest.raises(ValueError, match='circular'):
+            compilar('a.html', pasta, cache=None)
+
+    def test_cache_pelo_hash_dos_modelos(self, tmp_path):
+        pasta = _modelos(tmp_path / 'm', pagina_html="v1 {{ x }}")
+        cache = tmp_path / 'cache'
+        primeiro = compilar('pagina.html', pasta, cache)
+        assert len(list(cache.glob('pagina.*.json'))) == 1
+        assert compilar('pagina.html', pasta, cache).trechos == primeiro.trechos
+
+        (pasta / 'pagina.html').write_text("v2 {{ x }}", encoding='utf-8')
+        segundo = compilar('pagina.html', pasta, cache)
+        assert segundo.hash != primeiro.hash
+        assert segundo.renderizar({'x': '!'}) == "v2 !"
+        assert len(list(cache.glob('pagina.*.json'))) == 1  # o antigo sai
+
+    def test_modelo_do_dashboard(self):
+        modelo = compilar('dashboard.html', PASTA_MODELOS, cache=None)
+        assert modelo.nomes == {'versao', 'preload_assets', 'dados_embutidos', 'assets', 'excluir_print',
+                                'vista_inicial', 'stats_iniciais', 'data_inicial'}
+
+    def test_minificado_com_cache_proprio(self, tmp_path):
+        pasta = _modelos(tmp_path / 'm', pagina_html="<p>\n    {{ x }}\n</p>\n<!-- nota -->\n"
+                                                     "<script>\n    const A = {{ x }};\n</script>")
+        cache = tmp_path / 'cache'
+        normal = compilar('pagina.html', pasta, cache)
+        minificado = compilar('pagina.html', pasta, cache, minificar=True)
+        assert minificado.renderizar({'x': '1'}) == "<p>\n1\n</p>\n<script>const A=1;</script>\n"
+        assert minificado.hash != normal.hash
+        assert len(list(cache.glob('pagina.*.json'))) == 1
+        assert len(list(cache.glob('pagina-min.*.json'))) == 1
+        assert compilar('pagina.html', pasta, cache, minificar=True).trechos == minificado.trechos
+
+    def test_modelo_js_minificado_como_js(self, tmp_path):
+        pasta = _modelos(tmp_path / 'm', trabalho_js="// topo\nconst a = {{ x }};\n{{> comum.js }}",
+                         comum_js="function f(b) {\n    return b + 1;\n}\n")
+        assert compilar('trabalho.js', pasta, cache=None, minificar=True).renderizar({'x': '1'}) == \
+            "const a=1;function f(b){return b+1;}"
@@ -0,0 +1,191 @@
+"""Testes do script da página (templates/dashboard.js) rodando no node.
+
+O script inteiro roda num contexto vm com um DOM de mentira (qualquer
+propriedade é um objeto que aceita tudo): pega erros de escopo — função
+aninhada por engano dentro de outra, variável fora de alcance — que o
+node --check não vê.
+"""
+
+import copy
+import json
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dashboard_logic import agenda_plantoes, classificar_registros
+from historico_compacto import ler_snapshot
+from modelos import PASTA_MODELOS, compilar
+from pre_renderizacao import EXCLUIR_PRINT
+
+BASE = Path(__file__).parent.parent
+SNAPSHOT = BASE / 'data' / 'historico' / '2026-08-22.json'
+
+_CONTEXTO = r"""
+const vm = require('vm');
+const fs = require('fs');
+function falso() {
+    const f = function () {};
+    return new Proxy(f, {
+        get(alvo, chave) {
+            if (chave === Symbol.toPrimitive) return () => '';
+            if (chave === Symbol.iterator) return function* () {};
+            if (chave === 'then') return undefined;
+            if (chave === 'length') return 0;
+            return falso();
+        },
+        set() { return true; },
+        apply() { return falso(); },
+        construct() { return falso(); },
+    });
+}
+const mudo = () => {};
+const contexto = vm.createContext({
+    window: { addEventListener: mudo },
+    document: falso(),
+    navigator: {},
+    location: { protocol: 'file:', hostname: '' },
+    localStorage: { getItem: () => null, setItem: mudo },
+    console: { log: mudo, debug: mudo, info: mudo, warn: mudo, error: mudo },
+    setTimeout: () => 0, clearTimeout: mudo, setInterval: () => 0, clearInterval: mudo,
+    requestAnimationFrame: () => 0,
+});
+vm.runInContext(fs.readFileSync(process.argv[2], 'utf-8'), contexto);
+const nomes = JSON.parse(process.argv[3]);
+const resultado = { indefinidas: nomes.filter(n => vm.runInContext(`typeof ${n}`, contexto) !== 'function') };
+try {
+    vm.runInContext('aplicarDados(DADOS_EMBUTIDOS); aposRenderizar({}, [])', contexto);
+    resultado.aposRenderizar = 'ok';
+} catch (e) {
+    resultado.aposRenderizar = `${e.name}: ${e.message}`;
+}
+process.stdout.write(JSON.stringify(resultado));
+"""
+
+
+# Modo --assets: o fetch dos dados fica preso até o roteiro soltá-lo (ou
+# derrubá-lo), e o login por 4 dígitos é tentado antes disso
+_LOGIN_ANTES_DOS_DADOS = r"""
+const vm = require('vm');
+const fs = require('fs');
+function falso() {
+    return new Proxy(function () {}, {
+        get(alvo, chave) {
+            if (chave === Symbol.toPrimitive) return () => '';
+            if (chave === 'then') return undefined;
+            if (chave === 'length') return 0;
+            return falso();
+        },
+        set() { return true; }, apply() { return falso(); }, construct() { return falso(); },
+    });
+}
+const mudo = () => {};
+async function tentar(fetchOk) {
+    let soltar, derrubar;
+    const portao = new Promise((ok, erro) => { soltar = ok; derrubar = erro; });
+    const respostas = {
+        'escala.json': { escalas: {} },
+        'profissionais.json': { professionals: [{ name: 'Ana', last4: '1234' }] },
+    };
+    const elementos = {
+        'auth-input-outro': { value: '1234' },
+        'auth-error-outro': { textContent: '', classList: { add: mudo, remove: mudo } },
+    };
+    const guardado = {};
+    const documento = new Proxy({}, {
+        get(alvo, chave) { return chave === 'getElementById' ? id => elementos[id] || falso() : falso(); },
+    });
+    const contexto = vm.createContext({
+        window: { addEventListener: mudo }, document: documento, navigator: {},
+        location: { protocol: 'file:', hostname: '' },
+        localStorage: { getItem: k => guardado[k] || null, setItem: (k, v) => { guardado[k] = v; } },
+        console: { log: mudo, debug: mudo, info: mudo, warn: mudo, error: mudo },
+        setTimeout: () => 0, clearTimeout: mudo, setInterval: () => 0, clearInterval: mudo,
+        requestAnimationFrame: () => 0,
+        fetch: url => portao.then(() => ({ ok: true, json: () => respostas[url] })),
+    });
+    vm.runInContext(fs.readFileSync(process.argv[2], 'utf-8'), contexto);
+    vm.runInContext('autenticarOutro()', contexto);
+    const enquanto = [elementos['auth-error-outro'].textContent, guardado.authenticated || null];
+    if (fetchOk) soltar(); else derrubar(new Error('offline'));
+    await new Promise(r => setImmediate(r));
+    return { enquanto, depois: [elementos['auth-error-outro'].textContent, guardado.authenticated || null] };
+}
+(async () => {
+    process.stdout.write(JSON.stringify({ chegou: await tentar(true), falhou: await tentar(false) }));
+})();
+"""
+
+
+def _funcoes_de_topo():
+    """Funções declaradas no nível do script (8 espaços, como no modelo)."""
+    nomes = []
+    for arquivo in ('dashboard.js', 'busca.js'):
+        texto = (PASTA_MODELOS / arquivo).read_text(encoding='utf-8')
+        nomes += re.findall(r'^ {8}function (\w+)\(', texto, re.M)
+    return nomes
+
+
+@pytest.fixture(scope='module')
+def resultado(tmp_path_factory):
+    if not shutil.which('node'):
+        pytest.skip("node não disponível")
+    escalas = copy.deepcopy(ler_snapshot(SNAPSHOT))
+    classificar_registros(escalas)
+    escalas['atual']['agenda'] = agenda_plantoes(escalas['atual']['registros'])
+    js = compilar('dashboard.js', cache=None).renderizar({
+        'dados_embutidos': json.dumps({'escalas': escalas, 'mudancas': {}, 'ramaisPorSetor': {}}),
+        'assets': 'null',
+        'excluir_print': json.dumps(list(EXCLUIR_PRINT)),
+    })
+    pasta = tmp_path_factory.mktemp('pagina')
+    (pasta / 'pagina.js').write_text(js, encoding='utf-8')
+    (pasta / 'roda.js').write_text(_CONTEXTO, encoding='utf-8')
+    saida = subprocess.run(['node', str(pasta / 'roda.js'), str(pasta / 'pagina.js'),
+                            json.dumps(_funcoes_de_topo())], capture_output=True, text=True)
+    assert saida.returncode == 0, saida.stderr
+    return json.loads(saida.stdout)
+
+
+class TestScriptDaPagina:
+    def test_funcoes_no_escopo_do_script(self, resultado):
+        assert resultado['indefinidas'] == []
+
+    def test_pos_renderizacao_sem_erro(self, resultado):
+        assert resultado['aposRenderizar'] == 'ok'
+
+
+@pytest.fixture(scope='module')
+def login_antes_dos_dados(tmp_path_factory):
+    if not shutil.which('node'):
+        pytest.skip("node não disponível")
+    js = compilar('dashboard.js', cache=None).renderizar({
+        'dados_embutidos': 'null',
+        'assets': json.dumps({'escala': 'escala.json',
+                              'tabelas': [{'nome': 'profissionais', 'url': 'profissionais.json'}]}),
+        'excluir_print': '[]',
+    })
+    pasta = tmp_path_factory.mktemp('login')
+    (pasta / 'pagina.js').write_text(js, encoding='utf-8')
+    (pasta / 'roda.js').write_text(_LOGIN_ANTES_DOS_DADOS, encoding='utf-8')
+    saida = subprocess.run(['node', str(pasta / 'roda.js'), str(pasta / 'pagina.js')],
+                           capture_output=True, text=True)
+    assert saida.returncode == 0, saida.stderr
+    return json.loads(saida.stdout)
+
+
+class TestLoginAntesDosDados:
+    def test_espera_o_cadastro_em_vez_de_recusar(self, login_antes_dos_dados):
+        r = login_antes_dos_dados['chegou']
+        assert r['enquanto'] == ['Verificando cadastro...', None]
+        assert r['depois'][1] == 'true'
+
+    def test_cadastro_indisponivel_nao_e_credencial_errada(self, login_antes_dos_dados):
+        mensagem, autenticado = login_antes_dos_dados['falhou']['depois']
+        assert autenticado is None
+        assert 'indisponível' in mensagem and 'não reconhecidos' not in mensagem
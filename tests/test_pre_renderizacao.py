@@ -0,0 +1,115 @@
+"""Testes da pré-renderização do dia inicial (pre_renderizacao.py).
+
+A marcação tem de ser a mesma de htmlSetor() em templates/dashboard.js — o JS
+adota os nós pré-renderizados em vez de recriá-los. A equivalência é
+conferida rodando o próprio htmlSetor() no node sobre um snapshot real.
+"""
+
+import copy
+import json
+import re
+import shutil
+import subprocess
+import sys
+from html import unescape
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dashboard_logic import classificar_registros
+from historico_compacto import ler_snapshot
+from modelos import PASTA_MODELOS
+from pre_renderizacao import EXCLUIR_PRINT, html_setor, renderizar_stats, renderizar_vista, valores_iniciais
+
+BASE = Path(__file__).parent.parent
+SNAPSHOT = BASE / 'data' / 'historico' / '2026-08-22.json'
+
+
+@pytest.fixture(scope='module')
+def escalas():
+    dados = copy.deepcopy(ler_snapshot(SNAPSHOT))
+    classificar_registros(dados)
+    return dados
+
+
+@pytest.fixture(scope='module')
+def profissionais():
+    return json.loads((BASE / 'profissionais_autenticacao.json').read_text(encoding='utf-8'))
+
+
+def _funcao_js(js, nome):
+    """Fonte de `function nome(...) {...}` (chaves balanceadas)."""
+    inicio = js.index(f"function {nome}(")
+    nivel = 0
+    for i in range(js.index('{', inicio), len(js)):
+        nivel += {'{': 1, '}': -1}.get(js[i], 0)
+        if nivel == 0:
+            return js[inicio:i + 1]
+    raise ValueError(nome)
+
+
+def _normalizar(html):
+    return re.sub(r'>\s+<', '><', html.strip())
+
+
+class TestRenderizarVista:
+    def test_todos_os_registros_uma_vez(self, escalas, profissionais):
+        registros = escalas['atual']['registros']
+        vista = renderizar_vista(escalas['atual'], profissionais)
+        assert vista.startswith(f'<div class="vista-dia" data-dia="atual" data-pre="{len(registros)}">')
+        ids = [int(i) for i in re.findall(r'data-id="(\d+)"', vista)]
+        assert sorted(ids) == list(range(len(registros)))
+        setores = re.findall(r'<div class="category[^"]*" data-setor="([^"]*)"', vista)
+        assert [unescape(s) for s in setores] == sorted({r['setor'] for r in registros})
+
+    def test_dia_vazio(self):
+        assert renderizar_vista({'registros': []}, {}) == ''
+        assert renderizar_stats({'registros': []}) == ''
+
+    def test_escapa_texto(self):
+        reg = {'profissional': 'Ana <b>', 'setor': "D'Or & Cia", 'tipo_turno': 'Plantão', 'horario': '07:00/19:00',
+               'tipo_badge': 'plantao', 'turno_nome': 'Plantão', 'turno_ordem': 1}
+        html = html_setor(reg['setor'], [reg], {id(reg): 0}, {'ana <b>': '(27) 99999-0000'})
+        assert 'Ana &lt;b&gt;' in html and 'D&#x27;Or &amp; Cia' in html
+        assert 'https://wa.me/5527999990000' in html
+
+    def test_valores_iniciais(self, escalas, profissionais):
+        valores = valores_iniciais(escalas['atual'], profissionais)
+        assert valores['data_inicial'] == escalas['atual']['data']
+        assert f'<div class="stat-number">{len({r["setor"] for r in escalas["atual"]["registros"]})}</div>' \
+            in valores['stats_iniciais']
+
+
+class TestIgualAoJs:
+    def test_mesma_marcacao_de_html_setor(self, escalas, profissionais, tmp_path):
+        if not shutil.which('node'):
+            pytest.skip("node não disponível")
+        js = (PASTA_MODELOS / 'dashboard.js').read_text(encoding='utf-8')
+        fontes = '\n'.join(_funcao_js(js, n) for n in ('temMultiplosTurnos', 'formatarTipoBadge', 'htmlSetor'))
+        roteiro = tmp_path / 'setores.js'
+        roteiro.write_text(f"""
+const dados = JSON.parse(require('fs').readFileSync(0, 'utf-8'));
+const escalas = dados.escalas;
+const mapaProfissionais = {{}};
+dados.profissionais.professionals.forEach(p => {{ mapaProfissionais[p.name.toLowerCase()] = p; }});
+const EXCLUIR_PRINT = dados.excluir;
+{fontes}
+const registros = escalas.atual.registros;
+const idDe = new Map(registros.map((r, id) => [r, id]));
+const porSetor = {{}};
+registros.forEach(r => {{ (porSetor[r.setor] = porSetor[r.setor] || []).push(r); }});
+process.stdout.write(JSON.stringify(Object.keys(porSetor).sort().map(s =>
+    htmlSetor(s, porSetor[s], idDe, false, EXCLUIR_PRINT.includes(s)))));
+""", encoding='utf-8')
+        entrada = json.dumps({'escalas': escalas, 'profissionais': profissionais, 'excluir': list(EXCLUIR_PRINT)})
+        saida = subprocess.run(['node', str(roteiro)], input=entrada, capture_output=True, text=True,
+                               check=True).stdout
+        do_js = json.loads(saida)
+
+        vista = renderizar_vista(escalas['atual'], profissionais)
+        do_python = re.findall(r'<div class="category.*?(?=<div class="category|</div>$)', vista, re.S)
+        assert len(do_python) == len(do_js) > 0
+        for py, js_ in zip(do_python, do_js):
+            assert unescape(_normalizar(py)) == _normalizar(js_)
@@ -0,0 +1,32 @@
+"""Testes do gerador do service worker (sw.js)."""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from service_worker import SHELL, gerar_service_worker
+
+
+def _constante(texto, nome):
+    return json.loads(re.search(rf"^const {nome} = (.*);$", texto, re.M).group(1))
+
+
+class TestGerarServiceWorker:
+    def test_versao_no_nome_do_cache(self):
+        sw = gerar_service_worker('20260822_070000')
+        assert _constante(sw, 'VERSAO') == '20260822_070000'
+        assert "const CACHE = 'escala-hro-' + VERSAO;" in sw
+
+    def test_modo_padrao_so_a_casca(self):
+        sw = gerar_service_worker('v1')
+        assert _constante(sw, 'PRECACHE') == list(SHELL)
+        assert _constante(sw, 'REVALIDAR') == []
+
+    def test_modo_assets_precarrega_dados(self):
+        sw = gerar_service_worker('v1', assets=['assets/ramais.abc.json'], revalidar=['escala.json'])
+        assert _constante(sw, 'PRECACHE') == list(SHELL) + ['escala.json', 'assets/ramais.abc.json']
+        assert _constante(sw, 'REVALIDAR') == ['escala.json']
+        assert '__' not in sw  # nenhum marcador do modelo sobrou
@@ -0,0 +1,125 @@
+"""Testes da captura/reaplicação da sessão persistida (driver falso)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import sessao_persistente
+from sessao_persistente import aplicar, capturar, carregar_sessao, retomar_ou_entrar, salvar_sessao
+
+
+class DriverFalso:
+    def __init__(self, cookies=None, storage=None):
+        self.cookies = list(cookies or [])
+        self.storage = dict(storage or {})
+        self.visitadas = []
+
+    def get(self, url):
+        self.visitadas.append(url)
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def execute_script(self, script, *args):
+        if args:
+            self.storage.update(args[0])
+            return None
+        return dict(self.storage)
+
+
+class TestAplicar:
+    def test_reaplica_cookies_validos_e_storage(self):
+        sessao = {
+            'cookies': [
+                {'name': 'sid', 'value': 'a', 'expiry': 2000},
+                {'name': 'sessao', 'value': 'b'},
+                {'name': 'velho', 'value': 'c', 'expiry': 500},
+            ],
+            'local_storage': {'token': 'xyz'},
+        }
+        driver = DriverFalso()
+        assert aplicar(driver, sessao, agora=1000) == 2
+        assert [c['name'] for c in driver.cookies] == ['sid', 'sessao']
+        assert driver.storage == {'token': 'xyz'}
+        assert driver.visitadas == ['https://escala.med.br/painel/']
+
+    def test_capturar_le_cookies_e_storage(self):
+        driver = DriverFalso([{'name': 'sid', 'value': 'a'}], {'token': 'xyz'})
+        sessao = capturar(driver)
+        assert sessao['cookies'] == [{'name': 'sid', 'value': 'a'}]
+        assert sessao['local_storage'] == {'token': 'xyz'}
+
+
+class TestArquivo:
+    def test_sem_chave_nao_grava_nem_le(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('ESCALA_SESSAO_CHAVE', raising=False)
+        arquivo = tmp_path / 'sessao.bin'
+        assert salvar_sessao(DriverFalso(), arquivo) is False
+        assert not arquivo.exists()
+        assert carregar_sessao(arquivo) is None
+
+    def test_chave_invalida_desliga_a_persistencia(self, tmp_path, monkeypatch):
+        pytest.importorskip('cryptography.fernet')
+        monkeypatch.setenv('ESCALA_SESSAO_CHAVE', 'nao-e-uma-chave-fernet')
+        arquivo = tmp_path / 'sessao.bin'
+        assert salvar_sessao(DriverFalso(), arquivo) is False
+        assert not arquivo.exists()
+        arquivo.write_bytes(b'qualquer coisa')
+        assert carregar_sessao(arquivo) is None
+
+    def test_ida_e_volta_cifrada(self, tmp_path):
+        fernet = pytest.importorskip('cryptography.fernet')
+        chave = fernet.Fernet.generate_key().decode()
+        arquivo = tmp_path / 'sessao.bin'
+        driver = DriverFalso([{'name': 'sid', 'value': 'a'}], {'token': 'xyz'})
+        assert salvar_sessao(driver, arquivo, chave) is True
+        assert b'xyz' not in arquivo.read_bytes()
+        assert carregar_sessao(arquivo, chave)['local_storage'] == {'token': 'xyz'}
+        outra = fernet.Fernet.generate_key().decode()
+        assert carregar_sessao(arquivo, outra) is None
+
+
+class TestRetomarOuEntrar:
+    @pytest.fixture
+    def disco(self, monkeypatch):
+        """Arquivo de sessão em memória (a cifra é testada em TestArquivo)."""
+        disco = {}
+        monkeypatch.setattr(sessao_persistente, 'carregar_sessao', lambda *a: disco.get('sessao'))
+        monkeypatch.setattr(sessao_persistente, 'salvar_sessao',
+                            lambda driver, *a: disco.__setitem__('sessao', capturar(driver)))
+        monkeypatch.setattr(sessao_persistente, 'descartar_sessao', lambda *a: disco.pop('sessao', None))
+        return disco
+
+    def test_sessao_reaproveitada_e_regravada_com_o_que_o_servidor_renovou(self, disco):
+        disco['sessao'] = {'cookies': [{'name': 'sid', 'value': 'velho'}], 'local_storage': {}}
+        driver = DriverFalso()
+        logins = []
+
+        def valida():
+            driver.cookies = [{'name': 'sid', 'value': 'renovado'}]
+            return True
+
+        assert retomar_ou_entrar(driver, valida, lambda: logins.append(1)) is True
+        assert logins == []
+        assert disco['sessao']['cookies'] == [{'name': 'sid', 'value': 'renovado'}]
+
+    def test_sessao_vencida_faz_login_e_grava_a_nova(self, disco):
+        disco['sessao'] = {'cookies': [{'name': 'sid', 'value': 'velho'}], 'local_storage': {}}
+        driver = DriverFalso()
+
+        def login():
+            driver.cookies = [{'name': 'sid', 'value': 'novo'}]
+
+        assert retomar_ou_entrar(driver, lambda: False, login) is False
+        assert disco['sessao']['cookies'] == [{'name': 'sid', 'value': 'novo'}]
+
+    def test_sem_sessao_salva_faz_login(self, disco):
+        logins = []
+        assert retomar_ou_entrar(DriverFalso(), lambda: True, lambda: logins.append(1)) is False
+        assert logins == [1] and 'sessao' in disco
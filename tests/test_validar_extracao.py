@@ -30,15 +30,20 @@ class TestContarRegistros:
 
 
 class TestMain:
-    def _rodar(self, tmp_path, monkeypatch, extracao=None, baseline=None):
+    def _rodar(self, tmp_path, monkeypatch, extracao=None, baseline=None, snapshot=None):
         ext = tmp_path / "extracao.json"
         base = tmp_path / "baseline.json"
+        historico = tmp_path / "historico"
+        historico.mkdir()
         if extracao is not None:
             ext.write_text(json.dumps(extracao), encoding="utf-8")
         if baseline is not None:
             base.write_text(json.dumps(baseline), encoding="utf-8")
+        if snapshot is not None:
+            (historico / "2026-01-01.json").write_text(json.dumps(snapshot), encoding="utf-8")
         monkeypatch.setattr(validar_extracao, "EXTRACAO", ext)
         monkeypatch.setattr(validar_extracao, "BASELINE", base)
+        monkeypatch.setattr(validar_extracao, "HISTORICO", historico)
         return validar_extracao.main()
 
     def test_arquivo_ausente_falha(self, tmp_path, monkeypatch):
@@ -63,3 +68,22 @@ class TestMain:
         rc = self._rodar(tmp_path, monkeypatch,
                          extracao=_janela(100, "01/01/2020"), baseline=_janela(100))
         assert rc == 1
+
+    def _com_profissionais(self, nomes, data_simples):
+        regs = [{"profissional": n, "setor": f"Setor {i}"} for i, n in enumerate(nomes)]
+        return {"atual": {"registros": regs, "total": len(regs), "data_simples": data_simples}}
+
+    def test_troca_em_massa_no_mesmo_dia_falha(self, tmp_path, monkeypatch):
+        hoje = validar_extracao.datetime.now(validar_extracao.BRT).strftime("%d/%m/%Y")
+        velho = self._com_profissionais([f"Prof {i}" for i in range(100)], hoje)
+        nova = self._com_profissionais([f"Outro {i}" for i in range(60)] +
+                                       [f"Prof {i}" for i in range(60, 100)], hoje)
+        rc = self._rodar(tmp_path, monkeypatch, extracao=nova, baseline=_janela(100), snapshot=velho)
+        assert rc == 1
+
+    def test_poucas_trocas_no_mesmo_dia_passam(self, tmp_path, monkeypatch):
+        hoje = validar_extracao.datetime.now(validar_extracao.BRT).strftime("%d/%m/%Y")
+        velho = self._com_profissionais([f"Prof {i}" for i in range(100)], hoje)
+        nova = self._com_profissionais(["Substituto"] + [f"Prof {i}" for i in range(1, 100)], hoje)
+        rc = self._rodar(tmp_path, monkeypatch, extracao=nova, baseline=_janela(100), snapshot=velho)
+        assert rc == 0
@@ -0,0 +1,64 @@
+"""Testes do worker de busca (templates/worker_busca.js + busca.js).
+
+O worker roda no node com um `self` de mentira: as mensagens são as mesmas
+que a página manda (ver filtrarProfissionais em templates/dashboard.js).
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modelos import compilar
+from service_worker import SHELL, WORKER_BUSCA
+
+TEXTOS = ['José da Silva Clínica Médica Plantão', 'Maria Souza Cirurgia Sobreaviso', 'Ana Clara UTI Adulto Plantão']
+
+
+def _conversa(worker, mensagens, tmp_path):
+    """Respostas do worker às `mensagens`, em ordem (ids viram listas)."""
+    roteiro = tmp_path / 'conversa.js'
+    roteiro.write_text(
+        "const respostas = [];\n"
+        "const self = { postMessage: m => respostas.push(Object.assign({}, m, "
+        "{ ids: m.ids === null ? null : Array.from(m.ids) })) };\n"
+        f"new Function('self', {json.dumps(worker)})(self);\n"
+        f"{json.dumps(mensagens)}.forEach(data => self.onmessage({{ data }}));\n"
+        "process.stdout.write(JSON.stringify(respostas));\n", encoding='utf-8')
+    saida = subprocess.run(['node', str(roteiro)], capture_output=True, text=True, check=True).stdout
+    return json.loads(saida)
+
+
+@pytest.mark.parametrize('minificar', [False, True])
+def test_indexar_e_buscar(minificar, tmp_path):
+    if not shutil.which('node'):
+        pytest.skip("node não disponível")
+    worker = compilar('worker_busca.js', cache=None, minificar=minificar).renderizar({})
+    indexar = {'tipo': 'indexar', 'dia': 'atual', 'chave': 1, 'textos': TEXTOS}
+    buscar = lambda seq, busca, chave=1: {'tipo': 'buscar', 'dia': 'atual', 'chave': chave, 'busca': busca, 'seq': seq}
+    respostas = _conversa(worker, [
+        indexar,
+        buscar(1, 'clinica'),        # sem acento casa com acento
+        buscar(2, 'PLANT'),          # prefixo, sem caixa
+        buscar(3, 'ana plantao'),    # toda palavra precisa casar
+        buscar(4, 'xyz'),
+        buscar(5, '  --  '),         # sem palavras: todos
+        buscar(6, 'ana', chave=2),   # índice de outra versão do dia
+    ], tmp_path)
+    assert respostas == [
+        {'seq': 1, 'valido': True, 'ids': [0]},
+        {'seq': 2, 'valido': True, 'ids': [0, 2]},
+        {'seq': 3, 'valido': True, 'ids': [2]},
+        {'seq': 4, 'valido': True, 'ids': []},
+        {'seq': 5, 'valido': True, 'ids': None},
+        {'seq': 6, 'valido': False, 'ids': None},
+    ]
+
+
+def test_worker_na_casca_do_service_worker():
+    assert WORKER_BUSCA in SHELL
@@ -9,12 +9,33 @@ Workflow simplificado:
 - extracao_inteligente.py → /tmp/extracao_inteligente.json
 - gerar_dashboard_executivo.py → busca os dados e gera o dashboard
   (Prioriza extracao_inteligente.json, fallback para escalas_multiplos_dias.json)
+
+--assets é repassado ao gerador (dados em escala.json + assets/*.json), assim
+como --producao (página minificada e orçamento de tamanho).
 """
 
+import json
 import subprocess
 import sys
 from pathlib import Path
 
+from assinatura_escala import OPCOES_BUILD, assinatura, ler_assinatura_salva, salvar_assinatura
+
+EXTRACAO_JSON = "/tmp/extracao_inteligente.json"
+# Marcador lido pelo workflow: escala igual à última geração, nada a
+# regenerar, salvar no histórico nem commitar.
+MARCADOR_INALTERADA = Path("/tmp/escala_inalterada")
+
+
+def calcular_assinatura():
+    """Assinatura do JSON recém-extraído, ou None se ele não puder ser lido."""
+    try:
+        with open(EXTRACAO_JSON, 'r', encoding='utf-8') as f:
+            return assinatura(json.load(f), opcoes=sys.argv[1:])
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Não foi possível calcular a assinatura da escala: {e}")
+        return None
+
 def run_extraction():
     """Tenta executar a extração de dados da escala.med.br"""
     print("\n📋 Tentando extrair dados de escala.med.br...")
@@ -42,7 +63,11 @@ def generate_dashboard():
     """Executa a geração do dashboard"""
     print(f"\n📋 Gerando dashboard...")
     try:
-        result = subprocess.run("python3 gerar_dashboard_executivo.py",
+        comando = "python3 gerar_dashboard_executivo.py"
+        for opcao in OPCOES_BUILD:
+            if opcao in sys.argv:
+                comando += f" {opcao}"
+        result = subprocess.run(comando,
                               shell=True,
                               check=True,
                               timeout=60)
@@ -61,9 +86,21 @@ def generate_dashboard():
 def main():
     print("🚀 Iniciando atualização da escala e dashboard...")
 
+    MARCADOR_INALTERADA.unlink(missing_ok=True)
+
     # Passo 1: Tentar extração de dados frescos
     extraction_ok = run_extraction()
 
+    # Passo 1b: Nada mudou desde a última geração? Então não há o que fazer.
+    # (Só com extração bem-sucedida: se ela falhou, o gerador usa o fallback.)
+    nova_assinatura = calcular_assinatura() if extraction_ok else None
+    if nova_assinatura and '--forcar' not in sys.argv:
+        if nova_assinatura == ler_assinatura_salva():
+            print(f"\n⏭️  Escala inalterada desde a última geração ({nova_assinatura[:12]}); "
+                  f"dashboard não será regenerado (use --forcar para gerar mesmo assim)")
+            MARCADOR_INALTERADA.touch()
+            return 0
+
     # Passo 2: Gerar dashboard
     # (gerar_dashboard_executivo.py buscará os dados automaticamente)
     if not generate_dashboard():
@@ -79,6 +116,10 @@ def main():
 
     print(f"✅ Dashboard encontrado: {dashboard_file}")
 
+    if nova_assinatura:
+        salvar_assinatura(nova_assinatura)
+        print(f"🔏 Assinatura da escala registrada: {nova_assinatura[:12]}")
+
     # Status final
     if extraction_ok:
         print("\n✅ Atualização completa com dados FRESCOS da escala!")
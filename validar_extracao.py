@@ -12,6 +12,10 @@ Regras:
 3. Se houver baseline (cache do dia anterior), a queda em relação a ela
    não pode passar de QUEDA_MAXIMA_PCT.
 4. A data de 'atual' precisa ser a de hoje (fuso de Brasília).
+5. Comparado ao último snapshot de data/historico/ que tenha o MESMO dia, no
+   máximo ROTATIVIDADE_MAXIMA_PCT dos registros podem ter saído ou trocado de
+   profissional (diff_escala.py). Troca em massa no mesmo dia = extração
+   embaralhada (ex: setores deslocados), não mudança real de escala.
 
 Exit code 0 = ok para publicar; 1 = NÃO publicar (workflow falha e alerta).
 """
@@ -21,12 +25,16 @@ import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from diff_escala import diff_registros, snapshot_anterior, taxa_rotatividade
+
 BASE_DIR = Path(__file__).parent
 EXTRACAO = Path('/tmp/extracao_inteligente.json')
 BASELINE = BASE_DIR / 'data' / 'extracao_inteligente_anterior_cache.json'
+HISTORICO = BASE_DIR / 'data' / 'historico'
 
 MINIMO_ABSOLUTO = 10      # menos que isso nunca é uma escala real do HRO
 QUEDA_MAXIMA_PCT = 40     # queda > 40% vs baseline = suspeito
+ROTATIVIDADE_MAXIMA_PCT = 50  # > 50% dos registros do mesmo dia mudaram = suspeito
 
 BRT = timezone(timedelta(hours=-3))
 
@@ -80,6 +88,23 @@ def main():
     else:
         avisos.append("Sem baseline para comparar (primeira execução?).")
 
+    # Regra 5: rotatividade vs último snapshot do mesmo dia
+    data_simples = ((dados.get('atual') or {}).get('data_simples') or '').strip()
+    if total and data_simples:
+        caminho, bloco = snapshot_anterior(data_simples, HISTORICO)
+        base_total = len(bloco['registros']) if bloco else 0
+        if base_total >= MINIMO_ABSOLUTO:
+            diff = diff_registros(bloco['registros'], dados['atual']['registros'])
+            taxa = taxa_rotatividade(diff, base_total) * 100
+            print(f"📊 Mudanças vs {caminho.name}: {len(diff['trocas'])} troca(s), "
+                  f"{len(diff['adicionados'])} adição(ões), {len(diff['removidos'])} remoção(ões) "
+                  f"(rotatividade: {taxa:.0f}%)")
+            if taxa > ROTATIVIDADE_MAXIMA_PCT:
+                erros.append(
+                    f"{taxa:.0f}% dos registros de {data_simples} mudaram desde {caminho.name} "
+                    f"(limite: {ROTATIVIDADE_MAXIMA_PCT}%). Possível extração embaralhada."
+                )
+
     # Regra 4: data de 'atual' deve ser hoje (BRT)
     hoje = datetime.now(BRT).strftime('%d/%m/%Y')
     data_atual = ((dados.get('atual') or {}).get('data_simples') or '').strip()